@@ -15,6 +15,8 @@ from pathlib import Path
 from decouple import config
 import os
 
+from utils.hashers import hasher_profile
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = config('SECRET_KEY', default='your-secret-key-change-in-production')
@@ -54,6 +56,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'users.middleware.RoleProfileMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -91,6 +94,11 @@ DATABASES = {
 }
 
 # Password validation
+# Password hashing (see utils/hashers.py): pbkdf2 | scrypt | argon2
+PASSWORD_HASHER_PROFILE = config('PASSWORD_HASHER_PROFILE', default='pbkdf2')
+PASSWORD_PBKDF2_ITERATIONS = config('PASSWORD_PBKDF2_ITERATIONS', default=600000, cast=int)
+PASSWORD_HASHERS = hasher_profile(PASSWORD_HASHER_PROFILE)
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -112,6 +120,9 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Directory holding the CSV exports read by `manage.py load_academia_data`
+ACADEMIA_DATA_PATH = config('ACADEMIA_DATA_PATH', default=str(BASE_DIR.parent / 'data'))
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -121,7 +132,8 @@ AUTH_USER_MODEL = 'users.User'
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # Builds request.user from token claims; StrictJWTAuthentication loads the live row
+        'users.authentication.StatelessJWTAuthentication',
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
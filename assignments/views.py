@@ -1,4 +1,4 @@
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
@@ -16,6 +16,8 @@ from .serializers import (
 from students.models import Student
 from faculty.models import Faculty, FacultyAssignment
 from notifications.models import Notification
+from users.authentication import StrictJWTAuthentication
+from users.profiles import get_role_profile
 
 
 # ==================== STUDENT ENDPOINTS ====================
@@ -28,7 +30,7 @@ def student_assignments(request):
     Returns assignments for courses the student is taking
     """
     try:
-        student = Student.objects.get(email=request.user.email)
+        student = get_role_profile(request, Student)
         
         # Get all assignments for this student
         assignments = Assignment.objects.filter(student=student).order_by('-created_at')
@@ -56,7 +58,7 @@ def student_assignment_cards(request):
     Does NOT auto-create empty assignment records
     """
     try:
-        student = Student.objects.get(email=request.user.email)
+        student = get_role_profile(request, Student)
         
         # Get all courses this student should submit assignments for
         # (based on faculty course assignments for their year/branch/section)
@@ -117,7 +119,7 @@ def student_assignment_detail(request, assignment_id):
     Get detailed information about a specific assignment
     """
     try:
-        student = Student.objects.get(email=request.user.email)
+        student = get_role_profile(request, Student)
         assignment = get_object_or_404(
             Assignment, 
             assignment_id=assignment_id, 
@@ -141,7 +143,7 @@ def student_create_assignment(request, faculty_id, course_id):
     Used when student clicks upload for a course they haven't submitted to yet
     """
     try:
-        student = Student.objects.get(email=request.user.email)
+        student = get_role_profile(request, Student)
         faculty = Faculty.objects.get(faculty_id=faculty_id)
         
         # Verify this is a valid course for this student
@@ -208,7 +210,7 @@ def student_upload_assignment(request, assignment_id):
     Creates assignment record if it doesn't exist yet
     """
     try:
-        student = Student.objects.get(email=request.user.email)
+        student = get_role_profile(request, Student)
         
         # Try to get existing assignment, or return error if it doesn't exist
         try:
@@ -253,7 +255,7 @@ def download_student_assignment(request, assignment_id):
     Download assignment PDF
     """
     try:
-        student = Student.objects.get(email=request.user.email)
+        student = get_role_profile(request, Student)
         assignment = get_object_or_404(
             Assignment, 
             assignment_id=assignment_id, 
@@ -288,7 +290,7 @@ def faculty_assignments_overview(request):
     Returns statistics: total, pending grading, graded
     """
     try:
-        faculty = Faculty.objects.get(email=request.user.email)
+        faculty = get_role_profile(request, Faculty)
         
         assignments = Assignment.objects.filter(faculty=faculty)
         total = assignments.count()
@@ -316,7 +318,7 @@ def faculty_pending_assignments(request):
     Get pending assignments for faculty (not graded yet)
     """
     try:
-        faculty = Faculty.objects.get(email=request.user.email)
+        faculty = get_role_profile(request, Faculty)
         
         assignments = Assignment.objects.filter(
             faculty=faculty,
@@ -340,7 +342,7 @@ def faculty_graded_assignments(request):
     Get graded assignments for faculty
     """
     try:
-        faculty = Faculty.objects.get(email=request.user.email)
+        faculty = get_role_profile(request, Faculty)
         
         assignments = Assignment.objects.filter(
             faculty=faculty,
@@ -357,6 +359,7 @@ def faculty_graded_assignments(request):
 
 
 @api_view(['PATCH'])
+@authentication_classes([StrictJWTAuthentication])
 @permission_classes([IsAuthenticated])
 def faculty_grade_assignment(request, assignment_id):
     """
@@ -364,7 +367,7 @@ def faculty_grade_assignment(request, assignment_id):
     Creates notification for student
     """
     try:
-        faculty = Faculty.objects.get(email=request.user.email)
+        faculty = get_role_profile(request, Faculty)
         assignment = get_object_or_404(
             Assignment, 
             assignment_id=assignment_id, 
@@ -414,7 +417,7 @@ def faculty_assignment_detail(request, assignment_id):
     Get detailed information about assignment for faculty
     """
     try:
-        faculty = Faculty.objects.get(faculty_id=request.user.user_id)
+        faculty = get_role_profile(request, Faculty)
         assignment = get_object_or_404(
             Assignment, 
             assignment_id=assignment_id, 
@@ -437,7 +440,7 @@ def download_faculty_assignment(request, assignment_id):
     Download assignment PDF for faculty
     """
     try:
-        faculty = Faculty.objects.get(faculty_id=request.user.user_id)
+        faculty = get_role_profile(request, Faculty)
         assignment = get_object_or_404(
             Assignment, 
             assignment_id=assignment_id, 
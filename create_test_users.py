@@ -9,6 +9,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'academia.settings')
 django.setup()
 
 from users.models import User
+from utils.password_utils import hash_passwords
 
 # Test user data
 test_users = [
@@ -46,25 +47,26 @@ test_users = [
     },
 ]
 
-for user_data in test_users:
-    email = user_data['email']
-    
-    # Check if user exists
-    if User.objects.filter(email=email).exists():
-        print(f"✓ User {email} already exists")
-        continue
-    
-    # Create new user
-    user = User(
-        email=email,
+existing_emails = set(
+    User.objects.filter(email__in=[u['email'] for u in test_users]).values_list('email', flat=True)
+)
+new_users = [u for u in test_users if u['email'] not in existing_emails]
+for email in sorted(existing_emails):
+    print(f"✓ User {email} already exists")
+
+# Hash all new passwords in one batch (parallel for large lists)
+hashed = hash_passwords([u['password'] for u in new_users])
+
+for user_data, password in zip(new_users, hashed):
+    User.objects.create(
+        email=user_data['email'],
         role=user_data['role'],
         first_name=user_data['first_name'],
         last_name=user_data['last_name'],
-        username=user_data['username']
+        username=user_data['username'],
+        password=password
     )
-    user.set_password(user_data['password'])
-    user.save()
-    print(f"✓ Created user: {email} (Role: {user_data['role']})")
+    print(f"✓ Created user: {user_data['email']} (Role: {user_data['role']})")
 
 print("\n✓ All test users created successfully!")
 print("\nDemo Credentials:")
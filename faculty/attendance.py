@@ -0,0 +1,80 @@
+"""
+Class Session Attendance
+Marks one class (bit `class_index - 1` of the attendance bitmaps, see
+students/attendance_bits.py) for a whole section with one UPDATE: the held
+bit is set, the present bit is set or cleared per student, and the stored
+counters are adjusted from the bits' previous values in the same statement.
+
+Re-marking a session computes the same result (safe to retry), and each row
+is rewritten from its current value under the row lock, so concurrent
+sessions on the same section never overwrite each other's bits.
+"""
+from django.db import transaction
+from django.db.models import Case, F, Max, Value, When
+from django.db.models.functions import Greatest
+
+from students.attendance_bits import MAX_CLASSES
+from students.models import Student, StudentAttendance
+from students.performance import refresh_summaries
+
+
+def session_semester(year_id, branch_id, section_id, course_id):
+    """Latest semester with attendance rows for the section's course, or None"""
+    return StudentAttendance.objects.filter(
+        year_id=year_id, branch_id=branch_id, section_id=section_id, course_id=course_id,
+    ).aggregate(semester=Max('semester_id'))['semester']
+
+
+def mark_session(year_id, branch_id, section_id, semester_id, course_id, class_index, absent_ids):
+    """
+    Record class `class_index` (1-based) for every student of the section.
+
+    Students without an attendance row for the course get one first (a single
+    INSERT ... ON CONFLICT DO NOTHING), then one UPDATE marks everybody.
+
+    Returns:
+        dict: students marked, and how many present / absent
+
+    Raises:
+        ValueError: class_index out of range, or absent ids outside the section
+    """
+    if not 1 <= class_index <= MAX_CLASSES:
+        raise ValueError(f'class_index must be between 1 and {MAX_CLASSES}')
+    student_ids = list(
+        Student.objects.filter(year_id=year_id, branch_id=branch_id, sec_id=section_id)
+        .values_list('student_id', flat=True)
+    )
+    absent = set(absent_ids)
+    unknown = absent.difference(student_ids)
+    if unknown:
+        raise ValueError(f'Not in this section: {sorted(unknown)}')
+
+    shift = class_index - 1
+    bit = 1 << shift
+    was_held = F('held_mask').bitrightshift(shift).bitand(1)
+    was_present = F('present_mask').bitrightshift(shift).bitand(1)
+    now_present = Case(When(student_id__in=absent, then=Value(0)), default=Value(1))
+
+    with transaction.atomic():
+        StudentAttendance.objects.bulk_create(
+            [
+                StudentAttendance(
+                    student_id=student_id, year_id=year_id, branch_id=branch_id, section_id=section_id,
+                    semester_id=semester_id, course_id=course_id,
+                )
+                for student_id in student_ids
+            ],
+            ignore_conflicts=True,
+        )
+        marked = StudentAttendance.objects.filter(
+            student_id__in=student_ids, semester_id=semester_id, course_id=course_id,
+        ).update(
+            held_mask=F('held_mask').bitor(bit),
+            present_mask=F('present_mask').bitand(~bit).bitor(now_present * bit),
+            record_length=Greatest(F('record_length'), Value(class_index)),
+            total_classes=F('total_classes') - was_held + 1,
+            present_count=F('present_count') - was_present + now_present,
+            absent_count=F('absent_count') - (was_held - was_present) + (1 - now_present),
+        )
+    refresh_summaries(student_ids)
+    return {'marked': marked, 'present': marked - len(absent), 'absent': len(absent)}
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import Exists, OuterRef
+from students.models import Student
 from django.contrib.auth.hashers import check_password, make_password
 
 class Faculty(models.Model):
@@ -41,6 +43,22 @@ class Faculty(models.Model):
             return False
         return check_password(str(raw_passcode), self.passcode)
 
+    def roster(self):
+        """
+        Students in the exact (year, branch, section) classes this faculty teaches.
+
+        Matches whole tuples with a correlated EXISTS on FacultyAssignment (no
+        cross product of years x branches x sections), served by the
+        Student (year_id, branch_id, sec_id) index. No assignments -> no students.
+        """
+        return Student.objects.filter(Exists(
+            self.assignments.filter(
+                year_id=OuterRef('year_id'),
+                branch_id=OuterRef('branch_id'),
+                section_id=OuterRef('sec_id'),
+            )
+        ))
+
 class FacultyAssignment(models.Model):
     faculty = models.ForeignKey(Faculty, on_delete=models.CASCADE, related_name='assignments')
     year_id = models.IntegerField()
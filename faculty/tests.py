@@ -0,0 +1,176 @@
+import json
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from students.attendance_matrix import GENERATION
+from students.models import Student, StudentAttendance, StudentBacklog, StudentExamData
+from users.models import User
+from users.profiles import profile_cache
+from utils.generations import bump_generation, forget_generations
+from .models import Faculty, FacultyAssignment
+
+
+@override_settings(GENERATION_RECHECK_SECONDS=60)
+class FacultyStudentsTestCase(TestCase):
+    def setUp(self):
+        profile_cache.clear()
+        forget_generations()
+        self.faculty = Faculty.objects.create(
+            faculty_id=1001, first_name='Ada', last_name='Lovelace', email='ada@college.edu', passcode='x',
+            gender='Female', department='CSE', designation='Professor', qualifications='PhD',
+        )
+        FacultyAssignment.objects.create(faculty=self.faculty, year_id=1, branch_id=1, section_id=1, course_id='CS101')
+        self.user = User.objects.create(email='ada@college.edu', username='ada', role='faculty', user_id=1001)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _add_students(self, count, start=1):
+        for student_id in range(start, start + count):
+            student = Student.objects.create(
+                student_id=student_id, first_name='S', last_name=str(student_id), email=f's{student_id}@college.edu',
+                gender='Male', year_id=1, branch_id=1, sec_id=1, roll_no=student_id, phone_no='99', passcode='x',
+            )
+            for mid_id in range(1, student_id % 3 + 1):
+                StudentExamData.objects.create(
+                    student=student, year_id=1, branch_id=1, section_id=1, semester_id=1, mid_id=mid_id,
+                    course_id='CS101', mid_marks=10 + student_id % 11, quiz_marks=3, assignment_marks=student_id % 6,
+                )
+            if student_id % 2:
+                StudentBacklog.objects.create(student=student, semester_id=1, course_id='CS101')
+
+    def _get(self):
+        response = self.client.get('/api/faculty/students/')
+        self.assertEqual(response.status_code, 200)
+        return json.loads(b''.join(response.streaming_content))
+
+    def test_matches_per_student_computation(self):
+        """Annotated values equal the original per-student backlog count and exam CGPA"""
+        self._add_students(7)
+        data = self._get()
+
+        self.assertEqual([row['id'] for row in data], list(range(1, 8)))
+        for row in data:
+            exams = StudentExamData.objects.filter(student_id=row['id'])
+            cgpa = 0.0
+            if exams.exists():
+                total = sum(e.mid_marks + e.quiz_marks + e.assignment_marks for e in exams)
+                cgpa = round((total / (exams.count() * 30)) * 10, 2)
+            self.assertEqual(row['cgpa'], cgpa)
+            self.assertEqual(row['backlogs'], StudentBacklog.objects.filter(student_id=row['id']).count())
+
+    def test_query_count_is_constant(self):
+        """The roster costs the same number of queries for 2 students as for 20"""
+        self._add_students(2)
+        with self.assertNumQueries(3):  # profile generation + faculty profile + roster
+            self.assertEqual(len(self._get()), 2)
+
+        self._add_students(18, start=3)
+        with self.assertNumQueries(1):  # profile now served from the role-profile cache
+            self.assertEqual(len(self._get()), 20)
+
+    def test_roster_matches_exact_sections(self):
+        """Only students of assigned (year, branch, section) tuples are returned, not the cross product"""
+        FacultyAssignment.objects.create(faculty=self.faculty, year_id=2, branch_id=2, section_id=2, course_id='CS201')
+        for student_id, (year, branch, section) in enumerate([(1, 1, 1), (2, 2, 2), (1, 2, 1), (2, 1, 2)], start=1):
+            Student.objects.create(
+                student_id=student_id, first_name='S', last_name=str(student_id), email=f's{student_id}@college.edu',
+                gender='Male', year_id=year, branch_id=branch, sec_id=section, roll_no=student_id, phone_no='',
+                passcode='x',
+            )
+        self.assertEqual([row['id'] for row in self._get()], [1, 2])
+
+    def test_no_assignments_returns_no_students(self):
+        self._add_students(3)
+        self.faculty.assignments.all().delete()
+        self.assertEqual(self._get(), [])
+
+
+@override_settings(GENERATION_RECHECK_SECONDS=60)
+class AttendanceSessionTestCase(TestCase):
+    def setUp(self):
+        profile_cache.clear()
+        cache.clear()
+        forget_generations()
+        faculty = Faculty.objects.create(
+            faculty_id=1001, first_name='Ada', last_name='Lovelace', email='ada@college.edu', passcode='x',
+            gender='Female', department='CSE', designation='Professor', qualifications='PhD',
+        )
+        FacultyAssignment.objects.create(faculty=faculty, year_id=1, branch_id=1, section_id=1, course_id='CS101')
+        for student_id in (1, 2, 3):
+            Student.objects.create(
+                student_id=student_id, first_name='S', last_name=str(student_id), email=f's{student_id}@college.edu',
+                gender='Male', year_id=1, branch_id=1, sec_id=1, roll_no=student_id, phone_no='99', passcode='x',
+            )
+        StudentAttendance.objects.create(
+            student_id=1, year_id=1, branch_id=1, section_id=1, semester_id=1, course_id='CS101', class_records=[1, 0],
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(email='ada@college.edu', username='ada', role='faculty', user_id=1001))
+
+    def _mark(self, class_index, absent, **extra):
+        return self.client.post('/api/faculty/attendance/session/', {
+            'year': 1, 'branch': 1, 'section': 1, 'course': 'CS101',
+            'class_index': class_index, 'absent': absent, **extra,
+        }, format='json')
+
+    def _state(self):
+        return {
+            row.student_id: (row.class_records, row.total_classes, row.present_count, row.absent_count)
+            for row in StudentAttendance.objects.all()
+        }
+
+    def test_marks_whole_section_idempotently(self):
+        response = self._mark(2, [3])
+        self.assertEqual(response.json(), {'marked': 3, 'present': 2, 'absent': 1, 'semester': 1, 'class_index': 2})
+        expected = {
+            1: ([1, 1], 2, 2, 0),
+            2: ([None, 1], 1, 1, 0),
+            3: ([None, 0], 1, 0, 1),
+        }
+        self.assertEqual(self._state(), expected)
+        self._mark(2, [3])  # retry
+        self.assertEqual(self._state(), expected)
+
+        self._mark(2, [1])  # correction flips counters, never double counts
+        self.assertEqual(self._state()[1], ([1, 0], 2, 1, 1))
+        self.assertEqual(self._state()[3], ([None, 1], 1, 1, 0))
+
+    def test_rejects_foreign_section_and_students(self):
+        self.assertEqual(self._mark(1, [], section=2).status_code, 403)
+        self.assertEqual(self._mark(1, [99]).status_code, 400)
+        self.assertEqual(self._mark(64, []).status_code, 400)
+        # A string would otherwise be iterated digit by digit ("12" -> students 1 and 2)
+        before = self._state()
+        self.assertEqual(self._mark(1, '12').status_code, 400)
+        self.assertEqual(self._state(), before)
+
+    def test_section_report(self):
+        self._mark(2, [3])
+        self._mark(3, [2, 3])
+        params = {'year': 1, 'branch': 1, 'section': 1, 'course': 'CS101', 'semester': 1}
+        report = self.client.get('/api/faculty/attendance/section/', params).json()
+        self.assertEqual(
+            [(s['student_id'], s['total_classes'], s['present'], s['percentage'],
+              s['longest_absence_streak'], s['current_absence_streak']) for s in report['students']],
+            [(1, 3, 3, 100.0, 0, 0), (2, 2, 1, 50.0, 1, 1), (3, 2, 0, 0.0, 2, 2)],
+        )
+        self.assertEqual(
+            [(c['class_index'], c['marked'], c['turnout']) for c in report['classes']],
+            [(1, 1, 100.0), (2, 3, 66.67), (3, 3, 33.33)],
+        )
+        self.assertEqual((report['below_75'], report['below_65']), ([2, 3], [2, 3]))
+        self.assertEqual(report['section_percentage'], 57.14)
+
+        with self.assertNumQueries(1):  # assignment check; generation and report are remembered in-process
+            self.client.get('/api/faculty/attendance/section/', params)
+        self._mark(3, [])
+        report = self.client.get('/api/faculty/attendance/section/', params).json()
+        self.assertEqual(report['below_65'], [3])
+
+        # A write in another process only reaches this one through the stored generation
+        StudentAttendance.objects.filter(student_id=3).update(held_mask=0, present_mask=0)
+        bump_generation(GENERATION)
+        report = self.client.get('/api/faculty/attendance/section/', params).json()
+        self.assertEqual(report['below_65'], [])
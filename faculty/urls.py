@@ -5,4 +5,6 @@ urlpatterns = [
     path('profile/', views.faculty_profile, name='faculty_profile'),
     path('assignments/', views.faculty_assignments, name='faculty_assignments'),
     path('students/', views.faculty_students, name='faculty_students'),
+    path('attendance/session/', views.mark_attendance_session, name='mark_attendance_session'),
+    path('attendance/section/', views.section_attendance, name='section_attendance'),
 ]
@@ -2,18 +2,24 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from .attendance import mark_session, session_semester
+from students.attendance_matrix import section_report
 from .models import Faculty, FacultyAssignment
-from students.models import Student, StudentBacklog, StudentExamData
+from students.performance import summary_or_default
+from utils.streaming import stream_json_list
+from users.profiles import get_role_profile
 import logging
 
 logger = logging.getLogger(__name__)
 
+ROSTER_CHUNK_SIZE = 2000
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def faculty_profile(request):
     """Get faculty profile"""
     try:
-        faculty = Faculty.objects.get(email=request.user.email)
+        faculty = get_role_profile(request, Faculty)
         data = {
             'faculty_id': faculty.faculty_id,
             'first_name': faculty.first_name,
@@ -32,7 +38,7 @@ def faculty_profile(request):
 def faculty_assignments(request):
     """Get faculty course assignments"""
     try:
-        faculty = Faculty.objects.get(email=request.user.email)
+        faculty = get_role_profile(request, Faculty)
         assignments = FacultyAssignment.objects.filter(faculty=faculty)
         data = [{
             'year_id': a.year_id,
@@ -50,10 +56,7 @@ def faculty_students(request):
     """Get students that faculty is teaching (from their assignments)"""
     try:
         logger.info(f"✓ Fetching students for faculty with email: {request.user.email}")
-        faculty = Faculty.objects.get(email=request.user.email)
-        
-        # Get faculty's assignments
-        assignments = FacultyAssignment.objects.filter(faculty=faculty).distinct()
+        faculty = get_role_profile(request, Faculty)
         
         # Build query filters from optional request parameters
         filters = {}
@@ -73,53 +76,144 @@ def faculty_students(request):
             except ValueError:
                 pass
         
-        # Get unique year, branch, section combinations from assignments
-        if assignments.exists():
-            query = Student.objects.filter(
-                year_id__in=assignments.values_list('year_id', flat=True),
-                branch_id__in=assignments.values_list('branch_id', flat=True),
-                sec_id__in=assignments.values_list('section_id', flat=True)
-            )
-        else:
-            # Fallback: return all students if faculty has no assignments (for testing)
-            logger.warning(f"⚠ Faculty {faculty.faculty_id} has no assignments, returning all students")
-            query = Student.objects.all()
+        # Students of the exact classes in the faculty's assignments
+        query = faculty.roster()
         
         # Apply additional filters if provided
         if filters:
             query = query.filter(**filters)
         
-        students_list = []
-        for student in query.order_by('student_id'):
-            # Get backlogs count
-            backlogs = StudentBacklog.objects.filter(student=student).count()
-            
-            # Calculate CGPA from exam data
-            exam_data = StudentExamData.objects.filter(student=student)
-            cgpa = 0.0
-            if exam_data.exists():
-                total_marks = sum([e.mid_marks + e.quiz_marks + e.assignment_marks for e in exam_data])
-                cgpa = (total_marks / (exam_data.count() * 30)) * 10 if exam_data.count() > 0 else 0.0
-                cgpa = round(cgpa, 2)
-            
-            students_list.append({
-                'id': student.student_id,
-                'name': f"{student.first_name} {student.last_name}",
-                'email': student.email,
-                'roll_no': student.roll_no,
-                'year_id': student.year_id,
-                'branch_id': student.branch_id,
-                'section_id': student.sec_id,
-                'phone_no': student.phone_no,
-                'cgpa': cgpa,
-                'backlogs': backlogs,
-            })
-        
-        logger.info(f"✓ Retrieved {len(students_list)} students for faculty {faculty.faculty_id}")
-        return Response(students_list, status=status.HTTP_200_OK)
+        # CGPA and backlog count come from the precomputed performance summary
+        # (LEFT JOIN), so the whole roster is one SELECT streamed to the client
+        rows = query.order_by('student_id').values(
+            'student_id', 'first_name', 'last_name', 'email', 'roll_no', 'year_id', 'branch_id', 'sec_id',
+            'phone_no', 'performance__cgpa', 'performance__backlog_count',
+        )
+
+        def serialize():
+            for student in rows.iterator(chunk_size=ROSTER_CHUNK_SIZE):
+                yield {
+                    'id': student['student_id'],
+                    'name': f"{student['first_name']} {student['last_name']}",
+                    'email': student['email'],
+                    'roll_no': student['roll_no'],
+                    'year_id': student['year_id'],
+                    'branch_id': student['branch_id'],
+                    'section_id': student['sec_id'],
+                    'phone_no': student['phone_no'],
+                    'cgpa': summary_or_default(student, 'cgpa'),
+                    'backlogs': summary_or_default(student, 'backlog_count'),
+                }
+
+        def done(count):
+            logger.info(f"✓ Retrieved {count} students for faculty {faculty.faculty_id}")
+
+        return stream_json_list(serialize(), on_complete=done)
     except Faculty.DoesNotExist:
         logger.error(f"✗ Faculty not found for email: {request.user.email}")
         return Response({'error': 'Faculty not found'}, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
         logger.error(f"✗ Error fetching faculty students: {str(e)}")
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def mark_attendance_session(request):
+    """
+    Record one class session for a section the faculty teaches.
+
+    Body: {year, branch, section, course, class_index, absent: [student ids], semester (optional)}
+    Everyone in the section not listed in `absent` is marked present. Without
+    `semester`, the latest semester holding attendance for the course is used.
+    """
+    try:
+        faculty = get_role_profile(request, Faculty)
+    except Faculty.DoesNotExist:
+        return Response({'error': 'Faculty not found'}, status=status.HTTP_404_NOT_FOUND)
+    
+    try:
+        year, branch, section, class_index = (
+            int(request.data[key]) for key in ('year', 'branch', 'section', 'class_index')
+        )
+        course = str(request.data['course'])
+        absent = request.data.get('absent', [])
+        if not isinstance(absent, list):
+            return Response({'error': 'absent must be a list of student ids'}, status=status.HTTP_400_BAD_REQUEST)
+        absent = [int(student_id) for student_id in absent]
+        semester = request.data.get('semester')
+        semester = int(semester) if semester not in (None, '') else None
+    except KeyError as e:
+        return Response({'error': f'Missing field: {e.args[0]}'}, status=status.HTTP_400_BAD_REQUEST)
+    except (TypeError, ValueError):
+        return Response({'error': 'year, branch, section, class_index, semester and absent ids must be integers'},
+                        status=status.HTTP_400_BAD_REQUEST)
+    
+    if not FacultyAssignment.objects.filter(
+            faculty=faculty, year_id=year, branch_id=branch, section_id=section, course_id=course).exists():
+        return Response({'error': 'You are not assigned to this section and course'}, status=status.HTTP_403_FORBIDDEN)
+    
+    if semester is None:
+        semester = session_semester(year, branch, section, course)
+        if semester is None:
+            return Response({'error': 'semester is required for a course with no attendance yet'},
+                            status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        result = mark_session(year, branch, section, semester, course, class_index, absent)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    logger.info(f"✓ Faculty {faculty.faculty_id} marked class {class_index} of {course} "
+                f"(year={year}, branch={branch}, section={section}): {result}")
+    return Response({**result, 'semester': semester, 'class_index': class_index}, status=status.HTTP_200_OK)
+
+
+def section_attendance_params(params):
+    """
+    (year, branch, section, course, semester) from the query string of the
+    section attendance views; semester may be omitted (latest with attendance).
+
+    Raises:
+        ValueError: missing or non-integer parameters
+    """
+    try:
+        year, branch, section = (int(params[key]) for key in ('year', 'branch', 'section'))
+        course = params['course']
+        semester = int(params['semester']) if params.get('semester') else None
+    except KeyError as e:
+        raise ValueError(f'Missing parameter: {e.args[0]}')
+    except ValueError:
+        raise ValueError('year, branch, section and semester must be integers')
+    return year, branch, section, course, semester
+
+
+def section_attendance_response(year, branch, section, course, semester):
+    """The cached students x classes report, shared with management.views"""
+    if semester is None:
+        semester = session_semester(year, branch, section, course)
+        if semester is None:
+            return Response({'error': 'No attendance recorded for this section and course'},
+                            status=status.HTTP_404_NOT_FOUND)
+    return Response(section_report(year, branch, section, semester, course), status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def section_attendance(request):
+    """
+    Attendance matrix analytics for a section the faculty teaches:
+    ?year=&branch=&section=&course=[&semester=]
+    """
+    try:
+        faculty = get_role_profile(request, Faculty)
+    except Faculty.DoesNotExist:
+        return Response({'error': 'Faculty not found'}, status=status.HTTP_404_NOT_FOUND)
+    try:
+        year, branch, section, course, semester = section_attendance_params(request.query_params)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    if not FacultyAssignment.objects.filter(
+            faculty=faculty, year_id=year, branch_id=branch, section_id=section, course_id=course).exists():
+        return Response({'error': 'You are not assigned to this section and course'}, status=status.HTTP_403_FORBIDDEN)
+    return section_attendance_response(year, branch, section, course, semester)
@@ -11,4 +11,6 @@ urlpatterns = [
     path('fees/stats/', views.get_fee_stats, name='management_fees_stats'),
     path('fees/details/', views.get_student_fee_details, name='management_fees_details'),
     path('notifications/recent/', views.recent_notifications, name='management_notifications_recent'),
+    path('attendance/section/', views.section_attendance, name='management_section_attendance'),
+    path('attendance/shortfall/', views.attendance_shortfall, name='management_attendance_shortfall'),
 ]
@@ -6,31 +6,28 @@ from .models import ManagementEmployee
 from students.models import Student
 from students.models import StudentFee
 from faculty.models import Faculty
+from faculty.views import section_attendance_params, section_attendance_response
 from notifications.models import Notification
-from django.db.models import Sum
+from students.shortfall import SNAPSHOT_FIELDS, filter_snapshot
+from users.profiles import get_role_profile
+from utils.pagination import keyset_page
+from utils.streaming import stream_csv
+from django.db.models import Count, Max, Sum
 import logging
 
 logger = logging.getLogger(__name__)
 
+SHORTFALL_PAGE_SIZE = 100
+SHORTFALL_MAX_PAGE_SIZE = 1000
+STREAM_CHUNK_SIZE = 2000
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def management_profile(request):
     """Get management employee profile"""
-    emp = None
     try:
-        emp = ManagementEmployee.objects.get(email=request.user.email)
-        logger.info(f"✓ Management Profile: Found employee by email: {request.user.email}")
+        emp = get_role_profile(request, ManagementEmployee)
     except ManagementEmployee.DoesNotExist:
-        logger.warning(f"⚠ Management Profile: No employee with email '{request.user.email}'")
-        uid = getattr(request.user, 'user_id', None)
-        if uid:
-            try:
-                emp = ManagementEmployee.objects.get(emp_id=uid)
-                logger.info(f"✓ Management Profile: Found employee by emp_id: {uid}")
-            except ManagementEmployee.DoesNotExist:
-                logger.error(f"✗ Management Profile: No employee with emp_id {uid}")
-
-    if not emp:
         error_msg = f"Employee not found for user {request.user.email} (user_id: {getattr(request.user, 'user_id', 'None')})"
         logger.error(f"✗ {error_msg}")
         return Response({'error': error_msg}, status=status.HTTP_404_NOT_FOUND)
@@ -280,3 +277,79 @@ def get_student_fee_details(request):
     except Exception as e:
         logger.error(f"✗ Error fetching student fee details: {str(e)}", exc_info=True)
         return Response({'error': f'Error fetching student fee details: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def section_attendance(request):
+    """
+    Attendance matrix analytics for any section:
+    ?year=&branch=&section=&course=[&semester=]
+    """
+    try:
+        get_role_profile(request, ManagementEmployee)
+    except ManagementEmployee.DoesNotExist:
+        return Response({'error': 'Management access required'}, status=status.HTTP_403_FORBIDDEN)
+    try:
+        params = section_attendance_params(request.query_params)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return section_attendance_response(*params)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def attendance_shortfall(request):
+    """
+    Attendance shortfall snapshot (python manage.py compute_attendance_shortfall),
+    lowest percentage first.
+
+    Filters (see students.shortfall.filter_snapshot):
+        year, branch, section, semester, course, threshold=75|65, below, reachable
+
+    Response modes:
+        (default)            {'results': [...], 'next_cursor': ..., 'count': n, 'computed_at': ...},
+                             keyset-paginated with ?cursor=&page_size=
+        ?export=csv          every matching row as a CSV download
+    """
+    try:
+        get_role_profile(request, ManagementEmployee)
+    except ManagementEmployee.DoesNotExist:
+        return Response({'error': 'Management access required'}, status=status.HTTP_403_FORBIDDEN)
+    try:
+        rows = filter_snapshot(request.query_params).values('id', *SNAPSHOT_FIELDS)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    ordering = ['percentage', 'id']
+    
+    if request.query_params.get('export') == 'csv':
+        logger.info("✓ Management: Exporting attendance shortfall CSV")
+        return stream_csv(
+            [field.replace('student__', '') for field in SNAPSHOT_FIELDS],
+            (
+                [row[field] for field in SNAPSHOT_FIELDS]
+                for row in rows.order_by(*ordering).iterator(chunk_size=STREAM_CHUNK_SIZE)
+            ),
+            'attendance_shortfall.csv',
+        )
+    
+    try:
+        page_size = int(request.query_params.get('page_size') or SHORTFALL_PAGE_SIZE)
+        if page_size < 1:
+            raise ValueError('page_size must be positive')
+        page, next_cursor = keyset_page(
+            rows, ordering, cursor=request.query_params.get('cursor'),
+            page_size=min(page_size, SHORTFALL_MAX_PAGE_SIZE),
+        )
+    except ValueError as e:
+        return Response({'error': f'Invalid pagination parameters: {e}'}, status=status.HTTP_400_BAD_REQUEST)
+    summary = rows.aggregate(count=Count('id'), computed_at=Max('computed_at'))
+    return Response({
+        'results': [
+            {field.replace('student__', ''): row[field] for field in SNAPSHOT_FIELDS}
+            for row in page
+        ],
+        'next_cursor': next_cursor,
+        'count': summary['count'],
+        'computed_at': summary['computed_at'],
+    }, status=status.HTTP_200_OK)
@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from .models import Notification
 from users.models import User
+from users.profiles import get_role_profile
 import logging
 
 logger = logging.getLogger(__name__)
@@ -35,7 +36,7 @@ def get_notifications(request):
             if user.role == 'student':
                 from students.models import Student
                 try:
-                    student = Student.objects.get(email=user.email)
+                    student = get_role_profile(request, Student)
                     # Class notifications
                     class_notifs = Notification.objects.filter(
                         year_id=student.year_id,
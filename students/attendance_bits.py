@@ -0,0 +1,111 @@
+"""
+Attendance Bitmaps
+A student-course attendance row stores its class list as two integers:
+bit i of `held` is set when class i+1 was conducted, bit i of `present` when
+the student attended it. Counters are popcounts instead of list scans, and
+the 1/0/None list the API returns is rebuilt on demand.
+
+    [1, 0, None, 1]  ->  held 0b1011, present 0b1001, length 4
+
+The counts (total/present/absent) are also stored on the row, so summaries
+and reports aggregate them with plain SQL SUMs.
+"""
+import numpy as np
+
+# Bits available in a signed 64-bit column
+MAX_CLASSES = 63
+
+
+def popcount(mask):
+    return bin(mask).count('1')
+
+
+def record_counts(held, present):
+    """(total_classes, present_count, absent_count) for a pair of bitmaps"""
+    return popcount(held), popcount(present), popcount(held & ~present)
+
+
+def encode_records(records):
+    """
+    (held, present, length) for a list of 1 (present) / 0 (absent) / None (not held).
+
+    Raises:
+        ValueError: for more than MAX_CLASSES entries
+    """
+    if len(records) > MAX_CLASSES:
+        raise ValueError(f'At most {MAX_CLASSES} classes fit in an attendance bitmap, got {len(records)}')
+    held = present = 0
+    for i, mark in enumerate(records):
+        if mark is not None:
+            held |= 1 << i
+            if mark == 1:
+                present |= 1 << i
+    return held, present, len(records)
+
+
+def decode_records(held, present, length):
+    """The 1/0/None list encoded by encode_records"""
+    return [
+        (1 if present >> i & 1 else 0) if held >> i & 1 else None
+        for i in range(length)
+    ]
+
+
+def encode_matrix(matrix):
+    """
+    Vectorised encode_records for a (rows x classes) float matrix where NaN is
+    'not held' and 1 is 'present'.
+
+    Returns:
+        dict: column -> int64 array for held_mask, present_mask and the three counters
+    """
+    if matrix.shape[1] > MAX_CLASSES:
+        raise ValueError(f'At most {MAX_CLASSES} classes fit in an attendance bitmap, got {matrix.shape[1]}')
+    weights = np.left_shift(np.int64(1), np.arange(matrix.shape[1], dtype=np.int64))
+    held = ~np.isnan(matrix)
+    present = held & (matrix == 1)
+    total = held.sum(axis=1)
+    attended = present.sum(axis=1)
+    return {
+        'held_mask': held.astype(np.int64) @ weights,
+        'present_mask': present.astype(np.int64) @ weights,
+        'total_classes': total,
+        'present_count': attended,
+        'absent_count': total - attended,
+    }
+
+
+def backfill_counters(model, batch_size=2000, on_batch=None):
+    """
+    Recompute the stored counters of every attendance row of `model`
+    (StudentAttendance), walking primary keys in keyset order and writing
+    only rows whose counters changed.
+
+    Args:
+        on_batch: Optional callback(scanned, updated) after each batch
+
+    Returns:
+        tuple: (rows scanned, rows updated)
+    """
+    fields = ['total_classes', 'present_count', 'absent_count']
+    scanned = updated = 0
+    last_pk = 0
+    while True:
+        rows = list(
+            model.objects.filter(pk__gt=last_pk).order_by('pk')
+            .only('pk', 'held_mask', 'present_mask', *fields)[:batch_size]
+        )
+        if not rows:
+            return scanned, updated
+        stale = []
+        for row in rows:
+            counts = record_counts(row.held_mask, row.present_mask)
+            if counts != (row.total_classes, row.present_count, row.absent_count):
+                row.total_classes, row.present_count, row.absent_count = counts
+                stale.append(row)
+        model.objects.bulk_update(stale, fields)
+        scanned += len(rows)
+        updated += len(stale)
+        last_pk = rows[-1].pk
+        if on_batch:
+            on_batch(scanned, updated)
@@ -0,0 +1,127 @@
+"""
+Section Attendance Matrix
+Loads one section's attendance rows for a course (a single query over the
+held/present bitmaps, see students/attendance_bits.py), unpacks them into
+students x classes NumPy matrices and derives:
+
+- per student: classes held/present/absent, percentage, longest and current
+  run of consecutive absences (classes not held for the student are skipped)
+- per class: students marked and turnout
+- students below 75% and below 65%
+
+Reports are cached in the Django cache under a generation number that is
+bumped whenever performance summaries are refreshed, which every attendance
+write path does (signals, CSV loaders, the faculty marking API). The number
+is stored in the database (utils/generations.py), so a write in any worker
+or command invalidates the reports cached by every other process within
+GENERATION_RECHECK_SECONDS.
+"""
+import numpy as np
+from django.core.cache import cache
+
+from utils.generations import bump_generation, current_generation
+from .models import StudentAttendance
+
+GENERATION = 'attendance_matrix'
+REPORT_CACHE_TTL = 600
+THRESHOLDS = (75, 65)
+
+
+def invalidate_reports(**kwargs):
+    """Invalidate every cached report in every process (usable directly as a signal receiver)"""
+    bump_generation(GENERATION)
+
+
+def unpack_bitmaps(masks, width):
+    """(rows,) int64 bitmaps -> (rows x width) bool matrix, column j = bit j"""
+    as_bytes = np.asarray(masks, dtype='<i8').view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(as_bytes, axis=1, bitorder='little')[:, :width].astype(bool)
+
+
+def _percentages(part, whole):
+    return np.round(np.divide(part * 100.0, whole, out=np.zeros(len(whole)), where=whole > 0), 2)
+
+
+def _absence_streaks(held, absent):
+    """Longest and current consecutive-absence runs per row, vectorised across rows"""
+    run = np.zeros(held.shape[0], dtype=np.int64)
+    longest = run.copy()
+    for j in range(held.shape[1]):
+        run = np.where(absent[:, j], run + 1, np.where(held[:, j], 0, run))
+        np.maximum(longest, run, out=longest)
+    return longest, run
+
+
+def build_report(year_id, branch_id, section_id, semester_id, course_id):
+    """Compute the section report (uncached)"""
+    rows = list(
+        StudentAttendance.objects.filter(
+            year_id=year_id, branch_id=branch_id, section_id=section_id,
+            semester_id=semester_id, course_id=course_id,
+        ).order_by('student__roll_no', 'student_id').values_list(
+            'student_id', 'student__roll_no', 'student__first_name', 'student__last_name',
+            'held_mask', 'present_mask', 'record_length',
+        )
+    )
+    student_ids, roll_nos, first_names, last_names, held_masks, present_masks, lengths = (
+        zip(*rows) if rows else ((),) * 7
+    )
+    width = max(lengths, default=0)
+    held = unpack_bitmaps(held_masks, width)
+    present = unpack_bitmaps(present_masks, width)
+    absent = held & ~present
+
+    total = held.sum(axis=1)
+    attended = present.sum(axis=1)
+    percentage = _percentages(attended, total)
+    longest, current = _absence_streaks(held, absent)
+
+    marked = held.sum(axis=0)
+    turnout = _percentages(present.sum(axis=0), marked)
+
+    below = {
+        f'below_{threshold}': [
+            student_ids[i] for i in np.flatnonzero((total > 0) & (percentage < threshold))
+        ]
+        for threshold in THRESHOLDS
+    }
+    return {
+        'year': year_id,
+        'branch': branch_id,
+        'section': section_id,
+        'semester': semester_id,
+        'course': course_id,
+        'class_count': width,
+        'section_percentage': float(_percentages(np.array([attended.sum()]), np.array([total.sum()]))[0]),
+        'students': [
+            {
+                'student_id': student_ids[i],
+                'roll_no': roll_nos[i],
+                'name': f"{first_names[i]} {last_names[i]}",
+                'total_classes': int(total[i]),
+                'present': int(attended[i]),
+                'absent': int(total[i] - attended[i]),
+                'percentage': float(percentage[i]),
+                'longest_absence_streak': int(longest[i]),
+                'current_absence_streak': int(current[i]),
+            }
+            for i in range(len(rows))
+        ],
+        'classes': [
+            {'class_index': j + 1, 'marked': int(marked[j]), 'turnout': float(turnout[j])}
+            for j in range(width)
+            if marked[j]
+        ],
+        **below,
+    }
+
+
+def section_report(year_id, branch_id, section_id, semester_id, course_id):
+    """build_report(), cached until the next attendance write"""
+    key = (
+        f"attendance_matrix:{current_generation(GENERATION)}:"
+        f"{year_id}:{branch_id}:{section_id}:{semester_id}:{course_id}"
+    )
+    return cache.get_or_set(
+        key, lambda: build_report(year_id, branch_id, section_id, semester_id, course_id), REPORT_CACHE_TTL,
+    )
@@ -0,0 +1,41 @@
+"""
+Recompute StudentAttendance.total_classes / present_count / absent_count
+from the attendance bitmaps.
+
+Saves, the CSV loaders and the marking API keep the counters current, and
+migration 0010 filled them for existing rows; run this after writing
+held_mask/present_mask by other means (raw SQL, restores).
+
+Usage:
+    python manage.py backfill_attendance_counters
+    python manage.py backfill_attendance_counters --batch-size 10000
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from students.attendance_bits import backfill_counters
+from students.models import StudentAttendance
+from students.performance import rebuild_all
+
+
+class Command(BaseCommand):
+    help = 'Recompute stored attendance counters from the held/present bitmaps'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000,
+                            help='Attendance rows read and written per batch')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        scanned, updated = backfill_counters(
+            StudentAttendance,
+            batch_size=options['batch_size'],
+            on_batch=lambda scanned, updated: self.stdout.write(f"  {scanned} rows scanned, {updated} updated"),
+        )
+        if updated:
+            # Student totals are sums of these counters
+            rebuild_all()
+        self.stdout.write(self.style.SUCCESS(
+            f"Checked {scanned} attendance rows, fixed {updated} in {time.perf_counter() - start:.2f}s"
+        ))
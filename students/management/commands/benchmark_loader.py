@@ -0,0 +1,103 @@
+"""
+Time every load_academia_data stage on synthetic datasets of increasing size.
+
+Each size is generated into a temporary directory, loaded inside a transaction
+and rolled back, so the database is left as it was. Run it against an empty
+(scratch) database; results are written as JSON for comparison between runs.
+
+Usage:
+    python manage.py benchmark_loader
+    python manage.py benchmark_loader --sizes 1000,10000 --output loader-bench.json --hasher md5
+"""
+import json
+import platform
+import shutil
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+from students.models import Student
+from utils.data_loader import DEFAULT_BATCH_SIZE, load_all, peak_rss_mb
+from utils.synthetic_data import generate_dataset
+from .generate_synthetic_data import add_spec_arguments, spec_from_options
+
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the CSV loaders on 1k/10k/100k synthetic students and write JSON results'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000,100000',
+                            help='Comma-separated student counts')
+        parser.add_argument('--output', default='loader_benchmark.json', help='JSON results file')
+        parser.add_argument('--backend', choices=['auto', 'copy', 'orm'], default='auto')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--chunksize', type=int, default=None)
+        parser.add_argument('--hasher', choices=['default', 'md5'], default='default',
+                            help='md5 takes password hashing out of the timings (never use outside benchmarks)')
+        add_spec_arguments(parser)
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(s) for s in options['sizes'].split(',') if s.strip()]
+        except ValueError:
+            raise CommandError('--sizes must be a comma-separated list of integers')
+        if Student.objects.exists():
+            raise CommandError('benchmark_loader needs an empty database (point --settings at a scratch DB)')
+
+        hashers = FAST_HASHERS if options['hasher'] == 'md5' else settings.PASSWORD_HASHERS
+        report = {
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'backend': options['backend'],
+            'batch_size': options['batch_size'],
+            'chunksize': options['chunksize'],
+            'hasher': hashers[0],
+            'runs': [],
+        }
+
+        with override_settings(PASSWORD_HASHERS=hashers):
+            for students in sizes:
+                report['runs'].append(self._run(spec_from_options(students, options), options))
+
+        with open(options['output'], 'w') as fh:
+            json.dump(report, fh, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    def _run(self, spec, options):
+        data_path = tempfile.mkdtemp(prefix=f'academia-bench-{spec.students}-')
+        try:
+            start = time.perf_counter()
+            rows = generate_dataset(data_path, spec)
+            generate_seconds = time.perf_counter() - start
+
+            self.stdout.write('=' * 80)
+            self.stdout.write(f"{spec.students} students: {sum(rows.values())} rows generated in {generate_seconds:.1f}s")
+            with transaction.atomic():
+                stages = load_all(data_path, batch_size=options['batch_size'], backend=options['backend'],
+                                  chunksize=options['chunksize'])
+                transaction.set_rollback(True)
+        finally:
+            shutil.rmtree(data_path, ignore_errors=True)
+
+        for stats in stages:
+            self.stdout.write(f"  {stats.table:<20} {stats.rows_read:>9} rows {stats.seconds:8.2f}s "
+                              f"{stats.rows_per_second:10.0f} rows/s")
+        total_rows = sum(s.rows_read for s in stages)
+        total_seconds = sum(s.seconds for s in stages)
+        return {
+            'students': spec.students,
+            'generate_seconds': round(generate_seconds, 3),
+            'total_rows': total_rows,
+            'total_seconds': round(total_seconds, 3),
+            'rows_per_second': round(total_rows / total_seconds, 1) if total_seconds else 0.0,
+            'peak_rss_mb': round(peak_rss_mb(), 1),
+            'stages': [s.as_dict() for s in stages],
+        }
@@ -0,0 +1,38 @@
+"""
+Rebuild the AttendanceShortfall snapshot: current percentage, classes still
+needed for 75% / 65% and whether they can still be reached, for every
+student-course (see students/shortfall.py).
+
+Run before exams (or nightly); management reads the snapshot at
+/api/management/attendance/shortfall/.
+
+Usage:
+    python manage.py compute_attendance_shortfall
+    python manage.py compute_attendance_shortfall --planned-classes 60
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from students.shortfall import PLANNED_CLASSES, SHORTFALL_BATCH_SIZE, compute_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Project attendance shortfalls for every student-course into a snapshot table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--planned-classes', type=int, default=PLANNED_CLASSES,
+                            help='Classes scheduled per course over the semester')
+        parser.add_argument('--batch-size', type=int, default=SHORTFALL_BATCH_SIZE,
+                            help='Attendance rows projected per batch')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        written = compute_snapshot(
+            planned_classes=options['planned_classes'],
+            batch_size=options['batch_size'],
+            on_batch=lambda done: self.stdout.write(f"  {done} rows projected"),
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Snapshot of {written} student-courses written in {time.perf_counter() - start:.2f}s"
+        ))
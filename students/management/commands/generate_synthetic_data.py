@@ -0,0 +1,48 @@
+"""
+Write a synthetic set of academia CSV exports (see utils/synthetic_data.py).
+
+Usage:
+    python manage.py generate_synthetic_data --output /tmp/academia-10k --students 10000
+    python manage.py generate_synthetic_data --output /tmp/small --students 200 --branches 2 --semesters 1
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.synthetic_data import SyntheticSpec, generate_dataset
+
+
+def add_spec_arguments(parser):
+    """Dataset-shape options shared with benchmark_loader"""
+    parser.add_argument('--years', type=int, default=4)
+    parser.add_argument('--branches', type=int, default=4)
+    parser.add_argument('--sections', type=int, default=3, help='Sections per (year, branch)')
+    parser.add_argument('--semesters', type=int, default=2, help='Semesters of records per student')
+    parser.add_argument('--courses', type=int, default=5, help='Courses per semester')
+    parser.add_argument('--mids', type=int, default=2, help='Mid exams per course')
+    parser.add_argument('--seed', type=int, default=0)
+
+
+def spec_from_options(students, options):
+    try:
+        return SyntheticSpec(
+            students=students, years=options['years'], branches=options['branches'],
+            sections=options['sections'], semesters=options['semesters'],
+            courses_per_semester=options['courses'], mids=options['mids'], seed=options['seed'],
+        )
+    except ValueError as e:
+        raise CommandError(str(e))
+
+
+class Command(BaseCommand):
+    help = 'Generate all academia CSV exports with synthetic, internally consistent data'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', required=True, help='Directory to write the CSV files into')
+        parser.add_argument('--students', type=int, default=1000)
+        add_spec_arguments(parser)
+
+    def handle(self, *args, **options):
+        spec = spec_from_options(options['students'], options)
+        counts = generate_dataset(options['output'], spec)
+        for table, rows in counts.items():
+            self.stdout.write(f"✓ {table:<20} {rows:>10} rows")
+        self.stdout.write(self.style.SUCCESS(f"Wrote {sum(counts.values())} rows to {options['output']}"))
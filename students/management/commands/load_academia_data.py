@@ -0,0 +1,80 @@
+"""
+Load the academia CSV exports into the database.
+
+Usage:
+    python manage.py load_academia_data
+    python manage.py load_academia_data --data-path /srv/exports --tables students,exams
+    python manage.py load_academia_data --backend orm   # skip COPY even on PostgreSQL
+    python manage.py load_academia_data --delta         # apply only changed fact rows
+    python manage.py load_academia_data --chunksize 50000   # stream large files in constant memory
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.data_loader import CSV_FILES, DEFAULT_BATCH_SIZE, FACT_TABLES, load_all, peak_rss_mb
+
+
+class Command(BaseCommand):
+    help = 'Bulk-load the academia CSV exports (vectorized, one pass per file)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--data-path', default=settings.ACADEMIA_DATA_PATH,
+                            help='Directory containing the CSV exports')
+        parser.add_argument('--tables', default='',
+                            help=f"Comma-separated subset of: {', '.join(CSV_FILES)}")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help='Rows per bulk INSERT')
+        parser.add_argument('--backend', choices=['auto', 'copy', 'orm'], default='auto',
+                            help='Fact-table write path: COPY + ON CONFLICT merge (PostgreSQL) or bulk_create')
+        parser.add_argument('--delta', action='store_true',
+                            help='Compare per-row fingerprints with the previous import and apply only '
+                                 f"inserts/updates/deletes ({', '.join(FACT_TABLES)})")
+        parser.add_argument('--chunksize', type=int, default=None,
+                            help='Stream each CSV in chunks of this many rows instead of reading it whole')
+
+    def handle(self, *args, **options):
+        if options['chunksize'] is not None and options['chunksize'] < 1:
+            raise CommandError('--chunksize must be a positive number of rows')
+        tables = [t.strip() for t in options['tables'].split(',') if t.strip()] or None
+        unknown = set(tables or []) - set(CSV_FILES)
+        if unknown:
+            raise CommandError(f"Unknown table(s): {', '.join(sorted(unknown))}")
+
+        self.stdout.write('=' * 80)
+        self.stdout.write(f"LOADING ACADEMIA DATA from {options['data_path']}")
+        self.stdout.write('=' * 80)
+
+        def report(table, stats):
+            if stats is None:
+                self.stdout.write(self.style.WARNING(f"✗ {table}: file not found ({CSV_FILES[table]})"))
+                return
+            self.stdout.write(
+                f"✓ {table:<20} read={stats.rows_read:<8} loaded={stats.loaded:<8} updated={stats.updated:<8} "
+                f"skipped={stats.skipped:<6} rejected={stats.rejected:<6} "
+                f"{stats.seconds:8.2f}s  {stats.rows_per_second:10.0f} rows/s  peak RSS {stats.peak_rss_mb:.0f} MB"
+            )
+
+        try:
+            results = load_all(options['data_path'], tables=tables, batch_size=options['batch_size'],
+                               on_table=report, backend=options['backend'], delta=options['delta'],
+                               chunksize=options['chunksize'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        total_rows = sum(s.rows_read for s in results)
+        total_seconds = sum(s.seconds for s in results)
+        rate = total_rows / total_seconds if total_seconds else 0
+        if options['delta']:
+            self.stdout.write('=' * 80)
+            self.stdout.write('CHANGE SUMMARY')
+            for stats in results:
+                if stats.table in FACT_TABLES:
+                    self.stdout.write(
+                        f"  {stats.table:<20} +{stats.loaded} inserted  ~{stats.updated} updated  "
+                        f"-{stats.deleted} deleted  ={stats.unchanged} unchanged"
+                    )
+
+        self.stdout.write('=' * 80)
+        self.stdout.write(self.style.SUCCESS(
+            f"DONE: {total_rows} rows in {total_seconds:.2f}s ({rate:.0f} rows/s), peak RSS {peak_rss_mb():.0f} MB"
+        ))
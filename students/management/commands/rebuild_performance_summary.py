@@ -0,0 +1,34 @@
+"""
+Recompute StudentPerformanceSummary for every student.
+
+Normally summaries are maintained incrementally (signals and the CSV
+loaders); run this after writing fact rows by other means (raw SQL, admin
+bulk actions) or to backfill the table for the first time.
+
+Usage:
+    python manage.py rebuild_performance_summary
+    python manage.py rebuild_performance_summary --batch-size 10000
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from students.performance import SUMMARY_BATCH_SIZE, rebuild_all
+
+
+class Command(BaseCommand):
+    help = 'Recompute the per-student CGPA, backlog and attendance summary in bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=SUMMARY_BATCH_SIZE,
+                            help='Students recomputed and upserted per batch')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        written = rebuild_all(
+            batch_size=options['batch_size'],
+            on_batch=lambda done: self.stdout.write(f"  {done} summaries written"),
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {written} performance summaries in {time.perf_counter() - start:.2f}s"
+        ))
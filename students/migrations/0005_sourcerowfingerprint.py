@@ -0,0 +1,25 @@
+# Generated by Django 4.2 on 2026-10-17 21:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0004_studentattendance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SourceRowFingerprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('table', models.CharField(max_length=50)),
+                ('natural_key', models.CharField(max_length=200)),
+                ('row_hash', models.BigIntegerField()),
+            ],
+            options={
+                'unique_together': {('table', 'natural_key')},
+            },
+        ),
+    ]
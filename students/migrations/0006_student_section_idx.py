@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-17 22:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0005_sourcerowfingerprint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['year_id', 'branch_id', 'sec_id'], name='student_section_idx'),
+        ),
+    ]
@@ -0,0 +1,94 @@
+# Generated by Django 4.2 on 2026-10-17 22:08
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, F, Sum
+
+BATCH_SIZE = 2000
+
+
+def build_summaries(apps, schema_editor):
+    """
+    Populate a summary for every student, so reads that moved to the summary
+    table match the per-request aggregation as soon as the migration runs.
+    Same figures as students.performance.compute_summaries at this schema
+    (attendance still in class_records), inlined so later changes to that
+    module cannot change what this migration writes.
+    """
+    Student = apps.get_model('students', 'Student')
+    StudentExamData = apps.get_model('students', 'StudentExamData')
+    StudentBacklog = apps.get_model('students', 'StudentBacklog')
+    StudentAttendance = apps.get_model('students', 'StudentAttendance')
+    StudentPerformanceSummary = apps.get_model('students', 'StudentPerformanceSummary')
+
+    last_id = None
+    while True:
+        students = Student.objects.order_by('student_id')
+        if last_id is not None:
+            students = students.filter(student_id__gt=last_id)
+        batch = list(students.values_list('student_id', flat=True)[:BATCH_SIZE])
+        if not batch:
+            return
+        exams = {
+            row['student_id']: row
+            for row in StudentExamData.objects.filter(student_id__in=batch).order_by()
+            .values('student_id').annotate(n=Count('*'), total=Sum(F('mid_marks') + F('quiz_marks') + F('assignment_marks')))
+        }
+        backlogs = dict(
+            StudentBacklog.objects.filter(student_id__in=batch).order_by()
+            .values('student_id').annotate(n=Count('*')).values_list('student_id', 'n')
+        )
+        attendance = {}
+        for student_id, records in StudentAttendance.objects.filter(student_id__in=batch).values_list(
+                'student_id', 'class_records'):
+            counts = attendance.setdefault(student_id, [0, 0, 0])
+            for mark in records or []:
+                if mark is not None:
+                    counts[0] += 1
+                    counts[1] += mark == 1
+                    counts[2] += mark == 0
+
+        summaries = []
+        for student_id in batch:
+            exam_count = exams[student_id]['n'] if student_id in exams else 0
+            total_marks = (exams[student_id]['total'] or 0) if student_id in exams else 0
+            total_classes, present, absent = attendance.get(student_id, (0, 0, 0))
+            summaries.append(StudentPerformanceSummary(
+                student_id=student_id,
+                exam_count=exam_count,
+                exam_total_marks=total_marks,
+                cgpa=round((total_marks / (exam_count * 30)) * 10, 2) if exam_count else 0.0,
+                backlog_count=backlogs.get(student_id, 0),
+                total_classes=total_classes,
+                present_count=present,
+                absent_count=absent,
+                attendance_percentage=(present / total_classes) * 100 if total_classes else 0.0,
+            ))
+        StudentPerformanceSummary.objects.bulk_create(summaries)
+        last_id = batch[-1]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0006_student_section_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentPerformanceSummary',
+            fields=[
+                ('student', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='performance', serialize=False, to='students.student')),
+                ('exam_count', models.IntegerField(default=0)),
+                ('exam_total_marks', models.IntegerField(default=0)),
+                ('cgpa', models.FloatField(default=0.0)),
+                ('backlog_count', models.IntegerField(default=0)),
+                ('total_classes', models.IntegerField(default=0)),
+                ('present_count', models.IntegerField(default=0)),
+                ('absent_count', models.IntegerField(default=0)),
+                ('attendance_percentage', models.FloatField(default=0.0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(build_summaries, migrations.RunPython.noop),
+    ]
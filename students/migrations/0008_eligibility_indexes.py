@@ -0,0 +1,33 @@
+# Generated by Django 4.2 on 2026-10-17 22:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0007_studentperformancesummary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['ssc_marks', 'student_id'], name='student_ssc_marks_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['inter_marks', 'student_id'], name='student_inter_marks_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentperformancesummary',
+            index=models.Index(fields=['cgpa', 'student'], name='perf_cgpa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentperformancesummary',
+            index=models.Index(fields=['backlog_count', 'student'], name='perf_backlog_count_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentperformancesummary',
+            index=models.Index(fields=['attendance_percentage', 'student'], name='perf_attendance_idx'),
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 4.2 on 2026-10-17 22:20
+
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+MAX_CLASSES = 63
+
+# Frozen copies of students.attendance_bits.encode_records/decode_records as of
+# this migration, so later changes to that module cannot change what it writes.
+
+
+def encode_records(records):
+    """(held, present, length): any non-None mark is held, only 1 is present"""
+    if len(records) > MAX_CLASSES:
+        raise ValueError(f'At most {MAX_CLASSES} classes fit in an attendance bitmap, got {len(records)}')
+    held = present = 0
+    for i, mark in enumerate(records):
+        if mark is not None:
+            held |= 1 << i
+            if mark == 1:
+                present |= 1 << i
+    return held, present, len(records)
+
+
+def decode_records(held, present, length):
+    return [
+        (1 if present >> i & 1 else 0) if held >> i & 1 else None
+        for i in range(length)
+    ]
+
+
+def records_to_bitmaps(apps, schema_editor):
+    StudentAttendance = apps.get_model('students', 'StudentAttendance')
+    batch = []
+    for row in StudentAttendance.objects.only('pk', 'class_records').order_by('pk').iterator(chunk_size=BATCH_SIZE):
+        row.held_mask, row.present_mask, row.record_length = encode_records(row.class_records or [])
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            StudentAttendance.objects.bulk_update(batch, ['held_mask', 'present_mask', 'record_length'])
+            batch = []
+    StudentAttendance.objects.bulk_update(batch, ['held_mask', 'present_mask', 'record_length'])
+
+
+def bitmaps_to_records(apps, schema_editor):
+    StudentAttendance = apps.get_model('students', 'StudentAttendance')
+    batch = []
+    for row in StudentAttendance.objects.order_by('pk').iterator(chunk_size=BATCH_SIZE):
+        row.class_records = decode_records(row.held_mask, row.present_mask, row.record_length)
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            StudentAttendance.objects.bulk_update(batch, ['class_records'])
+            batch = []
+    StudentAttendance.objects.bulk_update(batch, ['class_records'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0008_eligibility_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentattendance',
+            name='held_mask',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='studentattendance',
+            name='present_mask',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='studentattendance',
+            name='record_length',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(records_to_bitmaps, bitmaps_to_records),
+        migrations.RemoveField(
+            model_name='studentattendance',
+            name='class_records',
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2 on 2026-10-17 22:22
+
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+COUNTER_FIELDS = ['total_classes', 'present_count', 'absent_count']
+
+
+def fill_counters(apps, schema_editor):
+    """Counters as popcounts of the bitmaps (inlined, independent of students.attendance_bits)"""
+    StudentAttendance = apps.get_model('students', 'StudentAttendance')
+    last_pk = 0
+    while True:
+        rows = list(
+            StudentAttendance.objects.filter(pk__gt=last_pk).order_by('pk')
+            .only('pk', 'held_mask', 'present_mask')[:BATCH_SIZE]
+        )
+        if not rows:
+            return
+        for row in rows:
+            row.total_classes = bin(row.held_mask).count('1')
+            row.present_count = bin(row.present_mask).count('1')
+            row.absent_count = bin(row.held_mask & ~row.present_mask).count('1')
+        StudentAttendance.objects.bulk_update(rows, COUNTER_FIELDS)
+        last_pk = rows[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0009_attendance_bitmaps'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentattendance',
+            name='absent_count',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='studentattendance',
+            name='present_count',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='studentattendance',
+            name='total_classes',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.2 on 2026-10-17 22:26
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0010_attendance_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceShortfall',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year_id', models.IntegerField()),
+                ('branch_id', models.IntegerField()),
+                ('section_id', models.IntegerField()),
+                ('semester_id', models.IntegerField()),
+                ('course_id', models.CharField(max_length=50)),
+                ('total_classes', models.PositiveSmallIntegerField()),
+                ('present_count', models.PositiveSmallIntegerField()),
+                ('percentage', models.FloatField()),
+                ('remaining_classes', models.PositiveSmallIntegerField()),
+                ('required_75', models.PositiveIntegerField()),
+                ('required_65', models.PositiveIntegerField()),
+                ('reachable_75', models.BooleanField()),
+                ('reachable_65', models.BooleanField()),
+                ('computed_at', models.DateTimeField()),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_shortfalls', to='students.student')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='attendanceshortfall',
+            index=models.Index(fields=['percentage', 'id'], name='shortfall_percentage_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendanceshortfall',
+            index=models.Index(fields=['year_id', 'branch_id', 'section_id', 'percentage'], name='shortfall_section_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='attendanceshortfall',
+            unique_together={('student', 'semester_id', 'course_id')},
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2 on 2026-10-17 22:59
+
+from django.db import migrations, models
+import django.db.models.functions.comparison
+
+BATCH_SIZE = 2000
+
+
+def create_missing_summaries(apps, schema_editor):
+    """An all-zero summary (what eligibility used to assume for a missing row) for every student without one"""
+    Student = apps.get_model('students', 'Student')
+    StudentPerformanceSummary = apps.get_model('students', 'StudentPerformanceSummary')
+    missing = Student.objects.filter(performance__isnull=True).order_by('student_id')
+    while True:
+        # Each batch inserted drops out of `missing`
+        batch = list(missing.values_list('student_id', flat=True)[:BATCH_SIZE])
+        if not batch:
+            return
+        StudentPerformanceSummary.objects.bulk_create(
+            [StudentPerformanceSummary(student_id=student_id) for student_id in batch], ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0011_attendanceshortfall'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_missing_summaries, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('ssc_marks', models.Value(-1.0)), models.F('student_id'), name='student_ssc_sort_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('inter_marks', models.Value(-1.0)), models.F('student_id'), name='student_inter_sort_idx'),
+        ),
+    ]
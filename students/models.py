@@ -1,6 +1,9 @@
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.contrib.auth.hashers import check_password, make_password
 
+from .attendance_bits import decode_records, encode_records, record_counts
+
 class Student(models.Model):
     student_id = models.IntegerField(primary_key=True)
     first_name = models.CharField(max_length=100)
@@ -16,6 +19,18 @@ class Student(models.Model):
     inter_marks = models.FloatField(null=True, blank=True)
     passcode = models.CharField(max_length=255)  # SECURITY: Now stores HASHED passwords
     
+    class Meta:
+        indexes = [
+            # Section rosters: exact (year, branch, section) lookups
+            models.Index(fields=['year_id', 'branch_id', 'sec_id'], name='student_section_idx'),
+            # TP cell eligibility cutoffs (tpcell/eligibility.py)
+            models.Index(fields=['ssc_marks', 'student_id'], name='student_ssc_marks_idx'),
+            models.Index(fields=['inter_marks', 'student_id'], name='student_inter_marks_idx'),
+            # ... and their sort keys, NULL marks folded to -1 exactly as eligibility.SORT_KEYS does
+            models.Index(Coalesce('ssc_marks', models.Value(-1.0)), models.F('student_id'), name='student_ssc_sort_idx'),
+            models.Index(Coalesce('inter_marks', models.Value(-1.0)), models.F('student_id'), name='student_inter_sort_idx'),
+        ]
+    
     def __str__(self):
         return f"{self.student_id} - {self.first_name} {self.last_name}"
     
@@ -99,23 +114,52 @@ class StudentAttendance(models.Model):
     section_id = models.IntegerField()
     semester_id = models.IntegerField()
     course_id = models.CharField(max_length=50)
-    # Store attendance for 50 classes as JSON (1=present, 0=absent)
-    class_records = models.JSONField(default=list)
+    # Classes as bitmaps (students/attendance_bits.py): bit i = class i+1
+    held_mask = models.BigIntegerField(default=0)  # class conducted
+    present_mask = models.BigIntegerField(default=0)  # student present
+    record_length = models.PositiveSmallIntegerField(default=0)  # entries in class_records
+    # Popcounts of the bitmaps, kept in step on every write (save, CSV loader, marking API)
+    total_classes = models.PositiveSmallIntegerField(default=0)
+    present_count = models.PositiveSmallIntegerField(default=0)
+    absent_count = models.PositiveSmallIntegerField(default=0)
+    
+    COUNTER_FIELDS = ('total_classes', 'present_count', 'absent_count')
     
     class Meta:
         unique_together = ('student', 'semester_id', 'course_id')
     
+    @property
+    def class_records(self):
+        """Attendance per class as a list: 1=present, 0=absent, None=not held"""
+        return decode_records(self.held_mask, self.present_mask, self.record_length)
+    
+    @class_records.setter
+    def class_records(self, records):
+        self.held_mask, self.present_mask, self.record_length = encode_records(records)
+        self.refresh_counters()
+    
+    def refresh_counters(self):
+        """Recompute the stored counters from the bitmaps"""
+        self.total_classes, self.present_count, self.absent_count = record_counts(self.held_mask, self.present_mask)
+    
+    def save(self, *args, **kwargs):
+        self.refresh_counters()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'held_mask', 'present_mask'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, *self.COUNTER_FIELDS}
+        super().save(*args, **kwargs)
+    
     def get_total_classes(self):
-        """Count total classes conducted (non-null records)"""
-        return len([x for x in self.class_records if x is not None])
+        """Count total classes conducted"""
+        return self.total_classes
     
     def get_present_count(self):
         """Count total present classes"""
-        return sum([1 for x in self.class_records if x == 1])
+        return self.present_count
     
     def get_absent_count(self):
         """Count total absent classes"""
-        return sum([1 for x in self.class_records if x == 0])
+        return self.absent_count
     
     def get_attendance_percentage(self):
         """Calculate attendance percentage"""
@@ -124,3 +168,79 @@ class StudentAttendance(models.Model):
             return 0
         present = self.get_present_count()
         return (present / total) * 100
+
+
+class SourceRowFingerprint(models.Model):
+    """Hash of the last imported CSV row for each natural key (used by delta imports)"""
+    table = models.CharField(max_length=50)
+    natural_key = models.CharField(max_length=200)
+    row_hash = models.BigIntegerField()
+    
+    class Meta:
+        unique_together = ('table', 'natural_key')
+
+
+class StudentPerformanceSummary(models.Model):
+    """
+    Per-student figures derived from exam, backlog and attendance rows. Every
+    student has one (created with the student by students.signals and the CSV
+    loaders), so eligibility sorts can walk the indexes below. Kept current by
+    students.signals and the CSV loaders; rebuilt in bulk by
+    `python manage.py rebuild_performance_summary` (see students/performance.py).
+    """
+    student = models.OneToOneField(Student, on_delete=models.CASCADE, primary_key=True, related_name='performance')
+    exam_count = models.IntegerField(default=0)
+    exam_total_marks = models.IntegerField(default=0)
+    cgpa = models.FloatField(default=0.0)
+    backlog_count = models.IntegerField(default=0)
+    total_classes = models.IntegerField(default=0)
+    present_count = models.IntegerField(default=0)
+    absent_count = models.IntegerField(default=0)
+    attendance_percentage = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        indexes = [
+            # TP cell eligibility range filters and sort keys (tpcell/eligibility.py)
+            models.Index(fields=['cgpa', 'student'], name='perf_cgpa_idx'),
+            models.Index(fields=['backlog_count', 'student'], name='perf_backlog_count_idx'),
+            models.Index(fields=['attendance_percentage', 'student'], name='perf_attendance_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.student_id} - CGPA {self.cgpa}, {self.backlog_count} backlogs"
+
+
+class AttendanceShortfall(models.Model):
+    """
+    Snapshot of attendance projections per student-course, replaced in bulk by
+    `python manage.py compute_attendance_shortfall` (see students/shortfall.py).
+    required_NN = further classes the student must attend (all of them present)
+    to reach NN%; reachable_NN = that many classes are still scheduled.
+    """
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='attendance_shortfalls')
+    year_id = models.IntegerField()
+    branch_id = models.IntegerField()
+    section_id = models.IntegerField()
+    semester_id = models.IntegerField()
+    course_id = models.CharField(max_length=50)
+    total_classes = models.PositiveSmallIntegerField()
+    present_count = models.PositiveSmallIntegerField()
+    percentage = models.FloatField()
+    remaining_classes = models.PositiveSmallIntegerField()
+    required_75 = models.PositiveIntegerField()
+    required_65 = models.PositiveIntegerField()
+    reachable_75 = models.BooleanField()
+    reachable_65 = models.BooleanField()
+    computed_at = models.DateTimeField()
+    
+    class Meta:
+        unique_together = ('student', 'semester_id', 'course_id')
+        indexes = [
+            # Detention-risk lists: lowest percentage first, optionally per section
+            models.Index(fields=['percentage', 'id'], name='shortfall_percentage_idx'),
+            models.Index(fields=['year_id', 'branch_id', 'section_id', 'percentage'], name='shortfall_section_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.student_id} - {self.course_id}: {self.percentage:.1f}%"
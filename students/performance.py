@@ -0,0 +1,129 @@
+"""
+Student Performance Summaries
+Computes the per-student figures stored in StudentPerformanceSummary (exam
+CGPA, backlog count, overall attendance) with grouped aggregate queries, and
+upserts them for any set of students in one statement per batch.
+
+Callers:
+- students.signals: single-row saves/deletes of exam, backlog and attendance rows
+- utils.data_loader: students touched by a bulk CSV import
+- rebuild_performance_summary: every student, in batches
+
+Every refresh sends `summaries_refreshed` so caches built on the summaries
+(e.g. tpcell.stats) can be dropped.
+"""
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.dispatch import Signal
+
+from .models import Student, StudentAttendance, StudentBacklog, StudentExamData, StudentPerformanceSummary
+
+SUMMARY_BATCH_SIZE = 5000
+
+# Sent after refresh_summaries(), with student_ids; also (empty) at the end of every CSV import
+summaries_refreshed = Signal()
+
+SUMMARY_FIELDS = [
+    'exam_count', 'exam_total_marks', 'cgpa', 'backlog_count',
+    'total_classes', 'present_count', 'absent_count', 'attendance_percentage', 'updated_at',
+]
+
+
+def exam_cgpa(total_marks, exam_count):
+    """CGPA on a 10 point scale: every exam row is out of 30 (mid 20 + quiz 5 + assignment 5)"""
+    if not exam_count:
+        return 0.0
+    return round((total_marks / (exam_count * 30)) * 10, 2)
+
+
+def summary_or_default(row, field):
+    """
+    Read `performance__<field>` from a Student .values() row; a student whose
+    summary row is missing (every student normally has one) gets the field default.
+    """
+    value = row[f'performance__{field}']
+    if value is None:
+        return StudentPerformanceSummary._meta.get_field(field).default
+    return value
+
+
+def compute_summaries(student_ids):
+    """Build (unsaved) summaries for the given students: three grouped queries"""
+    student_ids = list(student_ids)
+    exams = {
+        row['student_id']: row
+        for row in StudentExamData.objects.filter(student_id__in=student_ids).order_by()
+        .values('student_id').annotate(n=Count('*'), total=Sum(F('mid_marks') + F('quiz_marks') + F('assignment_marks')))
+    }
+    backlogs = dict(
+        StudentBacklog.objects.filter(student_id__in=student_ids).order_by()
+        .values('student_id').annotate(n=Count('*')).values_list('student_id', 'n')
+    )
+    attendance = {
+        row[0]: row[1:]
+        for row in StudentAttendance.objects.filter(student_id__in=student_ids).order_by()
+        .values('student_id').annotate(t=Sum('total_classes'), p=Sum('present_count'), a=Sum('absent_count'))
+        .values_list('student_id', 't', 'p', 'a')
+    }
+
+    summaries = []
+    for student_id in student_ids:
+        exam = exams.get(student_id, {'n': 0, 'total': 0})
+        total_classes, present, absent = attendance.get(student_id, (0, 0, 0))
+        summaries.append(StudentPerformanceSummary(
+            student_id=student_id,
+            exam_count=exam['n'],
+            exam_total_marks=exam['total'] or 0,
+            cgpa=exam_cgpa(exam['total'] or 0, exam['n']),
+            backlog_count=backlogs.get(student_id, 0),
+            total_classes=total_classes,
+            present_count=present,
+            absent_count=absent,
+            attendance_percentage=(present / total_classes) * 100 if total_classes else 0.0,
+        ))
+    return summaries
+
+
+def refresh_summaries(student_ids, batch_size=SUMMARY_BATCH_SIZE):
+    """
+    Recompute and upsert the summaries of the given students.
+
+    Returns:
+        int: number of summaries written
+    """
+    student_ids = sorted(set(student_ids))
+    written = 0
+    for start in range(0, len(student_ids), batch_size):
+        batch = student_ids[start:start + batch_size]
+        # Ids of students deleted meanwhile would violate the foreign key
+        existing = list(Student.objects.filter(student_id__in=batch).values_list('student_id', flat=True))
+        with transaction.atomic():
+            StudentPerformanceSummary.objects.bulk_create(
+                compute_summaries(existing),
+                update_conflicts=True, unique_fields=['student'], update_fields=SUMMARY_FIELDS,
+            )
+        written += len(existing)
+    summaries_refreshed.send(sender=StudentPerformanceSummary, student_ids=student_ids)
+    return written
+
+
+def rebuild_all(batch_size=SUMMARY_BATCH_SIZE, on_batch=None):
+    """
+    Recompute the summary of every student, walking student ids in keyset order.
+
+    Args:
+        on_batch: Optional callback(written_so_far) after each batch
+    """
+    written = 0
+    last_id = None
+    while True:
+        students = Student.objects.order_by('student_id')
+        if last_id is not None:
+            students = students.filter(student_id__gt=last_id)
+        batch = list(students.values_list('student_id', flat=True)[:batch_size])
+        if not batch:
+            return written
+        written += refresh_summaries(batch, batch_size)
+        last_id = batch[-1]
+        if on_batch:
+            on_batch(written)
@@ -0,0 +1,138 @@
+"""
+Attendance Shortfall Projection
+For every student-course attendance row: current percentage, the classes the
+student still has to attend to reach each threshold, and whether that many
+classes remain on the schedule. Computed with NumPy over batches of rows and
+stored as the AttendanceShortfall snapshot that management filters and
+exports (management.views.attendance_shortfall).
+
+Attending x more classes (all present) gives (P + x) / (T + x), so reaching
+t% needs the smallest x with 100 * (P + x) >= t * (T + x):
+
+    x = ceil((t * T - 100 * P) / (100 - t)),  0 when already at t%
+
+computed in integers so the boundary cases are exact.
+"""
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+
+from .models import AttendanceShortfall, StudentAttendance
+
+SHORTFALL_BATCH_SIZE = 20000
+# Classes scheduled per course over the semester
+PLANNED_CLASSES = 50
+THRESHOLDS = (75, 65)
+
+SNAPSHOT_FIELDS = [
+    'student_id', 'student__roll_no', 'year_id', 'branch_id', 'section_id', 'semester_id', 'course_id',
+    'total_classes', 'present_count', 'percentage', 'remaining_classes',
+    'required_75', 'required_65', 'reachable_75', 'reachable_65',
+]
+
+ROW_FIELDS = [
+    'id', 'student_id', 'year_id', 'branch_id', 'section_id', 'semester_id', 'course_id',
+    'total_classes', 'present_count',
+]
+
+
+def required_classes(total, present, threshold):
+    """Classes still to attend (all present) to reach `threshold` percent"""
+    deficit = threshold * total - 100 * present
+    return np.maximum(-(-deficit // (100 - threshold)), 0)
+
+
+def project(columns, planned_classes=PLANNED_CLASSES):
+    """
+    Projection columns for one batch.
+
+    Args:
+        columns: dict of equal-length arrays: total_classes, present_count
+
+    Returns:
+        dict: percentage, remaining_classes, required_NN and reachable_NN arrays
+    """
+    total = columns['total_classes'].astype(np.int64)
+    present = columns['present_count'].astype(np.int64)
+    # Classes held so far (popcount of held_mask, stored as total_classes), not the bitmap width:
+    # CSV rows always span 50 class columns however many were actually held
+    remaining = np.maximum(planned_classes - total, 0)
+    result = {
+        'percentage': np.round(np.divide(present * 100.0, total, out=np.zeros(len(total)), where=total > 0), 2),
+        'remaining_classes': remaining,
+    }
+    for threshold in THRESHOLDS:
+        required = required_classes(total, present, threshold)
+        result[f'required_{threshold}'] = required
+        result[f'reachable_{threshold}'] = required <= remaining
+    return result
+
+
+def compute_snapshot(planned_classes=PLANNED_CLASSES, batch_size=SHORTFALL_BATCH_SIZE, on_batch=None):
+    """
+    Replace the AttendanceShortfall snapshot with a projection of every
+    attendance row. Readers keep seeing the previous snapshot until the
+    transaction commits.
+
+    Args:
+        on_batch: Optional callback(rows_done) after each batch
+
+    Returns:
+        int: rows in the new snapshot
+    """
+    computed_at = timezone.now()
+    written = 0
+    last_id = 0
+    with transaction.atomic():
+        AttendanceShortfall.objects.all().delete()
+        while True:
+            rows = list(
+                StudentAttendance.objects.filter(id__gt=last_id).order_by('id')
+                .values_list(*ROW_FIELDS)[:batch_size]
+            )
+            if not rows:
+                return written
+            columns = dict(zip(ROW_FIELDS, (np.array(values) for values in zip(*rows))))
+            projected = project(columns, planned_classes)
+            AttendanceShortfall.objects.bulk_create([
+                AttendanceShortfall(
+                    student_id=row[1], year_id=row[2], branch_id=row[3], section_id=row[4],
+                    semester_id=row[5], course_id=row[6],
+                    total_classes=row[7], present_count=row[8],
+                    computed_at=computed_at,
+                    **{name: values[i].item() for name, values in projected.items()},
+                )
+                for i, row in enumerate(rows)
+            ], batch_size=2000)
+            written += len(rows)
+            last_id = rows[-1][0]
+            if on_batch:
+                on_batch(written)
+
+
+def filter_snapshot(params):
+    """
+    Snapshot rows matching request query params:
+    year, branch, section, semester, course, threshold (75|65, default 75),
+    below (default true: only rows with classes held and under the threshold),
+    reachable (true/false: whether the threshold can still be met).
+
+    Raises:
+        ValueError: for non-integer ids or an unknown threshold
+    """
+    threshold = int(params.get('threshold') or THRESHOLDS[0])
+    if threshold not in THRESHOLDS:
+        raise ValueError(f"threshold must be one of {', '.join(map(str, THRESHOLDS))}")
+    rows = AttendanceShortfall.objects.all()
+    for param, field in (('year', 'year_id'), ('branch', 'branch_id'), ('section', 'section_id'), ('semester', 'semester_id')):
+        value = params.get(param)
+        if value not in (None, '', 'all'):
+            rows = rows.filter(**{field: int(value)})
+    if params.get('course') not in (None, '', 'all'):
+        rows = rows.filter(course_id=params['course'])
+    if params.get('below', 'true') not in ('0', 'false'):
+        rows = rows.filter(total_classes__gt=0, percentage__lt=threshold)
+    reachable = params.get('reachable')
+    if reachable in ('1', 'true', '0', 'false'):
+        rows = rows.filter(**{f'reachable_{threshold}': reachable in ('1', 'true')})
+    return rows
@@ -0,0 +1,61 @@
+"""
+Keep StudentPerformanceSummary current when exam, backlog or attendance rows
+change one at a time. Bulk writes (bulk_create, COPY, queryset update/delete)
+do not send these signals; the CSV loaders refresh summaries themselves, and
+wrap the deletes they cannot issue in bulk in summary_refresh_deferred().
+
+Every refresh also invalidates cached section attendance reports, and every
+new student gets an (all-zero) summary row straight away.
+"""
+import threading
+from contextlib import contextmanager
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Student, StudentAttendance, StudentBacklog, StudentExamData, StudentPerformanceSummary
+from .attendance_matrix import invalidate_reports
+from .performance import refresh_summaries, summaries_refreshed
+
+_state = threading.local()
+
+
+def _deleting_student(origin):
+    """True when the delete cascades from a Student (its summary goes with it)"""
+    model = getattr(origin, 'model', None) or type(origin)
+    return model is Student
+
+
+@contextmanager
+def summary_refresh_deferred():
+    """
+    Skip the per-row summary refresh for saves and deletes in this thread
+    while the block runs. The caller refreshes the affected students itself.
+    """
+    depth = getattr(_state, 'deferred', 0)
+    _state.deferred = depth + 1
+    try:
+        yield
+    finally:
+        _state.deferred = depth
+
+
+@receiver([post_save, post_delete], sender=StudentExamData)
+@receiver([post_save, post_delete], sender=StudentBacklog)
+@receiver([post_save, post_delete], sender=StudentAttendance)
+def refresh_student_summary(sender, instance, raw=False, origin=None, **kwargs):
+    if raw or _deleting_student(origin):  # loaddata, or cascade from the student itself
+        return
+    if getattr(_state, 'deferred', 0):
+        return
+    refresh_summaries([instance.student_id])
+
+
+@receiver(post_save, sender=Student)
+def create_student_summary(sender, instance, created, **kwargs):
+    if created:  # loaddata included: a fixture's own summary row simply overwrites this one
+        StudentPerformanceSummary.objects.bulk_create([StudentPerformanceSummary(student=instance)],
+                                                      ignore_conflicts=True)
+
+
+summaries_refreshed.connect(invalidate_reports, dispatch_uid='attendance_matrix_generation')
@@ -1,4 +1,345 @@
-from django.urls import path
-from . import views
+import shutil
+from io import StringIO
+import tempfile
+from pathlib import Path
 
-urlpatterns = []
+from unittest import skipUnless
+
+import pandas as pd
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from management.models import ManagementEmployee
+from users.models import User
+from users.profiles import profile_cache
+from utils.data_loader import load_all
+from utils.load_backends import PostgresCopyBackend
+from utils.synthetic_data import SyntheticSpec, generate_dataset
+from .models import (
+    AttendanceShortfall, Student, StudentAcademic, StudentAttendance, StudentBacklog, StudentExamData,
+    StudentPerformanceSummary,
+)
+from .shortfall import compute_snapshot
+
+
+class DataLoaderTestCase(TestCase):
+    def setUp(self):
+        """Write a minimal set of CSV exports"""
+        self.data_path = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.data_path)
+        (self.data_path / '1th_STUDENT_PERSONAL_INFO.csv').write_text(
+            'student_id,first_name,last_name,email,gender,year_id,branch_id,sec_id,roll_no,phone_no,ssc_marks,inter_marks,passcode\n'
+            '1,John,Doe,john@test.com,Male,1,1,1,101,9999999999,91.5,,1234\n'
+            '2,Jane,Roe,jane@test.com,Female,1,1,1,102,9999999998,88,79,1234\n'
+            'x,Bad,Row,bad@test.com,Male,1,1,1,103,9999999997,,,1234\n'
+        )
+        (self.data_path / '2nd_STUD_ACAD.csv').write_text(
+            'student_id,sem_id,course_code,marks,attendance\n'
+            '1,1,CS101,80,90\n'
+            '2,1,CS101,,\n'
+            '99,1,CS101,50,50\n'
+        )
+        (self.data_path / '10th_MID_EXAM_DATA.csv').write_text(
+            'student_id,year_id,branch_id,section_id,sem_id,mid_id,course_id,mid_marks,quiz_marks,assignment_marks\n'
+            '1,1,1,1,1,1,CS101,18,4,5\n'
+        )
+
+    def test_load_all(self):
+        """Students, users and fact rows are loaded; bad rows and unknown students are dropped"""
+        results = {s.table: s for s in load_all(self.data_path)}
+
+        self.assertEqual(results['students'].loaded, 2)
+        self.assertEqual(results['students'].rejected, 1)
+        self.assertEqual(results['academics'].loaded, 2)
+        self.assertEqual(results['academics'].skipped, 1)
+        self.assertEqual(StudentExamData.objects.count(), 1)
+
+        student = Student.objects.get(student_id=1)
+        self.assertTrue(student.check_passcode('1234'))
+        self.assertIsNone(student.inter_marks)
+        self.assertEqual(User.objects.get(email='jane@test.com').user_id, 2)
+        self.assertIsNone(StudentAcademic.objects.get(student_id=2).marks)
+
+    def test_reload_skips_existing(self):
+        """Re-running the loader does not duplicate students"""
+        load_all(self.data_path, tables=['students'])
+        stats = load_all(self.data_path, tables=['students'])[0]
+        self.assertEqual(stats.loaded, 0)
+        self.assertEqual(stats.skipped, 2)
+        self.assertEqual(Student.objects.count(), 2)
+        # Bulk-inserted students still get their summary row
+        self.assertEqual(StudentPerformanceSummary.objects.count(), 2)
+
+    def test_loaded_counts_only_inserted_rows(self):
+        """Rows dropped as conflicts (here a duplicate email) are not reported as loaded"""
+        Student.objects.create(
+            student_id=50, first_name='J', last_name='D', email='john@test.com', gender='Male',
+            year_id=1, branch_id=1, sec_id=1, roll_no=150, phone_no='', passcode='x',
+        )
+        stats = load_all(self.data_path, tables=['students'])[0]
+        self.assertEqual(stats.loaded, 1)
+        self.assertFalse(Student.objects.filter(student_id=1).exists())
+
+    def test_fact_reload_loads_nothing(self):
+        """Fact rows that already exist are not reported as loaded again"""
+        load_all(self.data_path, tables=['students'])
+        self.assertEqual(load_all(self.data_path, tables=['academics'])[0].loaded, 2)
+        stats = load_all(self.data_path, tables=['academics'])[0]
+        self.assertEqual((stats.loaded, stats.skipped), (0, 1))
+        self.assertEqual(StudentAcademic.objects.count(), 2)
+
+    def _write_attendance(self, first_class):
+        header = 'student_id,year_id,branch_id,sec_id,sem_id,course_id,' + ','.join(str(i) for i in range(1, 51))
+        cells = [first_class, '0', '1'] + [''] * 47
+        (self.data_path / '11th_STUDENT_ATTENDANCE.csv').write_text(
+            header + '\n'
+            + '1,1,1,1,1,CS101,' + ','.join(cells) + '\n'
+            + '99,1,1,1,1,CS101,' + ','.join(cells) + '\n'
+        )
+
+    def test_attendance_upsert(self):
+        """Attendance rows are inserted once and updated in place on re-import"""
+        load_all(self.data_path, tables=['students'])
+        self._write_attendance('1')
+        stats = load_all(self.data_path, tables=['attendance'])[0]
+        self.assertEqual((stats.loaded, stats.updated, stats.skipped), (1, 0, 1))
+
+        self._write_attendance('0')
+        stats = load_all(self.data_path, tables=['attendance'])[0]
+        self.assertEqual((stats.loaded, stats.updated), (0, 1))
+
+        record = StudentAttendance.objects.get(student_id=1)
+        self.assertEqual(record.class_records[:4], [0, 0, 1, None])
+        self.assertEqual(len(record.class_records), 50)
+        self.assertEqual(StudentAttendance.objects.count(), 1)
+
+    def test_delta_import(self):
+        """A delta import applies only changed rows and deletes rows that left the export"""
+        load_all(self.data_path, tables=['students'])
+        stats = load_all(self.data_path, tables=['academics'], delta=True)[0]
+        self.assertEqual((stats.loaded, stats.updated, stats.deleted), (2, 0, 0))
+
+        (self.data_path / '2nd_STUD_ACAD.csv').write_text(
+            'student_id,sem_id,course_code,marks,attendance\n'
+            '1,1,CS101,85,90\n'
+        )
+        stats = load_all(self.data_path, tables=['academics'], delta=True)[0]
+        self.assertEqual((stats.loaded, stats.updated, stats.deleted, stats.unchanged), (0, 1, 1, 0))
+        self.assertEqual(StudentAcademic.objects.get(student_id=1).marks, 85)
+        self.assertFalse(StudentAcademic.objects.filter(student_id=2).exists())
+
+        stats = load_all(self.data_path, tables=['academics'], delta=True)[0]
+        self.assertEqual((stats.updated, stats.unchanged), (0, 1))
+
+    def _write_backlogs(self, count):
+        (self.data_path / '3rd_STUDENT_BACKLOGS.csv').write_text(
+            'student_id,sem_id,course_id\n' + ''.join(f'{1 + i % 2},1,CS{i:03}\n' for i in range(count))
+        )
+
+    def test_delta_delete_query_count(self):
+        """Rows leaving the export are deleted without a summary refresh per row"""
+        load_all(self.data_path, tables=['students'])
+        for count in (10, 40):
+            self._write_backlogs(count)
+            load_all(self.data_path, tables=['backlogs'], delta=True)
+            self._write_backlogs(0)
+            with self.assertNumQueries(26):
+                stats = load_all(self.data_path, tables=['backlogs'], delta=True)[0]
+            self.assertEqual(stats.deleted, count)
+        self.assertEqual(
+            list(StudentPerformanceSummary.objects.order_by('student_id').values_list('backlog_count', flat=True)),
+            [0, 0],
+        )
+
+    def test_chunked_load(self):
+        """Streaming in tiny chunks gives the same result as reading each file whole"""
+        results = {s.table: s for s in load_all(self.data_path, chunksize=1)}
+
+        self.assertEqual(results['students'].rows_read, 3)
+        self.assertEqual(results['students'].loaded, 2)
+        self.assertEqual(results['academics'].loaded, 2)
+        self.assertEqual(results['academics'].skipped, 1)
+        self.assertEqual(StudentExamData.objects.count(), 1)
+        self.assertGreater(results['academics'].peak_rss_mb, 0)
+
+    def test_chunks_look_up_only_their_own_keys(self):
+        """People chunks never read the whole profile or User table"""
+        with CaptureQueriesContext(connection) as queries:
+            load_all(self.data_path, tables=['students'], chunksize=1)
+        reads = [q['sql'] for q in queries if q['sql'].startswith('SELECT') and
+                 ('"students_student"' in q['sql'] or '"users_user"' in q['sql'])]
+        self.assertTrue(reads)
+        self.assertTrue(all(' WHERE ' in sql for sql in reads), reads)
+
+    @override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+    def test_synthetic_dataset_loads_cleanly(self):
+        """Every generated row matches the loader layouts: nothing is rejected or skipped"""
+        counts = generate_dataset(self.data_path, SyntheticSpec(students=24, branches=2, sections=1))
+        results = load_all(self.data_path)
+
+        self.assertEqual({s.table for s in results}, set(counts))
+        for stats in results:
+            self.assertEqual((stats.rejected, stats.skipped), (0, 0), stats.table)
+            self.assertEqual(stats.rows_read, counts[stats.table])
+        self.assertEqual(StudentAttendance.objects.count(), counts['attendance'])
+
+    def test_performance_summary_maintained(self):
+        """Imports refresh the summaries of touched students; single-row writes go through signals"""
+        self._write_attendance('1')
+        load_all(self.data_path)
+        summary = Student.objects.get(student_id=1).performance
+        self.assertEqual((summary.exam_count, summary.exam_total_marks, summary.cgpa), (1, 27, 9.0))
+        self.assertEqual((summary.total_classes, summary.present_count, summary.absent_count), (3, 2, 1))
+
+        backlog = StudentBacklog.objects.create(student_id=1, semester_id=1, course_id='CS101')
+        summary.refresh_from_db()
+        self.assertEqual(summary.backlog_count, 1)
+        backlog.delete()
+        summary.refresh_from_db()
+        self.assertEqual(summary.backlog_count, 0)
+
+        Student.objects.get(student_id=1).delete()
+        self.assertFalse(Student.objects.filter(student_id=1).exists())
+
+
+class CopyBackendTestCase(TestCase):
+    def setUp(self):
+        Student.objects.create(
+            student_id=1, first_name='S', last_name='1', email='s1@test.com', gender='Male',
+            year_id=1, branch_id=1, sec_id=1, roll_no=1, phone_no='', passcode='x',
+        )
+        self.backend = PostgresCopyBackend()
+
+    def _attendance(self, *rows):
+        columns = ['student_id', 'year_id', 'branch_id', 'section_id', 'semester_id', 'course_id', 'held_mask',
+                   'present_mask', 'record_length', 'total_classes', 'present_count', 'absent_count']
+        return pd.DataFrame([(1, 1, 1, 1, 1) + row for row in rows], columns=columns)
+
+    def test_merge_statements(self):
+        """Column list follows the frame; the conflict target and updates use db columns"""
+        q = connection.ops.quote_name
+        sql = self.backend.statements(
+            StudentAttendance, ['student_id', 'semester_id', 'course_id', 'held_mask'],
+            ['student', 'semester_id', 'course_id'], update_fields=['held_mask'],
+        )
+        columns = f"{q('student_id')}, {q('semester_id')}, {q('course_id')}, {q('held_mask')}"
+        staging = q('stage_students_studentattendance')
+        self.assertEqual(sql['copy'], f"COPY {staging} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')")
+        self.assertEqual(sql['merge'], (
+            f"INSERT INTO {q('students_studentattendance')} ({columns}) SELECT {columns} FROM {staging} "
+            f"ON CONFLICT ({q('student_id')}, {q('semester_id')}, {q('course_id')}) "
+            f"DO UPDATE SET {q('held_mask')} = EXCLUDED.{q('held_mask')}"
+        ))
+        sql = self.backend.statements(StudentBacklog, ['student_id', 'semester_id', 'course_id'],
+                                      ['student', 'semester_id', 'course_id'])
+        self.assertTrue(sql['merge'].endswith('DO NOTHING'))
+
+    @skipUnless(connection.vendor == 'postgresql', 'COPY needs PostgreSQL')
+    def test_copy_insert_skip_and_upsert(self):
+        backlogs = pd.DataFrame({'student_id': [1, 1], 'semester_id': [1, 1], 'course_id': ['CS101', 'CS102']})
+        unique = ['student', 'semester_id', 'course_id']
+        self.assertEqual(self.backend.write(StudentBacklog, backlogs, unique), 2)
+        # Existing keys are skipped, and a key repeated in the frame is sent once
+        again = pd.concat([backlogs, backlogs.iloc[[0]]])
+        self.assertEqual(self.backend.write(StudentBacklog, again, unique), 0)
+        self.assertEqual(StudentBacklog.objects.count(), 2)
+
+        fields = ['held_mask', 'present_mask', 'record_length', 'total_classes', 'present_count', 'absent_count']
+        self.backend.write(StudentAttendance, self._attendance(('CS101', 3, 1, 2, 2, 1, 1)), unique, fields)
+        self.backend.write(StudentAttendance, self._attendance(('CS101', 7, 7, 3, 3, 3, 0), ('CS102', 1, 0, 1, 1, 0, 1)),
+                           unique, fields)
+        row = StudentAttendance.objects.get(course_id='CS101')
+        self.assertEqual((row.held_mask, row.present_mask, row.present_count), (7, 7, 3))
+        self.assertEqual(StudentAttendance.objects.count(), 2)
+
+
+class CourseAttendanceTestCase(TestCase):
+    def setUp(self):
+        Student.objects.create(
+            student_id=1, first_name='S', last_name='1', email='s1@test.com', gender='Male',
+            year_id=1, branch_id=1, sec_id=1, roll_no=1, phone_no='', passcode='x',
+        )
+        StudentAttendance.objects.create(
+            student_id=1, year_id=1, branch_id=1, section_id=1, semester_id=1, course_id='CS101',
+            class_records=[1, 0, None, 1, 1, None],
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(email='s1@test.com', username='s1', role='student', user_id=1))
+
+    def test_counters_and_records_from_bitmaps(self):
+        course = self.client.get('/api/students/attendance/courses/').json()[0]
+        self.assertEqual((course['total_classes'], course['present'], course['absent']), (4, 3, 1))
+        self.assertEqual(course['attendance_percentage'], 75.0)
+        self.assertEqual(course['class_records'], [1, 0, None, 1, 1, None])
+
+        course = self.client.get('/api/students/attendance/courses/', {'records': 0}).json()[0]
+        self.assertNotIn('class_records', course)
+
+    def test_backfill_counters(self):
+        """Counters written around save() are restored from the bitmaps"""
+        StudentAttendance.objects.update(total_classes=0, present_count=0, absent_count=0)
+        call_command('backfill_attendance_counters', stdout=StringIO())
+        record = StudentAttendance.objects.get()
+        self.assertEqual((record.total_classes, record.present_count, record.absent_count), (4, 3, 1))
+        self.assertEqual(StudentPerformanceSummary.objects.get(student_id=1).total_classes, 4)
+
+
+class AttendanceShortfallTestCase(TestCase):
+    def setUp(self):
+        profile_cache.clear()
+        for student_id, records in ((1, [1, 0, None, 1, 1, None]), (2, [1, 1] + [0] * 8)):
+            Student.objects.create(
+                student_id=student_id, first_name='S', last_name=str(student_id), email=f's{student_id}@test.com',
+                gender='Male', year_id=1, branch_id=1, sec_id=1, roll_no=student_id, phone_no='', passcode='x',
+            )
+            StudentAttendance.objects.create(
+                student_id=student_id, year_id=1, branch_id=1, section_id=1, semester_id=1, course_id='CS101',
+                class_records=records,
+            )
+        ManagementEmployee.objects.create(
+            emp_id=9001, first_name='M', last_name='1', email='m1@test.com', gender='Female', designation='Dean',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(email='m1@test.com', username='m1', role='management', user_id=9001))
+
+    def test_projection(self):
+        """Exact at the threshold, and reachability against the remaining schedule"""
+        self.assertEqual(compute_snapshot(planned_classes=30, batch_size=1), 2)
+        on_track, behind = AttendanceShortfall.objects.order_by('student_id')
+        self.assertEqual((on_track.percentage, on_track.required_75, on_track.remaining_classes), (75.0, 0, 26))
+        # 2/10: (2 + 22) / (10 + 22) = 75%, (2 + 13) / (10 + 13) >= 65%, 20 classes left
+        self.assertEqual((behind.percentage, behind.required_75, behind.required_65), (20.0, 22, 13))
+        self.assertEqual((behind.remaining_classes, behind.reachable_75, behind.reachable_65), (20, False, True))
+
+        compute_snapshot()
+        self.assertEqual(AttendanceShortfall.objects.count(), 2)
+        self.assertTrue(AttendanceShortfall.objects.get(student_id=2).reachable_75)
+
+        # CSV rows span all 50 class columns; a shorter planned term still applies
+        StudentAttendance.objects.update(record_length=50)
+        compute_snapshot(planned_classes=20)
+        behind = AttendanceShortfall.objects.get(student_id=2)
+        self.assertEqual((behind.remaining_classes, behind.reachable_65), (10, False))
+
+    def test_management_filters_and_export(self):
+        compute_snapshot(planned_classes=30)
+        body = self.client.get('/api/management/attendance/shortfall/', {'section': 1}).json()
+        self.assertEqual([row['student_id'] for row in body['results']], [2])
+        self.assertEqual(body['count'], 1)
+
+        body = self.client.get('/api/management/attendance/shortfall/', {'below': 'false', 'page_size': 1}).json()
+        self.assertEqual([row['student_id'] for row in body['results']], [2])
+        body = self.client.get('/api/management/attendance/shortfall/', {'below': 'false', 'cursor': body['next_cursor']}).json()
+        self.assertEqual([row['student_id'] for row in body['results']], [1])
+
+        body = self.client.get('/api/management/attendance/shortfall/', {'threshold': 65, 'reachable': 'false'}).json()
+        self.assertEqual(body['results'], [])
+        self.assertEqual(self.client.get('/api/management/attendance/shortfall/', {'threshold': 50}).status_code, 400)
+
+        response = self.client.get('/api/management/attendance/shortfall/', {'export': 'csv'})
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertTrue(lines[0].startswith('student_id,roll_no,'))
+        self.assertEqual(len(lines), 2)
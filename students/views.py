@@ -2,14 +2,17 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from .models import Student, StudentAcademic, StudentBacklog, StudentExamData, StudentAttendance
+from .models import (
+    Student, StudentAcademic, StudentBacklog, StudentExamData, StudentAttendance, StudentPerformanceSummary,
+)
+from users.profiles import get_role_profile
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def student_profile(request):
     """Get student profile"""
     try:
-        student = Student.objects.get(email=request.user.email)
+        student = get_role_profile(request, Student)
         data = {
             'student_id': student.student_id,
             'first_name': student.first_name,
@@ -30,7 +33,7 @@ def student_profile(request):
 def student_academics(request):
     """Get student academic records"""
     try:
-        student = Student.objects.get(email=request.user.email)
+        student = get_role_profile(request, Student)
         academics = StudentAcademic.objects.filter(student=student)
         data = [{
             'semester_id': a.semester_id,
@@ -47,7 +50,7 @@ def student_academics(request):
 def student_backlogs(request):
     """Get student backlogs"""
     try:
-        student = Student.objects.get(email=request.user.email)
+        student = get_role_profile(request, Student)
         backlogs = StudentBacklog.objects.filter(student=student)
         data = [{
             'semester_id': b.semester_id,
@@ -62,7 +65,7 @@ def student_backlogs(request):
 def student_exam_data(request):
     """Get student mid exam marks, quiz marks, and assignment marks"""
     try:
-        student = Student.objects.get(email=request.user.email)
+        student = get_role_profile(request, Student)
         exam_data = StudentExamData.objects.filter(student=student).order_by('semester_id', '-mid_id', 'course_id')
         
         data = [{
@@ -84,17 +87,13 @@ def student_exam_data(request):
 def attendance_summary(request):
     """Get overall attendance summary for student"""
     try:
-        student = Student.objects.get(email=request.user.email)
-        attendance_records = StudentAttendance.objects.filter(student=student)
+        student = get_role_profile(request, Student)
+        # Totals over all courses are kept in the performance summary
+        summary = StudentPerformanceSummary.objects.filter(student=student).first()
         
-        total_classes = 0
-        total_present = 0
-        total_absent = 0
-        
-        for record in attendance_records:
-            total_classes += record.get_total_classes()
-            total_present += record.get_present_count()
-            total_absent += record.get_absent_count()
+        total_classes = summary.total_classes if summary else 0
+        total_present = summary.present_count if summary else 0
+        total_absent = summary.absent_count if summary else 0
         
         overall_percentage = 0
         if total_classes > 0:
@@ -114,10 +113,14 @@ def attendance_summary(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def course_attendance(request):
-    """Get course-wise attendance details for student"""
+    """
+    Get course-wise attendance details for student.
+    ?records=0 leaves out the per-class 'class_records' list.
+    """
     try:
-        student = Student.objects.get(email=request.user.email)
+        student = get_role_profile(request, Student)
         attendance_records = StudentAttendance.objects.filter(student=student).order_by('semester_id', 'course_id')
+        include_records = request.query_params.get('records') not in ('0', 'false')
         
         data = []
         for record in attendance_records:
@@ -150,8 +153,9 @@ def course_attendance(request):
                 'attendance_percentage': round(attendance_pct, 2),
                 'required_75': required_75,
                 'required_65': required_65,
-                'class_records': record.class_records,
             }
+            if include_records:
+                course_data['class_records'] = record.class_records
             data.append(course_data)
         
         return Response(data, status=status.HTTP_200_OK)
@@ -0,0 +1,90 @@
+"""
+Placement Eligibility Queries
+Turns recruiter criteria (CGPA, backlogs, attendance, SSC/inter cutoffs) into
+database filters over Student and its precomputed StudentPerformanceSummary,
+plus sort keys for keyset pagination and per-criterion match counts.
+
+Every student has a summary row (see StudentPerformanceSummary), so summary
+sort keys are the raw indexed columns, read through an inner join. Every sort
+key is backed by an index on (key, student_id) in students.models.
+"""
+from django.db.models import Count, F, FloatField, Q, Value
+from django.db.models.functions import Coalesce
+
+# Query parameter -> (field, lookup, type)
+CRITERIA = {
+    'min_cgpa': ('performance__cgpa', 'gte', float),
+    'max_backlogs': ('performance__backlog_count', 'lte', int),
+    'min_attendance': ('performance__attendance_percentage', 'gte', float),
+    'min_ssc_marks': ('ssc_marks', 'gte', float),
+    'min_inter_marks': ('inter_marks', 'gte', float),
+}
+
+# Sort parameter -> expression (nullable marks folded into -1 so keyset comparisons stay total;
+# the expression indexes on Student match these exactly)
+SORT_KEYS = {
+    'student_id': None,
+    'cgpa': F('performance__cgpa'),
+    'backlogs': F('performance__backlog_count'),
+    'attendance': F('performance__attendance_percentage'),
+    'ssc_marks': Coalesce('ssc_marks', Value(-1.0), output_field=FloatField()),
+    'inter_marks': Coalesce('inter_marks', Value(-1.0), output_field=FloatField()),
+}
+
+
+def parse_criteria(params):
+    """
+    Read the eligibility parameters present in `params` (a QueryDict).
+
+    Returns:
+        dict: parameter -> Q, in CRITERIA order
+
+    Raises:
+        ValueError: for a value that is not a number of the right type
+    """
+    criteria = {}
+    for name, (field, lookup, cast) in CRITERIA.items():
+        raw = params.get(name)
+        if raw in (None, ''):
+            continue
+        try:
+            value = cast(raw)
+        except ValueError:
+            raise ValueError(f'{name} must be a number')
+        criteria[name] = Q(**{f'{field}__{lookup}': value})
+    return criteria
+
+
+def apply_sort(queryset, sort):
+    """
+    Annotate `sort_key` for `sort` ('cgpa', '-cgpa', ... or 'student_id') and
+    return (queryset, keyset ordering). student_id breaks ties.
+
+    Raises:
+        ValueError: for an unknown sort key
+    """
+    descending = sort.startswith('-')
+    key = sort.lstrip('-')
+    if key not in SORT_KEYS:
+        raise ValueError(f"sort must be one of: {', '.join(SORT_KEYS)} (prefix '-' for descending)")
+    if SORT_KEYS[key] is None:
+        return queryset, ['-student_id' if descending else 'student_id']
+    if key in ('cgpa', 'backlogs', 'attendance'):
+        queryset = queryset.filter(performance__isnull=False)  # inner join: the index can supply the order
+    queryset = queryset.annotate(sort_key=SORT_KEYS[key])
+    return queryset, ['-sort_key' if descending else 'sort_key', 'student_id']
+
+
+def criteria_counts(scope, criteria):
+    """
+    One aggregate over `scope` (students matching year/branch/section): the
+    total, how many pass each criterion on its own, and how many pass all.
+    """
+    aggregates = {'total': Count('pk')}
+    for name, condition in criteria.items():
+        aggregates[name] = Count('pk', filter=condition)
+    combined = Q()
+    for condition in criteria.values():
+        combined &= condition
+    aggregates['matching'] = Count('pk', filter=combined) if criteria else Count('pk')
+    return scope.aggregate(**aggregates)
@@ -0,0 +1,14 @@
+"""
+Drop the cached TP cell statistics when the data behind them changes.
+"""
+from django.db.models.signals import post_delete, post_save
+
+from students.models import Student
+from students.performance import summaries_refreshed
+from .stats import invalidate_placement_stats
+
+# Exam and backlog figures: every single-row write and CSV import ends in refresh_summaries()
+summaries_refreshed.connect(invalidate_placement_stats, dispatch_uid='tpcell_stats_summaries')
+# Student totals
+post_save.connect(invalidate_placement_stats, sender=Student, dispatch_uid='tpcell_stats_student_save')
+post_delete.connect(invalidate_placement_stats, sender=Student, dispatch_uid='tpcell_stats_student_delete')
@@ -0,0 +1,67 @@
+"""
+TP Cell Placement Statistics
+All figures on the TP cell home page card come from one grouped query over
+Student joined to its precomputed StudentPerformanceSummary, broken down by
+(year, branch) and summed in Python for the overall totals.
+
+The result is cached for STATS_CACHE_TTL seconds under a generation number
+that is bumped whenever a performance summary is refreshed (exam/backlog/
+attendance writes, CSV imports, rebuilds) or a student is added or removed;
+see tpcell/signals.py. The number is stored in the database
+(utils/generations.py), so a write in any worker or command reaches every
+process within GENERATION_RECHECK_SECONDS.
+"""
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+
+from students.models import Student
+from students.performance import exam_cgpa
+from utils.generations import bump_generation, current_generation
+
+STATS_CACHE_KEY = 'tpcell:placement_stats'
+GENERATION = 'tpcell:placement_stats'
+STATS_CACHE_TTL = 60
+
+
+def _figures(total_students, students_with_backlogs, exam_total_marks, exam_count):
+    return {
+        'total_students': total_students,
+        'students_with_backlogs': students_with_backlogs,
+        # Eligible students = students without backlogs
+        'eligible_students': max(total_students - students_with_backlogs, 0),
+        # Average score across all students and exams, on a 10-point scale
+        'avg_cgpa': exam_cgpa(exam_total_marks, exam_count),
+    }
+
+
+def compute_placement_stats():
+    """Overall and per (year, branch) figures from a single aggregate query"""
+    groups = (
+        Student.objects.order_by()
+        .values('year_id', 'branch_id')
+        .annotate(
+            students=Count('pk'),
+            with_backlogs=Count('pk', filter=Q(performance__backlog_count__gt=0)),
+            exam_total_marks=Sum('performance__exam_total_marks'),
+            exam_count=Sum('performance__exam_count'),
+        )
+        .order_by('year_id', 'branch_id')
+    )
+    totals = [0, 0, 0, 0]
+    breakdown = []
+    for group in groups:
+        figures = (group['students'], group['with_backlogs'], group['exam_total_marks'] or 0, group['exam_count'] or 0)
+        totals = [total + value for total, value in zip(totals, figures)]
+        breakdown.append({'year_id': group['year_id'], 'branch_id': group['branch_id'], **_figures(*figures)})
+    return {**_figures(*totals), 'by_year_branch': breakdown}
+
+
+def placement_stats():
+    """Cached compute_placement_stats()"""
+    key = f"{STATS_CACHE_KEY}:{current_generation(GENERATION)}"
+    return cache.get_or_set(key, compute_placement_stats, STATS_CACHE_TTL)
+
+
+def invalidate_placement_stats(**kwargs):
+    """Drop the cached figures in every process (usable directly as a signal receiver)"""
+    bump_generation(GENERATION)
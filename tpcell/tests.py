@@ -0,0 +1,122 @@
+import json
+
+from django.core.cache import cache
+from django.db.models import F
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from students.models import Student, StudentBacklog, StudentPerformanceSummary
+from tpcell.models import TPCellEmployee
+from tpcell.stats import GENERATION
+from users.models import CacheGeneration, User
+from utils.generations import forget_generations
+
+
+class TPCellStudentsTestCase(TestCase):
+    def setUp(self):
+        for student_id in range(1, 8):
+            Student.objects.create(
+                student_id=student_id, first_name='S', last_name=str(student_id), email=f's{student_id}@college.edu',
+                gender='Male', year_id=1, branch_id=1 + student_id % 2, sec_id=1, roll_no=student_id,
+                phone_no='', passcode='x',
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(email='tp@tpcell.edu', username='tp', role='tpcell'))
+
+    def test_legacy_list(self):
+        response = self.client.get('/api/tpcell/students/', {'branch': 2})
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(sorted(row['id'] for row in data), [1, 3, 5, 7])
+        self.assertEqual(data[0]['cgpa'], 0.0)
+
+    def test_keyset_pages(self):
+        """Following next_cursor visits every student once, in student_id order"""
+        seen, cursor = [], None
+        while True:
+            params = {'page_size': 3, **({'cursor': cursor} if cursor else {})}
+            page = self.client.get('/api/tpcell/students/', params).json()
+            seen.extend(row['id'] for row in page['results'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        self.assertEqual(seen, list(range(1, 8)))
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/tpcell/students/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_ndjson_stream(self):
+        response = self.client.get('/api/tpcell/students/', {'stream': 1})
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], list(range(1, 8)))
+
+    def _summaries(self):
+        # Student 7 keeps the all-zero summary created with it (0 CGPA, 0 backlogs)
+        for student_id, cgpa, backlogs in [(1, 8.5, 0), (2, 6.0, 2), (3, 9.1, 0), (4, 7.2, 1), (5, 7.2, 0), (6, 5.0, 0)]:
+            StudentPerformanceSummary.objects.filter(student_id=student_id).update(cgpa=cgpa, backlog_count=backlogs)
+
+    def test_eligibility_filters_and_counts(self):
+        self._summaries()
+        data = self.client.get('/api/tpcell/students/', {'min_cgpa': 7, 'max_backlogs': 0}).json()
+        self.assertEqual([row['id'] for row in data['results']], [1, 3, 5])
+        self.assertEqual(data['counts'], {'total': 7, 'min_cgpa': 4, 'max_backlogs': 5, 'matching': 3})
+
+    def test_sort_pages_by_cgpa(self):
+        """Descending CGPA, ties broken on student_id, stable across cursor pages"""
+        self._summaries()
+        seen, cursor = [], None
+        while True:
+            params = {'sort': '-cgpa', 'page_size': 2, **({'cursor': cursor} if cursor else {})}
+            page = self.client.get('/api/tpcell/students/', params).json()
+            seen.extend(row['id'] for row in page['results'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        self.assertEqual(seen, [3, 1, 4, 5, 2, 6, 7])
+
+    def test_invalid_criteria(self):
+        self.assertEqual(self.client.get('/api/tpcell/students/', {'min_cgpa': 'high'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/tpcell/students/', {'sort': 'name'}).status_code, 400)
+
+
+@override_settings(GENERATION_RECHECK_SECONDS=60)
+class TPCellStatsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        forget_generations()
+        for student_id in range(1, 5):
+            Student.objects.create(
+                student_id=student_id, first_name='S', last_name=str(student_id), email=f's{student_id}@college.edu',
+                gender='Male', year_id=1, branch_id=1 + student_id % 2, sec_id=1, roll_no=student_id,
+                phone_no='', passcode='x',
+            )
+        StudentPerformanceSummary.objects.filter(student_id=1).update(exam_count=2, exam_total_marks=48, backlog_count=1)
+        StudentPerformanceSummary.objects.filter(student_id=2).update(exam_count=1, exam_total_marks=27)
+        TPCellEmployee.objects.create(emp_id=900, first_name='T', last_name='P', email='tp@tpcell.edu', passcode='x')
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(email='tp@tpcell.edu', username='tp', role='tpcell'))
+
+    def test_stats_and_breakdown(self):
+        data = self.client.get('/api/tpcell/stats/').json()
+        self.assertEqual((data['total_students'], data['students_with_backlogs'], data['eligible_students']), (4, 1, 3))
+        self.assertEqual(data['avg_cgpa'], 8.33)
+        self.assertEqual(
+            [(row['branch_id'], row['total_students'], row['students_with_backlogs']) for row in data['by_year_branch']],
+            [(1, 2, 0), (2, 2, 1)],
+        )
+
+    def test_cached_until_backlog_written(self):
+        self.client.get('/api/tpcell/stats/')
+        with self.assertNumQueries(1):  # employee lookup only
+            self.client.get('/api/tpcell/stats/')
+        StudentBacklog.objects.create(student_id=3, semester_id=1, course_id='C1')
+        self.assertEqual(self.client.get('/api/tpcell/stats/').json()['students_with_backlogs'], 2)
+
+    def test_invalidated_by_another_process(self):
+        """A write in another process (e.g. the CSV importer) bumps the stored generation"""
+        self.client.get('/api/tpcell/stats/')
+        StudentPerformanceSummary.objects.filter(student_id=2).update(backlog_count=1)
+        CacheGeneration.objects.filter(name=GENERATION).update(value=F('value') + 1)
+        with override_settings(GENERATION_RECHECK_SECONDS=0):
+            self.assertEqual(self.client.get('/api/tpcell/stats/').json()['students_with_backlogs'], 2)
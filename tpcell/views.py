@@ -3,35 +3,33 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from .models import TPCellEmployee
-from students.models import Student, StudentBacklog, StudentExamData
-from django.db.models import Q, Avg, Prefetch
+from users.profiles import get_role_profile
+from students.models import Student
+from students.performance import summary_or_default
+from utils.pagination import keyset_page
+from .eligibility import apply_sort, criteria_counts, parse_criteria
+from .stats import placement_stats
+from utils.streaming import stream_json_list, stream_ndjson
 import logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+STREAM_CHUNK_SIZE = 2000
+
+STUDENT_LIST_FIELDS = (
+    'student_id', 'first_name', 'last_name', 'email', 'roll_no', 'year_id', 'branch_id', 'sec_id',
+    'phone_no', 'performance__cgpa', 'performance__backlog_count',
+)
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def tpcell_profile(request):
     """Get TP Cell employee profile"""
-    emp = None
-    
-    # Try email lookup first
     try:
-        emp = TPCellEmployee.objects.get(email=request.user.email)
-        logger.info(f"✓ TP Cell Profile: Found employee by email: {request.user.email}")
+        emp = get_role_profile(request, TPCellEmployee)
     except TPCellEmployee.DoesNotExist:
-        logger.warning(f"⚠ TP Cell Profile: No employee with email '{request.user.email}'")
-        
-        # Fallback: Try user_id lookup (emp_id)
-        user_id = getattr(request.user, 'user_id', None)
-        if user_id:
-            try:
-                emp = TPCellEmployee.objects.get(emp_id=user_id)
-                logger.info(f"✓ TP Cell Profile: Found employee by emp_id: {user_id}")
-            except TPCellEmployee.DoesNotExist:
-                logger.error(f"✗ TP Cell Profile: No employee with emp_id {user_id}")
-    
-    if not emp:
         error_msg = f"Employee not found for user {request.user.email} (user_id: {getattr(request.user, 'user_id', 'None')})"
         logger.error(f"✗ {error_msg}")
         return Response({'error': error_msg}, status=status.HTTP_404_NOT_FOUND)
@@ -47,10 +45,48 @@ def tpcell_profile(request):
     return Response(data, status=status.HTTP_200_OK)
 
 
+def _student_row(student):
+    """Listing entry for one Student .values() row (see STUDENT_LIST_FIELDS)"""
+    return {
+        'id': student['student_id'],
+        'name': f"{student['first_name']} {student['last_name']}",
+        'email': student['email'],
+        'roll_no': student['roll_no'],
+        'year_id': student['year_id'],
+        'branch_id': student['branch_id'],
+        'section_id': student['sec_id'],
+        'phone_no': student['phone_no'] or '',
+        'cgpa': summary_or_default(student, 'cgpa'),
+        'backlogs': summary_or_default(student, 'backlog_count'),
+    }
+
+
+def _positive_int(value, default, maximum):
+    if value in (None, ''):
+        return default
+    number = int(value)
+    if number < 1:
+        raise ValueError('must be positive')
+    return min(number, maximum)
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def tpcell_get_students(request):
-    """Get all students with optional filtering by year, branch, and section"""
+    """
+    Get all students with optional filtering by year, branch, and section.
+
+    Placement criteria (evaluated in the database, see tpcell/eligibility.py):
+        min_cgpa, max_backlogs, min_attendance, min_ssc_marks, min_inter_marks
+        sort=cgpa|backlogs|attendance|ssc_marks|inter_marks|student_id ('-' = descending)
+
+    Response modes:
+        (default)            JSON list of every match, streamed row by row
+        ?page_size=&cursor=  {'results': [...], 'next_cursor': ..., 'page_size': n,
+                              'counts': {...}}, keyset-paginated on the sort key;
+                             also used whenever criteria or sort are given
+        ?stream=1            NDJSON, one student per line, for full-cohort exports
+    """
     try:
         # Get filter parameters
         year = request.query_params.get('year')
@@ -70,39 +106,43 @@ def tpcell_get_students(request):
         if section and section != 'all':
             students_qs = students_qs.filter(sec_id=int(section))
         
-        # Get backlogs count and CGPA for each student
-        students_data = []
-        for student in students_qs:
-            backlogs_count = StudentBacklog.objects.filter(student_id=student.student_id).count()
-            
-            # Calculate CGPA from exam data if available
-            exam_records = StudentExamData.objects.filter(student_id=student.student_id)
-            cgpa = 0.0
-            if exam_records.exists():
-                total_marks = 0
-                total_records = 0
-                for exam in exam_records:
-                    total_marks += exam.mid_marks + exam.quiz_marks + exam.assignment_marks
-                    total_records += 1
-                # Convert to 10-point scale (max total = 30 per exam)
-                if total_records > 0:
-                    cgpa = round((total_marks / (total_records * 30)) * 10, 2)
-            
-            students_data.append({
-                'id': student.student_id,
-                'name': f"{student.first_name} {student.last_name}",
-                'email': student.email,
-                'roll_no': student.roll_no,
-                'year_id': student.year_id,
-                'branch_id': student.branch_id,
-                'section_id': student.sec_id,
-                'phone_no': student.phone_no or '',
-                'cgpa': cgpa,
-                'backlogs': backlogs_count,
-            })
+        try:
+            criteria = parse_criteria(request.query_params)
+            sort = request.query_params.get('sort') or 'student_id'
+            matching = students_qs.filter(*criteria.values())
+            # CGPA and backlog count come from the precomputed performance summary
+            rows, ordering = apply_sort(matching.values(*STUDENT_LIST_FIELDS), sort)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
-        logger.info(f"✓ TP Cell: Retrieved {len(students_data)} students with filters (year={year}, branch={branch}, section={section})")
-        return Response(students_data, status=status.HTTP_200_OK)
+        if request.query_params.get('stream') in ('1', 'true'):
+            logger.info(f"✓ TP Cell: Streaming students as NDJSON (year={year}, branch={branch}, section={section})")
+            return stream_ndjson(
+                _student_row(student)
+                for student in rows.order_by(*ordering).iterator(chunk_size=STREAM_CHUNK_SIZE)
+            )
+        
+        cursor = request.query_params.get('cursor')
+        if cursor or criteria or any(request.query_params.get(p) for p in ('page_size', 'sort')):
+            try:
+                page_size = _positive_int(request.query_params.get('page_size'), DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+                page, next_cursor = keyset_page(rows, ordering, cursor=cursor, page_size=page_size)
+            except ValueError as e:
+                return Response({'error': f'Invalid pagination parameters: {e}'}, status=status.HTTP_400_BAD_REQUEST)
+            return Response({
+                'results': [_student_row(student) for student in page],
+                'next_cursor': next_cursor,
+                'page_size': page_size,
+                'counts': criteria_counts(students_qs, criteria),
+            }, status=status.HTTP_200_OK)
+        
+        def done(count):
+            logger.info(f"✓ TP Cell: Retrieved {count} students with filters (year={year}, branch={branch}, section={section})")
+        
+        return stream_json_list(
+            (_student_row(student) for student in rows.iterator(chunk_size=STREAM_CHUNK_SIZE)),
+            on_complete=done,
+        )
     
     except Exception as e:
         logger.error(f"✗ Error retrieving TP Cell students: {str(e)}")
@@ -113,58 +153,16 @@ def tpcell_get_students(request):
 @permission_classes([IsAuthenticated])
 def tpcell_stats(request):
     """Get TP Cell placement and student statistics"""
-    emp = None
-    
-    # Try email lookup first
     try:
-        emp = TPCellEmployee.objects.get(email=request.user.email)
-        logger.info(f"✓ TP Cell Stats: Found employee by email: {request.user.email}")
+        emp = get_role_profile(request, TPCellEmployee)
     except TPCellEmployee.DoesNotExist:
-        logger.warning(f"⚠ TP Cell Stats: No employee with email '{request.user.email}'")
-        
-        # Fallback: Try user_id lookup (emp_id)
-        user_id = getattr(request.user, 'user_id', None)
-        if user_id:
-            try:
-                emp = TPCellEmployee.objects.get(emp_id=user_id)
-                logger.info(f"✓ TP Cell Stats: Found employee by emp_id: {user_id}")
-            except TPCellEmployee.DoesNotExist:
-                logger.error(f"✗ TP Cell Stats: No employee with emp_id {user_id}")
-    
-    if not emp:
         error_msg = f"Employee not found for user {request.user.email} (user_id: {getattr(request.user, 'user_id', 'None')})"
         logger.error(f"✗ {error_msg}")
         return Response({'error': error_msg}, status=status.HTTP_404_NOT_FOUND)
         
     try:
-        # Calculate statistics
-        total_students = Student.objects.count()
-        
-        # Students with backlogs
-        students_with_backlogs = StudentBacklog.objects.values('student_id').distinct().count()
-        
-        # Calculate average CGPA from exam data
-        exam_data = StudentExamData.objects.all()
-        avg_cgpa = 0.0
-        
-        if exam_data.exists():
-            # Calculate average score across all students and exams
-            all_marks = exam_data.values_list('mid_marks', 'quiz_marks', 'assignment_marks')
-            if all_marks:
-                total_marks = sum([m[0] + m[1] + m[2] for m in all_marks])
-                avg_cgpa = (total_marks / (len(all_marks) * 30)) * 10  # Convert to 10-point scale
-        
-        # Eligible students = total - students with backlogs
-        eligible_students = total_students - students_with_backlogs
-        if eligible_students < 0:
-            eligible_students = 0
-        
-        data = {
-            'total_students': total_students,
-            'students_with_backlogs': students_with_backlogs,
-            'eligible_students': eligible_students,
-            'avg_cgpa': round(avg_cgpa, 2),
-        }
+        # One grouped aggregate over the performance summaries, cached briefly
+        data = placement_stats()
         
         logger.info(f"✓ TP Cell Stats calculated successfully for {emp.emp_id}")
         return Response(data, status=status.HTTP_200_OK)
@@ -0,0 +1,64 @@
+"""
+JWT Authentication
+Access tokens issued by users.views.login carry the caller's email, role and
+profile id (User.user_id) as claims, so API requests are authenticated from
+the verified token alone, without loading the User row.
+
+- StatelessJWTAuthentication (default): request.user is a ClaimsUser built
+  from the token. Tokens issued before these claims existed fall back to the
+  database lookup.
+- StrictJWTAuthentication (opt-in per view, via @authentication_classes):
+  loads the live User row and rejects the token when the account is inactive
+  or its role/profile id no longer match the claims.
+"""
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# simplejwt's own 'user_id' claim holds User.pk, so User.user_id travels as 'profile_id'
+TOKEN_CLAIMS = {'email': 'email', 'role': 'role', 'profile_id': 'user_id'}
+
+
+def issue_tokens(user):
+    """RefreshToken for `user` with the identity claims (access tokens copy them)"""
+    refresh = RefreshToken.for_user(user)
+    for claim, attr in TOKEN_CLAIMS.items():
+        refresh[claim] = getattr(user, attr)
+    return refresh
+
+
+class ClaimsUser(TokenUser):
+    """Authenticated user backed only by a validated token's claims"""
+
+    @property
+    def email(self):
+        return self.token['email']
+
+    @property
+    def role(self):
+        return self.token['role']
+
+    @property
+    def user_id(self):
+        return self.token['profile_id']
+
+    def __str__(self):
+        return f"{self.email} ({self.role})"
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if all(claim in validated_token for claim in TOKEN_CLAIMS):
+            return ClaimsUser(validated_token)
+        return super().get_user(validated_token)
+
+
+class StrictJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)  # raises for missing or inactive users
+        for claim, attr in TOKEN_CLAIMS.items():
+            if claim in validated_token and validated_token[claim] != getattr(user, attr):
+                raise AuthenticationFailed(_('Token identity no longer matches the user'), code='identity_changed')
+        return user
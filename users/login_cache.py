@@ -0,0 +1,51 @@
+"""
+Unknown Login Cache
+Remembers (email, role) pairs that recently matched no User, so repeated
+attempts against accounts that don't exist (bots, typos) skip the database.
+Entries expire after LOGIN_NEGATIVE_CACHE_TTL seconds and the cache holds at
+most LOGIN_NEGATIVE_CACHE_SIZE pairs per process.
+
+Creating users invalidates it: single saves through users.signals, bulk
+creation (CSV loaders, audit_identity --fix) by calling forget_unknown_logins().
+Entries are keyed on a generation counter stored in the database
+(utils/generations.py), so a bump from any process, including a management
+command, invalidates every web worker's entries within
+GENERATION_RECHECK_SECONDS; the value is remembered in-process in between.
+"""
+from django.conf import settings
+
+from utils.generations import bump_generation, current_generation
+from utils.ttl_cache import TTLCache
+
+GENERATION = 'users:unknown_logins'
+
+unknown_logins = TTLCache(
+    maxsize=getattr(settings, 'LOGIN_NEGATIVE_CACHE_SIZE', 10000),
+    ttl=getattr(settings, 'LOGIN_NEGATIVE_CACHE_TTL', 120),
+)
+
+
+def unknown_login_key(email, role):
+    """Cache key for (email, role) under the current generation"""
+    return current_generation(GENERATION), email, role
+
+
+def is_unknown_login(key):
+    """True when the key's (email, role) matched no User within the TTL"""
+    return unknown_logins.get(key, False)
+
+
+def remember_unknown_login(key):
+    unknown_logins.set(key, True)
+
+
+def forget_unknown_logins():
+    """Invalidate every remembered miss, in this process and (via the generation) all others"""
+    bump_generation(GENERATION)
+    unknown_logins.clear()
+
+
+def user_saved(sender, instance, created=False, update_fields=None, **kwargs):
+    """post_save receiver: a new User, or a changed email/role, may turn a miss into a match"""
+    if created or update_fields is None or {'email', 'role'} & set(update_fields):
+        forget_unknown_logins()
@@ -0,0 +1,198 @@
+"""
+Audit (and optionally repair) the User <-> profile identity mapping.
+
+Every check is set-based: per role, one query joins User to its profile table
+by email and one finds profiles without a User, so the audit costs a handful
+of queries regardless of how many accounts exist.
+
+Mismatch classes:
+    null_user_id      User.user_id is empty but a profile has the same email
+    no_profile        no profile of the user's role has the user's email
+    user_id_mismatch  user_id differs from the id of the profile with that email
+    orphan_profile    profile whose email has no User
+
+Usage:
+    python manage.py audit_identity
+    python manage.py audit_identity --fix
+    python manage.py audit_identity --show 50
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q, Subquery
+
+from users.login_cache import forget_unknown_logins
+from users.models import User
+from users.profiles import ROLE_PROFILE_MODELS, profile_id_field
+from utils.password_utils import hash_passwords, is_password_hashed
+
+ISSUE_CLASSES = ['null_user_id', 'no_profile', 'user_id_mismatch', 'orphan_profile']
+
+
+def user_issues(role, model):
+    """
+    Users of `role` that are not cleanly linked to their profile, as dicts
+    with pk, email, user_id and profile_id (the id of the profile with that email).
+    """
+    profile_id = Subquery(
+        model.objects.filter(email=OuterRef('email')).values(profile_id_field(model))[:1]
+    )
+    return list(
+        User.objects.filter(role=role)
+        .annotate(profile_id=profile_id)
+        .filter(
+            Q(user_id__isnull=True) | Q(profile_id__isnull=True)
+            | (~Q(user_id=F('profile_id')) & Q(user_id__isnull=False))
+        )
+        .values('pk', 'email', 'user_id', 'profile_id')
+    )
+
+
+def orphan_profiles(model):
+    """Profiles whose email has no User account"""
+    id_field = profile_id_field(model)
+    return list(
+        model.objects.filter(~Exists(User.objects.filter(email=OuterRef('email'))))
+        .values(id_field, 'email', 'first_name', 'last_name', 'passcode')
+        .order_by(id_field)
+    )
+
+
+def classify(row):
+    if row['profile_id'] is None:
+        return 'no_profile'
+    if row['user_id'] is None:
+        return 'null_user_id'
+    return 'user_id_mismatch'
+
+
+class Command(BaseCommand):
+    help = 'Find User/profile identity mismatches with set-based queries; --fix repairs them in bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fix', action='store_true',
+                            help='Relink user_id values and create Users for orphan profiles')
+        parser.add_argument('--show', type=int, default=10,
+                            help='Example rows printed per mismatch class')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        findings = {}
+        for role, model in ROLE_PROFILE_MODELS.items():
+            issues = {name: [] for name in ISSUE_CLASSES}
+            for row in user_issues(role, model):
+                issues[classify(row)].append(row)
+            issues['orphan_profile'] = orphan_profiles(model)
+            findings[role] = issues
+
+        self._report(findings, options['show'])
+        self.stdout.write(f"Audit finished in {time.perf_counter() - start:.2f}s")
+
+        if options['fix']:
+            relinked, conflicts = self._relink(findings)
+            created = self._create_users(findings)
+            self.stdout.write(self.style.SUCCESS(
+                f"Fixed: {relinked} user_id values relinked, {created} Users created for orphan profiles"
+            ))
+            if conflicts:
+                self.stdout.write(self.style.WARNING(
+                    f"{conflicts} user_id values left unchanged: the id is held by a correctly linked "
+                    f"account of another role (User.user_id is unique across roles)"
+                ))
+            if any(issues['no_profile'] for issues in findings.values()):
+                self.stdout.write(self.style.WARNING(
+                    'Users without a profile need a profile import (load_academia_data) or manual review'
+                ))
+
+    def _report(self, findings, show):
+        self.stdout.write('=' * 80)
+        self.stdout.write(f"{'role':<12}" + ''.join(f"{name:>18}" for name in ISSUE_CLASSES))
+        for role, issues in findings.items():
+            self.stdout.write(f"{role:<12}" + ''.join(f"{len(issues[name]):>18}" for name in ISSUE_CLASSES))
+        self.stdout.write('=' * 80)
+
+        for role, issues in findings.items():
+            id_field = profile_id_field(ROLE_PROFILE_MODELS[role])
+            for name in ISSUE_CLASSES:
+                rows = issues[name]
+                if not rows or show <= 0:
+                    continue
+                self.stdout.write(f"\n{role} / {name} ({len(rows)}):")
+                for row in rows[:show]:
+                    if name == 'orphan_profile':
+                        self.stdout.write(f"  ❌ {row['email']} ({id_field}={row[id_field]})")
+                    else:
+                        self.stdout.write(
+                            f"  ❌ {row['email']} (user_id={row['user_id']}, profile {id_field}={row['profile_id']})"
+                        )
+        total = sum(len(rows) for issues in findings.values() for rows in issues.values())
+        style = self.style.SUCCESS if total == 0 else self.style.WARNING
+        self.stdout.write(style(f"\nTotal issues: {total}"))
+
+    def _relink(self, findings):
+        """Point user_id at the profile with the user's email (two bulk updates)"""
+        targets = {}
+        for issues in findings.values():
+            for row in issues['null_user_id'] + issues['user_id_mismatch']:
+                targets[row['pk']] = row['profile_id']
+        if not targets:
+            return 0, 0
+
+        # Ids held by accounts outside the fix set cannot be reassigned; an
+        # account whose own fix is blocked keeps its id, which blocks others in turn
+        current = dict(User.objects.filter(pk__in=targets.keys()).values_list('pk', 'user_id'))
+        held = set(
+            User.objects.filter(user_id__in=set(targets.values()))
+            .exclude(pk__in=targets.keys())
+            .values_list('user_id', flat=True)
+        )
+        assignable = dict(targets)
+        while True:
+            blocked = [pk for pk, target in assignable.items() if target in held]
+            if not blocked:
+                break
+            for pk in blocked:
+                del assignable[pk]
+                if current[pk] is not None:
+                    held.add(current[pk])
+        with transaction.atomic():
+            # Release the old ids first so swapped ids never collide mid-update
+            User.objects.filter(pk__in=assignable.keys()).update(user_id=None)
+            users = [User(pk=pk, user_id=target) for pk, target in assignable.items()]
+            User.objects.bulk_update(users, ['user_id'], batch_size=1000)
+        return len(assignable), len(targets) - len(assignable)
+
+    def _create_users(self, findings):
+        """Create login accounts for orphan profiles, reusing the profile passcode"""
+        orphans = []
+        for role, issues in findings.items():
+            id_field = profile_id_field(ROLE_PROFILE_MODELS[role])
+            orphans.extend((role, row[id_field], row) for row in issues['orphan_profile'])
+        if not orphans:
+            return 0
+
+        plain = [row['passcode'] for _, _, row in orphans if not is_password_hashed(row['passcode'])]
+        hashed = iter(hash_passwords(plain))
+        taken_ids = set(User.objects.filter(user_id__in=[pid for _, pid, _ in orphans])
+                        .values_list('user_id', flat=True))
+        usernames = [row['email'].split('@')[0][:30] for _, _, row in orphans]
+        taken_usernames = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+
+        users = []
+        for (role, profile_id, row), username in zip(orphans, usernames):
+            password = row['passcode'] if is_password_hashed(row['passcode']) else next(hashed)
+            if username in taken_usernames:
+                username = row['email'][:150]
+            taken_usernames.add(username)
+            users.append(User(
+                email=row['email'], username=username, role=role,
+                first_name=row['first_name'][:30], last_name=row['last_name'][:30],
+                user_id=None if profile_id in taken_ids else profile_id,
+                password=password,
+            ))
+            taken_ids.add(profile_id)
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=1000)
+        forget_unknown_logins()
+        return len(users)
@@ -0,0 +1,63 @@
+"""
+Fill in missing User.user_id values from the profile with the same email.
+
+One joined UPDATE ... FROM per role, all inside a single transaction. Ids that
+already belong to another account are left alone (User.user_id is unique);
+`audit_identity` reports those.
+
+Usage:
+    python manage.py backfill_user_ids
+    python manage.py backfill_user_ids --dry-run    # run the updates, report counts, roll back
+"""
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from users.models import User
+from users.profiles import ROLE_PROFILE_MODELS
+
+
+def backfill_sql(model):
+    """UPDATE ... FROM joining users to `model` on email, for users of one role without a user_id"""
+    quote = connection.ops.quote_name
+    user_table = quote(User._meta.db_table)
+    profile_table = quote(model._meta.db_table)
+    user_id = quote(User._meta.get_field('user_id').column)
+    profile_pk = quote(model._meta.pk.column)
+    return (
+        f"UPDATE {user_table} SET {user_id} = p.{profile_pk} "
+        f"FROM {profile_table} p "
+        f"WHERE {user_table}.{quote('role')} = %s "
+        f"AND {user_table}.{user_id} IS NULL "
+        f"AND {user_table}.{quote('email')} = p.{quote('email')} "
+        f"AND NOT EXISTS (SELECT 1 FROM {user_table} taken WHERE taken.{user_id} = p.{profile_pk})"
+    )
+
+
+class Command(BaseCommand):
+    help = 'Backfill User.user_id from profile emails with one UPDATE ... FROM per role'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Report how many users would be updated without saving anything')
+
+    def handle(self, *args, **options):
+        missing = User.objects.filter(role__in=ROLE_PROFILE_MODELS, user_id__isnull=True).count()
+        self.stdout.write(f"Users without user_id: {missing}")
+
+        updated = {}
+        with transaction.atomic(), connection.cursor() as cursor:
+            for role, model in ROLE_PROFILE_MODELS.items():
+                cursor.execute(backfill_sql(model), [role])
+                updated[role] = cursor.rowcount
+            if options['dry_run']:
+                transaction.set_rollback(True)
+
+        for role, count in updated.items():
+            self.stdout.write(f"  {role:<12} {count:>8}")
+        total = sum(updated.values())
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f"DRY RUN: {total} users would be updated (rolled back)"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Updated {total} users"))
+        if missing - total:
+            self.stdout.write(f"{missing - total} users still without user_id (run audit_identity for details)")
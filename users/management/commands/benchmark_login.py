@@ -0,0 +1,101 @@
+"""
+Measure login throughput per worker process for each password hasher.
+
+Each candidate hasher gets a throwaway User (inside a rolled-back
+transaction) and `--logins` sequential POSTs through users.views.login, so
+the figures include the User query and token issue, not only the hash
+verify. A login is one CPU-bound request, so capacity scales with worker
+processes: logins/s per worker x workers.
+
+Usage:
+    python manage.py benchmark_login
+    python manage.py benchmark_login --pbkdf2-iterations 100000,300000,600000
+    python manage.py benchmark_login --hashers django.contrib.auth.hashers.ScryptPasswordHasher
+    python manage.py benchmark_login --peak-logins 5000 --window-minutes 10
+"""
+import math
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+
+from users.models import User
+from users.views import login
+from utils.hashers import HASHER_PROFILES, TUNABLE_PBKDF2
+
+BENCHMARK_EMAIL = 'benchmark-login@example.invalid'
+BENCHMARK_PASSWORD = 'benchmark-password'
+
+
+class Command(BaseCommand):
+    help = 'Time users.views.login for each password hasher and estimate workers needed for a login peak'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=20,
+                            help='Logins timed per hasher')
+        parser.add_argument('--hashers', default='',
+                            help='Comma-separated hasher paths (default: every profile in utils/hashers.py)')
+        parser.add_argument('--pbkdf2-iterations', default='',
+                            help='Comma-separated PBKDF2 iteration counts to compare (default: the configured one)')
+        parser.add_argument('--peak-logins', type=int, default=0,
+                            help='Logins expected in the peak window, to size worker count')
+        parser.add_argument('--window-minutes', type=float, default=10.0,
+                            help='Length of the peak window')
+
+    def handle(self, *args, **options):
+        if User.objects.filter(email=BENCHMARK_EMAIL).exists():
+            raise CommandError(f'{BENCHMARK_EMAIL} already exists; remove it before benchmarking')
+        try:
+            iteration_counts = [int(n) for n in options['pbkdf2_iterations'].split(',') if n.strip()]
+        except ValueError:
+            raise CommandError('--pbkdf2-iterations must be a comma-separated list of integers')
+        iteration_counts = iteration_counts or [settings.PASSWORD_PBKDF2_ITERATIONS]
+        hashers = [h.strip() for h in options['hashers'].split(',') if h.strip()] or list(HASHER_PROFILES.values())
+
+        candidates = []
+        for path in hashers:
+            if path == TUNABLE_PBKDF2:
+                candidates += [(f'pbkdf2_sha256 x{n}', path, n) for n in iteration_counts]
+            else:
+                candidates.append((path.rsplit('.', 1)[-1], path, settings.PASSWORD_PBKDF2_ITERATIONS))
+
+        self.stdout.write(f"Active profile: {settings.PASSWORD_HASHER_PROFILE} | logins per hasher: {options['logins']}")
+        self.stdout.write(f"{'hasher':<32} {'ms/login':>10} {'logins/s/worker':>16} {'workers':>8}")
+        peak_rate = options['peak_logins'] / (options['window_minutes'] * 60) if options['peak_logins'] else 0
+        for label, path, iterations in candidates:
+            with override_settings(PASSWORD_HASHERS=[path], PASSWORD_PBKDF2_ITERATIONS=iterations):
+                try:
+                    make_password(BENCHMARK_PASSWORD)
+                except ValueError:  # e.g. argon2-cffi / bcrypt not installed
+                    self.stdout.write(f"{label:<32} {'skipped (library not installed)':>36}")
+                    continue
+                seconds = self._time_logins(options['logins'])
+            per_login = seconds / options['logins']
+            rate = 1 / per_login if per_login else 0.0
+            workers = math.ceil(peak_rate / rate) if peak_rate and rate else ''
+            self.stdout.write(f"{label:<32} {per_login * 1000:>10.1f} {rate:>16.1f} {workers:>8}")
+        if peak_rate:
+            self.stdout.write(f"'workers' = processes needed for {options['peak_logins']} logins "
+                              f"in {options['window_minutes']:g} minutes ({peak_rate:.1f}/s)")
+
+    def _time_logins(self, count):
+        """Seconds for `count` successful logins of a temporary user; nothing is kept"""
+        factory = APIRequestFactory()
+        payload = {'email': BENCHMARK_EMAIL, 'password': BENCHMARK_PASSWORD, 'role': 'student'}
+        with transaction.atomic():
+            User.objects.create(
+                email=BENCHMARK_EMAIL, username=BENCHMARK_EMAIL, role='student',
+                password=make_password(BENCHMARK_PASSWORD),
+            )
+            start = time.perf_counter()
+            for _ in range(count):
+                response = login(factory.post('/api/users/login/', payload, format='json'))
+                if response.status_code != 200:
+                    raise CommandError(f'Benchmark login failed: {response.data}')
+            seconds = time.perf_counter() - start
+            transaction.set_rollback(True)
+        return seconds
@@ -0,0 +1,45 @@
+"""
+Measure bulk password hashing throughput at different process-pool sizes.
+
+Usage:
+    python manage.py benchmark_password_hashing
+    python manage.py benchmark_password_hashing --count 500 --workers 1,2,4,8
+"""
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.password_utils import default_hash_workers, hash_passwords
+
+
+class Command(BaseCommand):
+    help = 'Compare hash_passwords throughput at 1, 4 and N (= CPU cores) workers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=200,
+                            help='Passwords hashed per run')
+        parser.add_argument('--workers', default='',
+                            help='Comma-separated worker counts (default: 1,4,N)')
+
+    def handle(self, *args, **options):
+        cores = default_hash_workers()
+        try:
+            worker_counts = [int(w) for w in options['workers'].split(',') if w.strip()]
+        except ValueError:
+            raise CommandError('--workers must be a comma-separated list of integers')
+        worker_counts = worker_counts or sorted({1, 4, cores})
+        plain = [f"{1000 + i}" for i in range(options['count'])]
+
+        self.stdout.write(f"Hasher: {settings.PASSWORD_HASHERS[0]}")
+        self.stdout.write(f"CPU cores: {cores} | passwords per run: {len(plain)}")
+        self.stdout.write(f"{'workers':>8} {'seconds':>10} {'hashes/s':>12} {'speedup':>8}")
+
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            hash_passwords(plain, workers=workers)
+            seconds = time.perf_counter() - start
+            rate = len(plain) / seconds if seconds else 0.0
+            baseline = baseline or rate
+            self.stdout.write(f"{workers:>8} {seconds:>10.2f} {rate:>12.1f} {rate / baseline:>7.2f}x")
@@ -0,0 +1,96 @@
+"""
+Hash every plain text passcode left in the profile tables.
+
+Only unhashed rows are selected (prefix filters run in SQL), each chunk is
+hashed in parallel and written back with one bulk_update. After every chunk
+the last primary key is saved to a checkpoint file, so an interrupted run
+continues where it stopped.
+
+Usage:
+    python manage.py rehash_passcodes
+    python manage.py rehash_passcodes --dry-run
+    python manage.py rehash_passcodes --chunk-size 2000 --workers 8
+    python manage.py rehash_passcodes --reset      # ignore a stale checkpoint
+"""
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from students.models import Student
+from faculty.models import Faculty
+from management.models import ManagementEmployee
+from tpcell.models import TPCellEmployee
+from utils.password_utils import hash_passwords, unhashed_password_filter
+
+PROFILE_MODELS = [Student, Faculty, ManagementEmployee, TPCellEmployee]
+
+
+class Command(BaseCommand):
+    help = 'Hash plain text passcodes in parallel chunks, resumable via a keyset checkpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000,
+                            help='Rows hashed and written per transaction')
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Hashing processes (default: CPU cores)')
+        parser.add_argument('--checkpoint', default=str(Path(settings.BASE_DIR) / '.rehash_checkpoint.json'),
+                            help='File recording the last processed primary key per table')
+        parser.add_argument('--reset', action='store_true',
+                            help='Discard the checkpoint and scan from the beginning')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only report how many passcodes are still unhashed')
+
+    def handle(self, *args, **options):
+        checkpoint_path = Path(options['checkpoint'])
+        checkpoint = {}
+        if checkpoint_path.exists() and not options['reset']:
+            checkpoint = json.loads(checkpoint_path.read_text())
+            self.stdout.write(f"Resuming from checkpoint {checkpoint_path}")
+
+        self.stdout.write('=' * 80)
+        self.stdout.write('HASHING PLAIN TEXT PASSCODES')
+        self.stdout.write('=' * 80)
+
+        for idx, model in enumerate(PROFILE_MODELS, start=1):
+            label = model._meta.label
+            pending = model.objects.filter(unhashed_password_filter())
+            last_pk = checkpoint.get(label)
+            if last_pk is not None:
+                pending = pending.filter(pk__gt=last_pk)
+
+            remaining = pending.count()
+            self.stdout.write(f"\n[{idx}/{len(PROFILE_MODELS)}] {label}: {remaining} unhashed")
+            if options['dry_run'] or not remaining:
+                continue
+
+            hashed_count = 0
+            while True:
+                rows = list(pending.order_by('pk').only('pk', 'passcode')[:options['chunk_size']])
+                if not rows:
+                    break
+                hashes = hash_passwords([row.passcode for row in rows], workers=options['workers'])
+                for row, passcode in zip(rows, hashes):
+                    row.passcode = passcode
+                with transaction.atomic():
+                    model.objects.bulk_update(rows, ['passcode'])
+
+                last_pk = rows[-1].pk
+                checkpoint[label] = last_pk
+                checkpoint_path.write_text(json.dumps(checkpoint))
+                pending = model.objects.filter(unhashed_password_filter(), pk__gt=last_pk)
+                hashed_count += len(rows)
+                self.stdout.write(f"  ✓ {hashed_count}/{remaining} hashed (last pk {last_pk})")
+
+            self.stdout.write(self.style.SUCCESS(f"✓ DONE: {hashed_count} {label} passcodes hashed"))
+
+        self.stdout.write('\n' + '=' * 80)
+        if options['dry_run']:
+            self.stdout.write('DRY RUN: nothing was written')
+            return
+        # Every table finished, so the next run starts from scratch
+        if checkpoint_path.exists():
+            checkpoint_path.unlink()
+        self.stdout.write(self.style.SUCCESS('✅ ALL PASSCODES HASHED'))
@@ -0,0 +1,21 @@
+"""
+Attach the authenticated user's role profile to every request.
+"""
+from django.utils.functional import SimpleLazyObject
+
+from .profiles import get_profile
+
+
+class RoleProfileMiddleware:
+    """
+    Sets `request.profile`: the Student, Faculty, ManagementEmployee or
+    TPCellEmployee of request.user, or None. Resolved on first access, which
+    for DRF views is after JWT authentication has replaced request.user.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.profile = SimpleLazyObject(lambda: get_profile(request))
+        return self.get_response(request)
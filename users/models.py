@@ -19,3 +19,16 @@ class User(AbstractUser):
     
     def __str__(self):
         return f"{self.email} ({self.get_role_display()})"
+
+
+class CacheGeneration(models.Model):
+    """
+    Invalidation counters shared by every process (see utils/generations.py).
+    Per-process caches key their entries on the current value, so bumping it
+    in one worker or command invalidates them everywhere.
+    """
+    name = models.CharField(max_length=100, primary_key=True)
+    value = models.BigIntegerField(default=0)
+    
+    def __str__(self):
+        return f"{self.name} = {self.value}"
@@ -0,0 +1,120 @@
+"""
+Role Profiles
+Maps each User.role to the profile model holding that person's record.
+The profile's primary key (student_id, faculty_id, emp_id) is what
+User.user_id stores; emails are unique in both tables.
+
+Views get the requesting user's profile from `request.profile` (set lazily
+by users.middleware.RoleProfileMiddleware) or get_role_profile().
+"""
+import copy
+
+from django.conf import settings
+
+from students.models import Student
+from faculty.models import Faculty
+from management.models import ManagementEmployee
+from tpcell.models import TPCellEmployee
+from utils.generations import bump_generation, current_generation
+from utils.ttl_cache import TTLCache
+
+GENERATION = 'users:profiles'
+
+ROLE_PROFILE_MODELS = {
+    'student': Student,
+    'faculty': Faculty,
+    'management': ManagementEmployee,
+    'tpcell': TPCellEmployee,
+}
+
+
+def profile_id_field(model):
+    """Name of the profile primary key that User.user_id refers to"""
+    return model._meta.pk.name
+
+
+class ProfileCache(TTLCache):
+    """
+    Small per-process LRU of role profiles keyed by (generation, role, user_id),
+    each entry living at most `ttl` seconds. Saving or deleting a profile
+    (users.signals) and bulk imports bump the generation stored in the database
+    (utils/generations.py), which retires every process's entries within
+    GENERATION_RECHECK_SECONDS; the TTL bounds staleness from other bulk
+    writes that send no signals.
+    """
+
+    # Each request gets its own copy, so attribute changes never leak between requests
+    def get(self, key, default=None):
+        profile = super().get(key)
+        return default if profile is None else copy.copy(profile)
+
+    def set(self, key, profile):
+        super().set(key, copy.copy(profile))
+
+
+profile_cache = ProfileCache(
+    maxsize=getattr(settings, 'PROFILE_CACHE_SIZE', 1024),
+    ttl=getattr(settings, 'PROFILE_CACHE_TTL', 300),
+)
+
+MODEL_ROLES = {model: role for role, model in ROLE_PROFILE_MODELS.items()}
+
+
+def resolve_profile(user):
+    """
+    The role profile (Student, Faculty, ...) of an authenticated user, or None.
+
+    Looks up by User.user_id through profile_cache. The profile is only
+    served if its email matches the user's; users not yet linked (user_id is
+    NULL) or linked to another person's profile (see `manage.py
+    audit_identity`) fall back to an uncached email lookup.
+    """
+    if not getattr(user, 'is_authenticated', False):
+        return None
+    model = ROLE_PROFILE_MODELS.get(user.role)
+    if model is None:
+        return None
+    if user.user_id is not None:
+        key = (current_generation(GENERATION), user.role, user.user_id)
+        profile = profile_cache.get(key)
+        if profile is None:
+            profile = model.objects.filter(pk=user.user_id).first()
+            if profile is not None:
+                profile_cache.set(key, profile)
+        if profile is not None and profile.email == user.email:
+            return profile
+    return model.objects.filter(email=user.email).first()
+
+
+def get_profile(request):
+    """The requesting user's profile (or None), resolved once per request"""
+    request = getattr(request, '_request', request)  # DRF Request -> HttpRequest
+    if not hasattr(request, '_cached_profile'):
+        request._cached_profile = resolve_profile(request.user)
+    return request._cached_profile
+
+
+def get_role_profile(request, model):
+    """
+    The requesting user's profile if it is a `model` instance.
+
+    Raises:
+        model.DoesNotExist: no profile, or the user's role maps to another model
+    """
+    profile = get_profile(request)
+    if not isinstance(profile, model):
+        raise model.DoesNotExist(f'No {model.__name__} profile for {request.user}')
+    return profile
+
+
+def forget_profiles():
+    """Retire every cached profile, in this process and (via the generation) all others"""
+    bump_generation(GENERATION)
+    profile_cache.clear()
+
+
+def invalidate_profile(sender, instance, **kwargs):
+    """post_save/post_delete receiver for the profile models"""
+    if kwargs.get('created'):
+        return  # misses are not cached, so no process holds an entry for a new profile
+    forget_profiles()
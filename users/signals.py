@@ -0,0 +1,16 @@
+"""
+Keep the user caches current:
+- role profiles (users.profiles.profile_cache) when a profile row is changed or deleted
+- unknown login attempts (users.login_cache) when a User is created or renamed
+"""
+from django.db.models.signals import post_delete, post_save
+
+from .login_cache import user_saved
+from .models import User
+from .profiles import ROLE_PROFILE_MODELS, invalidate_profile
+
+for model in ROLE_PROFILE_MODELS.values():
+    post_save.connect(invalidate_profile, sender=model, dispatch_uid=f'profile_cache_save_{model.__name__}')
+    post_delete.connect(invalidate_profile, sender=model, dispatch_uid=f'profile_cache_delete_{model.__name__}')
+
+post_save.connect(user_saved, sender=User, dispatch_uid='unknown_logins_user_save')
@@ -0,0 +1,268 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.management import call_command
+from django.db.models import F
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from students.models import Student
+from utils import password_utils
+from utils.generations import bump_generation, forget_generations
+from utils.password_utils import PARALLEL_HASH_THRESHOLD, hash_passwords, unhashed_password_filter
+from .models import CacheGeneration, User
+from .login_cache import GENERATION, unknown_logins
+from .profiles import GENERATION as PROFILE_GENERATION, profile_cache, resolve_profile
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class AuditIdentityTestCase(TestCase):
+    def setUp(self):
+        for student_id, email in [(1, 'john@test.com'), (2, 'jane@test.com'), (3, 'jim@test.com')]:
+            Student.objects.create(
+                student_id=student_id, first_name='Test', last_name='Student', email=email, gender='Male',
+                year_id=1, branch_id=1, sec_id=1, roll_no=student_id, phone_no='', passcode=make_password('1234'),
+            )
+        User.objects.create(email='john@test.com', username='john', role='student', user_id=None)
+        User.objects.create(email='jim@test.com', username='jim', role='student', user_id=1)
+
+    def test_fix_relinks_and_creates_users(self):
+        """--fix points user_id at the profile with the same email and creates Users for orphans"""
+        call_command('audit_identity', fix=True, stdout=StringIO())
+
+        self.assertEqual(User.objects.get(email='john@test.com').user_id, 1)
+        self.assertEqual(User.objects.get(email='jim@test.com').user_id, 3)
+        jane = User.objects.get(email='jane@test.com')
+        self.assertEqual((jane.user_id, jane.role), (2, 'student'))
+        self.assertTrue(jane.check_password('1234'))
+
+        out = StringIO()
+        call_command('audit_identity', stdout=out)
+        self.assertIn('Total issues: 0', out.getvalue())
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class HashPasswordsTestCase(TestCase):
+    def test_serial_and_pool_hashes_match_inputs_in_order(self):
+        plain = [f'pass{i}' for i in range(PARALLEL_HASH_THRESHOLD + 8)]
+        serial = hash_passwords(plain, workers=1)
+        pooled = hash_passwords(plain, workers=2)
+        for hashes in (serial, pooled):
+            self.assertEqual(len(hashes), len(plain))
+            self.assertTrue(all(h.startswith('md5$') for h in hashes))
+            self.assertTrue(all(check_password(p, h) for p, h in zip(plain, hashes)))
+        self.assertFalse(check_password(plain[0], pooled[1]))
+        # Fresh salt per hash
+        self.assertNotEqual(serial, pooled)
+
+    def test_unhashed_password_filter(self):
+        for student_id, passcode in enumerate(['1234', make_password('1234'), 'pbkdf2_sha256$1$a$b', '', 'scrypt$x'], 1):
+            Student.objects.create(
+                student_id=student_id, first_name='T', last_name='S', email=f's{student_id}@test.com', gender='Male',
+                year_id=1, branch_id=1, sec_id=1, roll_no=student_id, phone_no='', passcode=passcode,
+            )
+        self.assertEqual(list(Student.objects.filter(unhashed_password_filter()).values_list('student_id', flat=True)), [1])
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class RehashPasscodesTestCase(TestCase):
+    def setUp(self):
+        self.passcodes = ['1111', '2222', 'argon2$argon2id$v=19$m=1,t=1,p=1$c2FsdA$aGFzaA', '4444', 'bcrypt_sha256$$2b$x']
+        for student_id, passcode in enumerate(self.passcodes, 1):
+            Student.objects.create(
+                student_id=student_id, first_name='T', last_name='S', email=f's{student_id}@test.com', gender='Male',
+                year_id=1, branch_id=1, sec_id=1, roll_no=student_id, phone_no='', passcode=passcode,
+            )
+        checkpoint_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(checkpoint_dir.cleanup)
+        self.checkpoint = Path(checkpoint_dir.name) / 'checkpoint.json'
+
+    def test_resume_after_interrupted_chunk(self):
+        calls = []
+
+        def interrupt_second_chunk(passcodes, workers=None):
+            calls.append(list(passcodes))
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            return password_utils.hash_passwords(passcodes, workers=1)
+
+        command = 'users.management.commands.rehash_passcodes.hash_passwords'
+        with mock.patch(command, side_effect=interrupt_second_chunk), self.assertRaises(KeyboardInterrupt):
+            call_command('rehash_passcodes', chunk_size=1, checkpoint=str(self.checkpoint), stdout=StringIO())
+        self.assertIn('"students.Student": 1', self.checkpoint.read_text())
+        first_hash = Student.objects.get(pk=1).passcode
+
+        calls.clear()
+        with mock.patch(command, side_effect=interrupt_second_chunk):
+            call_command('rehash_passcodes', chunk_size=10, checkpoint=str(self.checkpoint), stdout=StringIO())
+        self.assertEqual(calls, [['2222', '4444']])
+        self.assertFalse(self.checkpoint.exists())
+
+        students = {s.pk: s for s in Student.objects.all()}
+        self.assertEqual(students[1].passcode, first_hash)
+        self.assertTrue(students[2].check_passcode('2222') and students[4].check_passcode('4444'))
+        # Already-hashed passcodes (including the widened argon2/bcrypt prefixes) are left untouched
+        self.assertEqual((students[3].passcode, students[5].passcode), (self.passcodes[2], self.passcodes[4]))
+
+
+class BackfillUserIdsTestCase(TestCase):
+    def setUp(self):
+        for student_id, email in [(1, 'john@test.com'), (2, 'jane@test.com')]:
+            Student.objects.create(
+                student_id=student_id, first_name='Test', last_name='Student', email=email, gender='Male',
+                year_id=1, branch_id=1, sec_id=1, roll_no=student_id, phone_no='', passcode='x',
+            )
+        User.objects.create(email='john@test.com', username='john', role='student')
+        User.objects.create(email='jane@test.com', username='jane', role='student')
+        User.objects.create(email='other@test.com', username='other', role='faculty', user_id=2)
+
+    def test_backfill(self):
+        """Missing ids are filled from the profile email; ids held by another account are left alone"""
+        call_command('backfill_user_ids', dry_run=True, stdout=StringIO())
+        self.assertIsNone(User.objects.get(email='john@test.com').user_id)
+
+        call_command('backfill_user_ids', stdout=StringIO())
+        self.assertEqual(User.objects.get(email='john@test.com').user_id, 1)
+        self.assertIsNone(User.objects.get(email='jane@test.com').user_id)
+
+
+@override_settings(GENERATION_RECHECK_SECONDS=60)
+class RoleProfileCacheTestCase(TestCase):
+    def setUp(self):
+        profile_cache.clear()
+        forget_generations()
+        self.student = Student.objects.create(
+            student_id=7, first_name='Test', last_name='Student', email='s7@test.com', gender='Male',
+            year_id=1, branch_id=1, sec_id=1, roll_no=7, phone_no='', passcode='x',
+        )
+        self.user = User.objects.create(email='s7@test.com', username='s7', role='student', user_id=7)
+
+    def test_cached_by_user_id_and_invalidated_on_save(self):
+        with self.assertNumQueries(2):  # generation + profile
+            self.assertEqual(resolve_profile(self.user).pk, 7)
+            self.assertEqual(resolve_profile(self.user).pk, 7)
+        self.student.phone_no = '555'
+        self.student.save()
+        with self.assertNumQueries(2):
+            self.assertEqual(resolve_profile(self.user).phone_no, '555')
+        with self.assertNumQueries(0):
+            resolve_profile(self.user)
+
+    def test_invalidated_by_another_process(self):
+        """A save in another process bumps the stored generation, retiring this process's entry"""
+        bump_generation(PROFILE_GENERATION)
+        resolve_profile(self.user)
+        Student.objects.filter(pk=7).update(phone_no='555')
+        CacheGeneration.objects.filter(name=PROFILE_GENERATION).update(value=F('value') + 1)
+        self.assertEqual(resolve_profile(self.user).phone_no, '')
+        with override_settings(GENERATION_RECHECK_SECONDS=0):
+            self.assertEqual(resolve_profile(self.user).phone_no, '555')
+
+    def test_deleted_profile_is_not_served(self):
+        resolve_profile(self.user)
+        self.student.delete()
+        self.assertIsNone(resolve_profile(self.user))
+
+    def test_mislinked_user_id_is_not_trusted(self):
+        """A user whose user_id points at another person's profile never gets it, cached or not"""
+        resolve_profile(self.user)
+        mislinked = User(email='s8@test.com', username='s8', role='student', user_id=7)
+        self.assertIsNone(resolve_profile(mislinked))
+        Student.objects.create(
+            student_id=8, first_name='Other', last_name='Student', email='s8@test.com', gender='Male',
+            year_id=1, branch_id=1, sec_id=1, roll_no=8, phone_no='', passcode='x',
+        )
+        self.assertEqual(resolve_profile(mislinked).pk, 8)
+
+
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'], GENERATION_RECHECK_SECONDS=60,
+)
+class StatelessJWTTestCase(TestCase):
+    def setUp(self):
+        profile_cache.clear()
+        forget_generations()
+        Student.objects.create(
+            student_id=7, first_name='Test', last_name='Student', email='s7@test.com', gender='Male',
+            year_id=1, branch_id=1, sec_id=1, roll_no=7, phone_no='', passcode='x',
+        )
+        self.user = User.objects.create_user(
+            email='s7@test.com', username='s7', password='pw', role='student', user_id=7,
+        )
+        self.client = APIClient()
+        response = self.client.post('/api/users/login/', {'email': 's7@test.com', 'password': 'pw', 'role': 'student'})
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.json()['access']}")
+
+    def test_request_does_not_load_user_row(self):
+        with self.assertNumQueries(2):  # profile generation + the Student profile; no User row
+            response = self.client.get('/api/students/profile/')
+        self.assertEqual(response.json()['student_id'], 7)
+
+    def test_strict_endpoint_rejects_changed_identity(self):
+        self.user.role = 'faculty'
+        self.user.save()
+        self.assertEqual(self.client.get('/api/students/profile/').status_code, 200)
+        response = self.client.patch('/api/assignments/faculty/assignments/1/grade/', {'marks': 5})
+        self.assertEqual(response.status_code, 401)
+
+
+class LoginRehashTestCase(TestCase):
+    @override_settings(
+        PASSWORD_HASHERS=['utils.hashers.TunablePBKDF2PasswordHasher', 'django.contrib.auth.hashers.MD5PasswordHasher'],
+        PASSWORD_PBKDF2_ITERATIONS=1000,
+    )
+    def test_login_upgrades_outdated_hash(self):
+        user = User.objects.create(email='s@test.com', username='s', role='student', password=make_password('pw', hasher='md5'))
+        payload = {'email': 's@test.com', 'password': 'pw', 'role': 'student'}
+        self.assertEqual(self.client.post('/api/users/login/', payload).status_code, 200)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$1000$'))
+
+        with self.settings(PASSWORD_PBKDF2_ITERATIONS=2000):
+            self.assertEqual(self.client.post('/api/users/login/', payload).status_code, 200)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$2000$'))
+
+    def test_benchmark_login_command(self):
+        out = StringIO()
+        call_command('benchmark_login', hashers='django.contrib.auth.hashers.MD5PasswordHasher', logins=2, stdout=out)
+        self.assertIn('MD5PasswordHasher', out.getvalue())
+        self.assertFalse(User.objects.exists())
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+@override_settings(GENERATION_RECHECK_SECONDS=60)
+class UnknownLoginCacheTestCase(TestCase):
+    payload = {'email': 'new@test.com', 'password': 'pw', 'role': 'student'}
+
+    def setUp(self):
+        unknown_logins.clear()
+        forget_generations()
+
+    def test_repeated_unknown_login_skips_database(self):
+        hits = unknown_logins.hits
+        with self.assertNumQueries(2):  # generation, then the User lookup
+            self.assertEqual(self.client.post('/api/users/login/', self.payload).status_code, 401)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.post('/api/users/login/', self.payload).status_code, 401)
+        self.assertEqual(unknown_logins.hits, hits + 1)
+
+    def test_created_user_is_not_shadowed(self):
+        self.client.post('/api/users/login/', self.payload)
+        User.objects.create_user(email='new@test.com', username='new', password='pw', role='student')
+        self.assertEqual(self.client.post('/api/users/login/', self.payload).status_code, 200)
+
+    def test_generation_bumped_elsewhere_invalidates(self):
+        """A bump by another process (e.g. a CSV import) is seen once the remembered value is re-checked"""
+        bump_generation(GENERATION)
+        self.client.post('/api/users/login/', self.payload)
+        User.objects.bulk_create([User(email='new@test.com', username='new', role='student',
+                                       password=make_password('pw'))])
+        # The other process's bump: the row changes, this process's remembered value does not
+        CacheGeneration.objects.filter(name=GENERATION).update(value=F('value') + 1)
+        self.assertEqual(self.client.post('/api/users/login/', self.payload).status_code, 401)
+        with override_settings(GENERATION_RECHECK_SECONDS=0):
+            self.assertEqual(self.client.post('/api/users/login/', self.payload).status_code, 200)
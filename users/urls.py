@@ -3,4 +3,5 @@ from . import views
 
 urlpatterns = [
     path('login/', views.login, name='login'),
+    path('cache-stats/', views.cache_stats, name='cache_stats'),
 ]
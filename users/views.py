@@ -1,8 +1,11 @@
 from rest_framework import status
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
+from .authentication import issue_tokens, StrictJWTAuthentication
+from .login_cache import is_unknown_login, remember_unknown_login, unknown_login_key, unknown_logins
 from .models import User
+from .profiles import profile_cache
 from .serializers import UserSerializer
 from utils.password_utils import verify_password
 import logging
@@ -31,9 +34,16 @@ def login(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    try:
-        user = User.objects.get(email=email, role=role)
-    except User.DoesNotExist:
+    # Recently seen unknown accounts skip the database (users/login_cache.py)
+    user = None
+    miss_key = unknown_login_key(email, role)
+    if not is_unknown_login(miss_key):
+        user = User.objects.filter(email=email, role=role).first()
+        if user is None:
+            remember_unknown_login(miss_key)
+    if user is None:
+        # Hash anyway, so unknown accounts take as long as a wrong password
+        User().set_password(password)
         logger.warning(f"Login attempt with non-existent user: {email} (role: {role})")
         return Response(
             {'error': 'Invalid credentials'},
@@ -49,8 +59,8 @@ def login(request):
             status=status.HTTP_401_UNAUTHORIZED
         )
     
-    # Generate JWT tokens
-    refresh = RefreshToken.for_user(user)
+    # Generate JWT tokens; email, role and user_id ride along as claims (users/authentication.py)
+    refresh = issue_tokens(user)
     
     logger.info(f"✓ Successful login for user: {email} (role: {role})")
     
@@ -59,3 +69,14 @@ def login(request):
         'access': str(refresh.access_token),
         'user': UserSerializer(user).data,
     }, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@authentication_classes([StrictJWTAuthentication])
+@permission_classes([IsAdminUser])
+def cache_stats(request):
+    """Hit/miss counters of this worker process's login and role-profile caches"""
+    return Response({
+        'unknown_logins': unknown_logins.stats(),
+        'role_profiles': profile_cache.stats(),
+    }, status=status.HTTP_200_OK)
@@ -1,4 +1,4 @@
 """Utilities package"""
-from .password_utils import verify_password, hash_password, set_password, is_password_hashed
+from .password_utils import verify_password, hash_password, hash_passwords, set_password, is_password_hashed
 
-__all__ = ['verify_password', 'hash_password', 'set_password', 'is_password_hashed']
+__all__ = ['verify_password', 'hash_password', 'hash_passwords', 'set_password', 'is_password_hashed']
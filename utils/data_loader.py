@@ -0,0 +1,748 @@
+"""
+Bulk Data Loader Module
+Vectorized CSV loaders used by the `load_academia_data` management command.
+
+Each CSV is read once, columns are validated and converted with pandas/NumPy,
+foreign keys are resolved against preloaded id sets (no per-row lookups), and
+rows are written with large bulk_create batches. The student fact tables go
+through a write backend (utils.load_backends): COPY on PostgreSQL, ORM elsewhere.
+
+With a chunksize the CSV is streamed instead: each chunk is validated and
+written before the next is read, so memory stays flat however large the file.
+"""
+import sys
+import time
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import numpy as np
+import pandas as pd
+from django.db import transaction
+from django.db.models import Q
+
+from users.models import User
+from users.login_cache import forget_unknown_logins
+from users.profiles import forget_profiles
+from students.models import (
+    Student, StudentAcademic, StudentBacklog, StudentFee, StudentExamData, StudentAttendance,
+    SourceRowFingerprint,
+)
+from faculty.models import Faculty, FacultyAssignment
+from tpcell.models import TPCellEmployee
+from management.models import ManagementEmployee
+from notifications.models import Notification
+from students.attendance_bits import encode_matrix
+from students.performance import refresh_summaries
+from students.signals import summary_refresh_deferred
+from .load_backends import get_backend
+from .password_utils import hash_passwords
+
+DEFAULT_BATCH_SIZE = 2000
+
+# Table name -> CSV file name, in load order (FK parents first)
+CSV_FILES = {
+    'students': '1th_STUDENT_PERSONAL_INFO.csv',
+    'academics': '2nd_STUD_ACAD.csv',
+    'backlogs': '3rd_STUDENT_BACKLOGS.csv',
+    'fees': '4th_STUDENT_FEE.csv',
+    'faculty': '5th_FACULTY_INFO.csv',
+    'faculty_assignments': '6th_FACULTY_STUDENT_DEPT.csv',
+    'tpcell': '7th_TP_CELL.csv',
+    'management': '8th_MANAGEMENT.csv',
+    'notifications': '9th_NOTIFICATIONS.csv',
+    'exams': '10th_MID_EXAM_DATA.csv',
+    'attendance': '11th_STUDENT_ATTENDANCE.csv',
+}
+
+# Attendance CSVs carry one column per class session, named "1".."50"
+ATTENDANCE_CLASS_COLUMNS = [str(i) for i in range(1, 51)]
+
+# Fact tables feeding StudentPerformanceSummary (refreshed after the import)
+SUMMARY_TABLES = ('exams', 'backlogs', 'attendance')
+
+
+class LoadStats:
+    """Row counts and timing for one loaded table"""
+
+    COUNTERS = ('rows_read', 'loaded', 'updated', 'deleted', 'unchanged', 'rejected', 'skipped')
+
+    def __init__(self, table, rows_read=0, loaded=0, updated=0, deleted=0, unchanged=0,
+                 rejected=0, skipped=0, seconds=0.0, peak_rss_mb=0.0):
+        self.table = table
+        self.rows_read = rows_read
+        self.loaded = loaded
+        self.updated = updated
+        self.deleted = deleted
+        self.unchanged = unchanged
+        self.rejected = rejected
+        self.skipped = skipped
+        self.seconds = seconds
+        self.peak_rss_mb = peak_rss_mb
+
+    def add(self, other):
+        """Accumulate the counters of one streamed chunk"""
+        for name in self.COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    @property
+    def rows_per_second(self):
+        if self.seconds <= 0:
+            return 0.0
+        return self.rows_read / self.seconds
+
+    def as_dict(self):
+        return {
+            'table': self.table,
+            'rows_read': self.rows_read,
+            'loaded': self.loaded,
+            'updated': self.updated,
+            'deleted': self.deleted,
+            'unchanged': self.unchanged,
+            'rejected': self.rejected,
+            'skipped': self.skipped,
+            'seconds': round(self.seconds, 3),
+            'rows_per_second': round(self.rows_per_second, 1),
+            'peak_rss_mb': round(self.peak_rss_mb, 1),
+        }
+
+
+# ============================================================================
+# Column helpers
+# ============================================================================
+
+def _int_column(df, column, default=None):
+    """Convert a column to nullable integers; invalid values become <NA> (or default)"""
+    if column not in df.columns:
+        return pd.Series(default, index=df.index, dtype='Int64')
+    values = pd.to_numeric(df[column], errors='coerce').round().astype('Int64')
+    if default is not None:
+        values = values.fillna(default)
+    return values
+
+
+def _float_column(df, column, default=None):
+    """Convert a column to floats; invalid values become NaN (or default)"""
+    if column not in df.columns:
+        return pd.Series(default if default is not None else np.nan, index=df.index, dtype='float64')
+    values = pd.to_numeric(df[column], errors='coerce')
+    if default is not None:
+        values = values.fillna(default)
+    return values
+
+
+def _str_column(df, column, max_length=None):
+    """Convert a column to stripped strings; missing values become empty strings"""
+    if column not in df.columns:
+        return pd.Series('', index=df.index, dtype='object')
+    values = df[column].where(df[column].notna(), '').astype(str).str.strip()
+    if max_length:
+        values = values.str.slice(0, max_length)
+    return values
+
+
+def peak_rss_mb():
+    """High-water mark of this process's resident memory, in MB (0 if unavailable)"""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _id_array(queryset):
+    """Primary keys as a sorted int64 array (8 bytes per id, vs ~60 in a set)"""
+    return np.sort(np.fromiter(queryset, dtype=np.int64))
+
+
+def _existing(queryset, field, values, batch_size):
+    """The subset of `values` already present in queryset's `field`, queried in batches of keys"""
+    values = list(values)
+    found = set()
+    for start in range(0, len(values), batch_size):
+        found.update(queryset.filter(**{f'{field}__in': values[start:start + batch_size]}).values_list(field, flat=True))
+    return found
+
+
+def _records(frame):
+    """Yield row dicts with pandas <NA>/NaN replaced by None"""
+    frame = frame.astype(object).where(frame.notna(), None)
+    return frame.to_dict('records')
+
+
+def _bulk_create(model, records, batch_size, key=None):
+    """
+    Bulk insert model rows built from dicts, ignoring rows that already exist.
+    Only one batch of model instances is alive at a time.
+
+    Returns:
+        int: rows actually inserted (conflicting rows are not counted). When the
+        records carry the unique `key` (default: the primary key) each batch
+        counts its own keys before and after; otherwise the table is counted
+        once before and after.
+    """
+    if not records:
+        return 0
+    key = key or model._meta.pk.attname
+    keyed = key in records[0]
+    inserted = 0
+    with transaction.atomic():
+        before = None if keyed else model.objects.count()
+        for start in range(0, len(records), batch_size):
+            batch = records[start:start + batch_size]
+            if keyed:
+                keys = model.objects.filter(**{f'{key}__in': [rec[key] for rec in batch]})
+                existing = keys.count()
+            model.objects.bulk_create([model(**rec) for rec in batch], ignore_conflicts=True)
+            if keyed:
+                inserted += keys.count() - existing
+        if not keyed:
+            inserted = model.objects.count() - before
+    return inserted
+
+
+def _passcodes(df):
+    """Plain-text passcodes as strings ('1234.0' style floats are normalised)"""
+    return _int_column(df, 'passcode').astype(str)
+
+
+def _username(emails):
+    return emails.str.split('@').str[0].str.slice(0, 30)
+
+
+# ============================================================================
+# People tables (profile + login User)
+# ============================================================================
+
+def _load_people(df, stats, batch_size, model, pk_field, role, profile_columns):
+    """
+    Shared loader for Student/Faculty/TPCellEmployee/ManagementEmployee.
+
+    Rows whose primary key already exists are skipped; a User is created only
+    for emails that do not already have one. Only this frame's ids and emails
+    are looked up, so a streamed chunk costs the same however full the tables are.
+
+    Returns:
+        (stats, ids of the profiles inserted)
+    """
+    ids = _int_column(df, pk_field)
+    emails = _str_column(df, 'email')
+    passcodes = _passcodes(df)
+
+    valid = ids.notna() & (emails != '') & (passcodes != '<NA>')
+    stats.rejected = int((~valid).sum())
+
+    existing_ids = np.array(sorted(_existing(model.objects, pk_field, ids[valid].unique().tolist(), batch_size)),
+                            dtype=np.int64)
+    # Existing ids and repeated ids within the file are skipped (first row wins)
+    new = valid & ~_known_ids(ids, existing_ids) & ~ids.duplicated(keep='first')
+    stats.skipped = int((valid & ~new).sum())
+
+    frame = pd.DataFrame({pk_field: ids, 'email': emails}, index=df.index)
+    for field, series in profile_columns.items():
+        frame[field] = series
+    frame = frame[new]
+    plain = passcodes[new]
+
+    existing_emails = _existing(User.objects, 'email', frame['email'].unique().tolist(), batch_size)
+    user_rows = frame[~frame['email'].isin(existing_emails)]
+
+    # SECURITY: Hash passwords before storing. One hash per row, shared by the
+    # profile passcode and the User password, computed across all CPU cores.
+    hashed = pd.Series(hash_passwords(plain), index=plain.index, dtype=object)
+
+    profiles = _records(frame)
+    for rec, passcode in zip(profiles, hashed):
+        rec['passcode'] = passcode
+
+    users = [{
+        'email': rec['email'],
+        'username': username,
+        'first_name': str(rec['first_name'])[:30],
+        'last_name': str(rec['last_name'])[:30],
+        'role': role,
+        'user_id': int(rec[pk_field]),
+        'password': passcode,
+    } for rec, username, passcode in zip(_records(user_rows), _username(user_rows['email']), hashed.loc[user_rows.index])]
+
+    _bulk_create(User, users, batch_size, key='email')
+    stats.loaded = _bulk_create(model, profiles, batch_size)
+    # Rows dropped as conflicts (e.g. a duplicate email) must not count as known ids
+    inserted = _existing(model.objects, pk_field, frame[pk_field].astype(int).tolist(), batch_size)
+    return stats, np.array(sorted(inserted), dtype=np.int64)
+
+
+def _add_known_ids(context, key, ids):
+    """Extend an already loaded id array with a chunk's new rows (never reloads the table)"""
+    if context.get(key) is not None:
+        context[key] = np.union1d(context[key], ids)
+
+
+def load_students(df, stats, context):
+    columns = {
+        'first_name': _str_column(df, 'first_name', 100),
+        'last_name': _str_column(df, 'last_name', 100),
+        'gender': _str_column(df, 'gender', 10),
+        'year_id': _int_column(df, 'year_id'),
+        'branch_id': _int_column(df, 'branch_id'),
+        'sec_id': _int_column(df, 'sec_id'),
+        'roll_no': _int_column(df, 'roll_no'),
+        'phone_no': _int_column(df, 'phone_no').astype(str).replace('<NA>', ''),
+        'ssc_marks': _float_column(df, 'ssc_marks'),
+        'inter_marks': _float_column(df, 'inter_marks'),
+    }
+    required = columns['year_id'].notna() & columns['branch_id'].notna() & columns['sec_id'].notna() & columns['roll_no'].notna()
+    stats, inserted = _load_people(df[required], stats, context['batch_size'], Student, 'student_id', 'student',
+                                   {k: v[required] for k, v in columns.items()})
+    stats.rejected += int((~required).sum())
+    _add_known_ids(context, 'student_ids', inserted)
+    # Bulk inserts send no post_save: new students get their summary row when loading ends
+    context['summary_students'].update(np.asarray(inserted, dtype=np.int64).tolist())
+    return stats
+
+
+def load_faculty(df, stats, context):
+    columns = {
+        'first_name': _str_column(df, 'first_name', 100),
+        'last_name': _str_column(df, 'last_name', 100),
+        'gender': _str_column(df, 'gender', 10),
+        'department': _str_column(df, 'department', 100),
+        'designation': _str_column(df, 'designation', 100),
+        'qualifications': _str_column(df, 'qualifications', 100),
+    }
+    stats, inserted = _load_people(df, stats, context['batch_size'], Faculty, 'faculty_id', 'faculty', columns)
+    _add_known_ids(context, 'faculty_ids', inserted)
+    return stats
+
+
+def _load_employees(model, role):
+    def loader(df, stats, context):
+        columns = {
+            'first_name': _str_column(df, 'first_name', 100),
+            'last_name': _str_column(df, 'last_name', 100),
+            'gender': _str_column(df, 'gender', 10),
+            'designation': _str_column(df, 'designation', 100),
+        }
+        return _load_people(df, stats, context['batch_size'], model, 'emp_id', role, columns)[0]
+    return loader
+
+
+# ============================================================================
+# Student fact tables
+# ============================================================================
+
+def _known_ids(ids, id_array):
+    """Boolean Series: which nullable-int ids appear in a sorted id array"""
+    return pd.Series(np.isin(ids.fillna(-1).to_numpy(dtype=np.int64), id_array), index=ids.index)
+
+
+def _student_ids(context):
+    if context.get('student_ids') is None:
+        context['student_ids'] = _id_array(Student.objects.values_list('student_id', flat=True))
+    return context['student_ids']
+
+
+class FactTable:
+    """
+    How one student fact CSV maps onto its model.
+
+    build_frame(df) returns a DataFrame whose columns are model attnames;
+    rows missing any `required` column are rejected. unique_fields is the
+    natural key used as the ON CONFLICT target; update_fields are rewritten
+    when an existing row is upserted.
+    """
+
+    def __init__(self, model, build_frame, required, unique_fields, update_fields):
+        self.model = model
+        self.build_frame = build_frame
+        self.required = required
+        self.unique_fields = unique_fields
+        self.update_fields = update_fields
+
+    @property
+    def key_columns(self):
+        return [self.model._meta.get_field(f).attname for f in self.unique_fields]
+
+    def valid_rows(self, df, stats, context):
+        """Build the frame and keep rows that are complete and belong to a known student"""
+        frame = self.build_frame(df)
+        valid = frame[self.required].notna().all(axis=1)
+        known = _known_ids(frame['student_id'], _student_ids(context))
+        stats.rejected = int((~valid).sum())
+        stats.skipped = int((valid & ~known).sum())
+        return frame[valid & known].drop_duplicates(subset=self.key_columns, keep='last')
+
+    def existing_mask(self, frame):
+        """Boolean array: which frame rows already exist in the table (one query)"""
+        key = self.key_columns
+        existing = pd.DataFrame.from_records(
+            self.model.objects.filter(student_id__in=frame['student_id'].unique().tolist()).values_list(*key),
+            columns=key,
+        )
+        if not len(existing):
+            return np.zeros(len(frame), dtype=bool)
+        return pd.MultiIndex.from_frame(frame[key].astype(object)).isin(
+            pd.MultiIndex.from_frame(existing.astype(object))
+        )
+
+
+def _academic_frame(df):
+    return pd.DataFrame({
+        'student_id': _int_column(df, 'student_id'),
+        'semester_id': _int_column(df, 'sem_id'),
+        'course_code': _str_column(df, 'course_code', 50),
+        'marks': _int_column(df, 'marks'),
+        'attendance': _float_column(df, 'attendance', default=0.0),
+    })
+
+
+def _backlog_frame(df):
+    return pd.DataFrame({
+        'student_id': _int_column(df, 'student_id'),
+        'semester_id': _int_column(df, 'sem_id'),
+        'course_id': _str_column(df, 'course_id', 50),
+    })
+
+
+def _fee_frame(df):
+    return pd.DataFrame({
+        'student_id': _int_column(df, 'student_id'),
+        'mode_of_admission': _str_column(df, 'mode_of_admission', 50),
+        'fee_total': _int_column(df, 'fee_total'),
+        'paid_amount': _int_column(df, 'paid_amount'),
+        'remaining_amount': _int_column(df, 'remaining_amount'),
+        'library_fine': _int_column(df, 'library_fine', default=0),
+        'equipment_fine': _int_column(df, 'equipment_fine', default=0),
+        'paid_crt_fee': _int_column(df, 'paid_crt_fee', default=0),
+    })
+
+
+def _exam_frame(df):
+    return pd.DataFrame({
+        'student_id': _int_column(df, 'student_id'),
+        'year_id': _int_column(df, 'year_id'),
+        'branch_id': _int_column(df, 'branch_id'),
+        'section_id': _int_column(df, 'section_id'),
+        'semester_id': _int_column(df, 'sem_id'),
+        'mid_id': _int_column(df, 'mid_id'),
+        'course_id': _str_column(df, 'course_id', 50),
+        'mid_marks': _int_column(df, 'mid_marks'),
+        'quiz_marks': _int_column(df, 'quiz_marks'),
+        'assignment_marks': _int_column(df, 'assignment_marks'),
+    })
+
+
+def _class_bitmaps(df):
+    """
+    Slice the class columns out as one float matrix and pack each row into
+    held/present bitmaps plus counters (NaN and non-numeric cells count as not held).
+    """
+    matrix = df.reindex(columns=ATTENDANCE_CLASS_COLUMNS).apply(pd.to_numeric, errors='coerce').to_numpy(dtype='float64')
+    return encode_matrix(matrix)
+
+
+def _attendance_frame(df):
+    frame = pd.DataFrame({
+        'student_id': _int_column(df, 'student_id'),
+        'year_id': _int_column(df, 'year_id'),
+        'branch_id': _int_column(df, 'branch_id'),
+        'section_id': _int_column(df, 'sec_id'),
+        'semester_id': _int_column(df, 'sem_id'),
+        'course_id': _str_column(df, 'course_id', 50),
+    })
+    frame['course_id'] = frame['course_id'].mask(frame['course_id'] == '')
+    for column, values in _class_bitmaps(df).items():
+        frame[column] = values
+    frame['record_length'] = len(ATTENDANCE_CLASS_COLUMNS)
+    return frame
+
+
+FACT_TABLES = {
+    'academics': FactTable(
+        StudentAcademic, _academic_frame,
+        required=['student_id', 'semester_id'],
+        unique_fields=['student', 'semester_id', 'course_code'],
+        update_fields=['marks', 'attendance'],
+    ),
+    'backlogs': FactTable(
+        StudentBacklog, _backlog_frame,
+        required=['student_id', 'semester_id'],
+        unique_fields=['student', 'semester_id', 'course_id'],
+        update_fields=[],
+    ),
+    'fees': FactTable(
+        StudentFee, _fee_frame,
+        required=['student_id', 'fee_total', 'paid_amount', 'remaining_amount'],
+        unique_fields=['student'],
+        update_fields=['mode_of_admission', 'fee_total', 'paid_amount', 'remaining_amount',
+                       'library_fine', 'equipment_fine', 'paid_crt_fee'],
+    ),
+    'exams': FactTable(
+        StudentExamData, _exam_frame,
+        required=['student_id', 'year_id', 'branch_id', 'section_id', 'semester_id', 'mid_id',
+                  'mid_marks', 'quiz_marks', 'assignment_marks'],
+        unique_fields=['student', 'semester_id', 'mid_id', 'course_id'],
+        update_fields=['year_id', 'branch_id', 'section_id', 'mid_marks', 'quiz_marks', 'assignment_marks'],
+    ),
+    'attendance': FactTable(
+        StudentAttendance, _attendance_frame,
+        required=['student_id', 'year_id', 'branch_id', 'section_id', 'semester_id', 'course_id'],
+        unique_fields=['student', 'semester_id', 'course_id'],
+        update_fields=['year_id', 'branch_id', 'section_id', 'held_mask', 'present_mask', 'record_length',
+                       'total_classes', 'present_count', 'absent_count'],
+    ),
+}
+
+
+def _touch_students(table, context, student_ids):
+    """Remember whose performance summary must be refreshed once loading ends"""
+    if table in SUMMARY_TABLES:
+        context['summary_students'].update(np.unique(np.asarray(student_ids, dtype=np.int64)).tolist())
+
+
+def _fact_loader(table):
+    """Insert new rows, leaving existing ones untouched (ON CONFLICT DO NOTHING)"""
+    def loader(df, stats, context):
+        spec = FACT_TABLES[table]
+        frame = spec.valid_rows(df, stats, context)
+        stats.loaded = context['backend'].write(spec.model, frame, spec.unique_fields)
+        _touch_students(table, context, frame['student_id'])
+        return stats
+    return loader
+
+
+def load_attendance(df, stats, context):
+    """
+    Upsert attendance rows on (student, semester_id, course_id).
+
+    stats.loaded counts inserted rows and stats.updated rows that already existed.
+    """
+    spec = FACT_TABLES['attendance']
+    frame = spec.valid_rows(df, stats, context)
+    is_update = spec.existing_mask(frame)
+    context['backend'].write(spec.model, frame, spec.unique_fields, update_fields=spec.update_fields)
+    _touch_students('attendance', context, frame['student_id'])
+    stats.updated = int(is_update.sum())
+    stats.loaded = len(frame) - stats.updated
+    return stats
+
+
+# ============================================================================
+# Delta imports (fact tables only)
+# ============================================================================
+
+FINGERPRINT_DELETE_CHUNK = 500
+
+
+def _natural_keys(frame, columns):
+    """'student_id|semester_id|course_id' style key strings, built column-wise"""
+    parts = [frame[c].astype(str) for c in columns]
+    return parts[0].str.cat(parts[1:], sep='|') if len(parts) > 1 else parts[0]
+
+
+def _row_hashes(df):
+    """64-bit hash of every source CSV row, as signed ints for a BigIntegerField"""
+    return pd.util.hash_pandas_object(df.astype(str), index=False).to_numpy().view(np.int64)
+
+
+def _key_filter(spec, natural_keys):
+    """OR of exact natural-key matches, for deleting rows that left the export"""
+    fields = [spec.model._meta.get_field(f) for f in spec.unique_fields]
+    condition = Q()
+    for key in natural_keys:
+        values = key.split('|', len(fields) - 1)
+        condition |= Q(**{f.attname: f.target_field.to_python(v) if f.is_relation else f.to_python(v)
+                          for f, v in zip(fields, values)})
+    return condition
+
+
+def load_delta(table, df, stats, context):
+    """
+    Apply only the rows that changed since the previous delta import.
+
+    Every accepted source row is fingerprinted by natural key. Keys not seen
+    before are inserted, keys whose fingerprint changed are upserted, and keys
+    that were fingerprinted before but are missing from this file are deleted.
+    Unchanged rows are not written at all.
+    """
+    spec = FACT_TABLES[table]
+    frame = spec.valid_rows(df, stats, context)
+    incoming = pd.DataFrame({
+        'natural_key': _natural_keys(frame, spec.key_columns),
+        'row_hash': _row_hashes(df.loc[frame.index]),
+    }, index=frame.index)
+
+    stored = pd.DataFrame.from_records(
+        SourceRowFingerprint.objects.filter(table=table).values_list('natural_key', 'row_hash'),
+        columns=['natural_key', 'row_hash'],
+    )
+    stored['row_hash'] = stored['row_hash'].astype('Int64')
+    previous = incoming[['natural_key']].merge(stored, on='natural_key', how='left')['row_hash'].to_numpy()
+    previous = pd.array(previous, dtype='Int64')
+
+    is_new = np.asarray(previous.isna())
+    is_changed = ~is_new & np.asarray(previous.fillna(0) != incoming['row_hash'].to_numpy())
+    removed = sorted(set(stored['natural_key']) - set(incoming['natural_key']))
+
+    write = is_new | is_changed
+    with transaction.atomic():
+        if write.any():
+            context['backend'].write(spec.model, frame[write], spec.unique_fields,
+                                     update_fields=spec.update_fields or None)
+            SourceRowFingerprint.objects.bulk_create(
+                [SourceRowFingerprint(table=table, natural_key=k, row_hash=int(h))
+                 for k, h in zip(incoming['natural_key'][write], incoming['row_hash'][write])],
+                batch_size=context['batch_size'],
+                update_conflicts=True, unique_fields=['table', 'natural_key'], update_fields=['row_hash'],
+            )
+        # QuerySet.delete() sends post_delete per row; the touched students are refreshed once by load_all
+        with summary_refresh_deferred():
+            for start in range(0, len(removed), FINGERPRINT_DELETE_CHUNK):
+                chunk = removed[start:start + FINGERPRINT_DELETE_CHUNK]
+                spec.model.objects.filter(_key_filter(spec, chunk)).delete()
+                SourceRowFingerprint.objects.filter(table=table, natural_key__in=chunk).delete()
+
+    _touch_students(table, context, frame['student_id'][write])
+    _touch_students(table, context, [int(key.split('|', 1)[0]) for key in removed])
+    stats.loaded = int(is_new.sum())
+    stats.updated = int(is_changed.sum())
+    stats.deleted = len(removed)
+    stats.unchanged = len(frame) - stats.loaded - stats.updated
+    return stats
+
+
+# ============================================================================
+# Other tables
+# ============================================================================
+
+def load_faculty_assignments(df, stats, context):
+    if context.get('faculty_ids') is None:
+        context['faculty_ids'] = _id_array(Faculty.objects.values_list('faculty_id', flat=True))
+    frame = pd.DataFrame({
+        'faculty_id': _int_column(df, 'faculty_id'),
+        'year_id': _int_column(df, 'year_id'),
+        'branch_id': _int_column(df, 'branch_id'),
+        'section_id': _int_column(df, 'sec_id'),
+        'course_id': _str_column(df, 'course_id', 50),
+    })
+    valid = frame.notna().all(axis=1)
+    known = _known_ids(frame['faculty_id'], context['faculty_ids'])
+    stats.rejected = int((~valid).sum())
+    stats.skipped = int((valid & ~known).sum())
+    stats.loaded = _bulk_create(FacultyAssignment, _records(frame[valid & known]), context['batch_size'])
+    return stats
+
+
+def load_notifications(df, stats, context):
+    raw_due = _str_column(df, 'due_date')
+    due = pd.to_datetime(raw_due, format='%d-%m-%Y', errors='coerce')
+    due = due.fillna(pd.to_datetime(raw_due[due.isna()], errors='coerce', format='mixed'))
+    section_column = 'section_id' if 'section_id' in df.columns else 'sec_id'
+    frame = pd.DataFrame({
+        'year_id': _int_column(df, 'year_id'),
+        'branch_id': _int_column(df, 'branch_id'),
+        'section_id': _int_column(df, section_column),
+        'semester_id': _int_column(df, 'sem_id'),
+        'student_id': _int_column(df, 'student_id'),
+        'notification_type': _str_column(df, 'type_of_notification', 100),
+        'title': _str_column(df, 'title', 200),
+        'description': _str_column(df, 'description'),
+        'due_date': due.dt.date,
+        'priority': _str_column(df, 'priority', 20),
+    })
+    valid = frame['due_date'].notna()
+    stats.rejected = int((~valid).sum())
+    stats.loaded = _bulk_create(Notification, _records(frame[valid]), context['batch_size'])
+    return stats
+
+
+LOADERS = {
+    'students': load_students,
+    'academics': _fact_loader('academics'),
+    'backlogs': _fact_loader('backlogs'),
+    'fees': _fact_loader('fees'),
+    'faculty': load_faculty,
+    'faculty_assignments': load_faculty_assignments,
+    'tpcell': _load_employees(TPCellEmployee, 'tpcell'),
+    'management': _load_employees(ManagementEmployee, 'management'),
+    'notifications': load_notifications,
+    'exams': _fact_loader('exams'),
+    'attendance': load_attendance,
+}
+
+
+def load_table(table, data_path, context):
+    """
+    Load one table from its CSV file, whole or in chunks of context['chunksize'] rows.
+
+    Returns:
+        LoadStats, or None if the CSV file does not exist
+    """
+    csv_path = Path(data_path) / CSV_FILES[table]
+    if not csv_path.exists():
+        return None
+    start = time.perf_counter()
+    stats = LoadStats(table)
+    if context.get('chunksize'):
+        with pd.read_csv(csv_path, chunksize=context['chunksize']) as reader:
+            for df in reader:
+                chunk_stats = LoadStats(table, rows_read=len(df))
+                LOADERS[table](df, chunk_stats, context)
+                stats.add(chunk_stats)
+    else:
+        df = pd.read_csv(csv_path)
+        stats.rows_read = len(df)
+        if context.get('delta') and table in FACT_TABLES:
+            load_delta(table, df, stats, context)
+        else:
+            LOADERS[table](df, stats, context)
+    stats.seconds = time.perf_counter() - start
+    stats.peak_rss_mb = peak_rss_mb()
+    return stats
+
+
+def load_all(data_path, tables=None, batch_size=DEFAULT_BATCH_SIZE, on_table=None, backend='auto', delta=False,
+             chunksize=None):
+    """
+    Load the given tables (default: all, in dependency order).
+
+    Args:
+        data_path: Directory holding the CSV exports
+        tables: Optional iterable of table names from CSV_FILES
+        batch_size: bulk_create batch size
+        on_table: Optional callback(table, stats) invoked after each table
+        backend: 'auto', 'copy' or 'orm' (see utils.load_backends.get_backend)
+        delta: Apply only changed fact-table rows (see load_delta)
+        chunksize: Stream each CSV in chunks of this many rows (constant memory)
+
+    Returns:
+        list of LoadStats (missing files are reported with stats=None to on_table)
+    """
+    if delta and chunksize:
+        raise ValueError('Delta imports need the whole file to detect deletions; drop --chunksize')
+    selected = [t for t in CSV_FILES if tables is None or t in tables]
+    context = {
+        'batch_size': batch_size,
+        'backend': get_backend(backend, batch_size=batch_size),
+        'delta': delta,
+        'chunksize': chunksize,
+        'student_ids': None,
+        'faculty_ids': None,
+        'summary_students': set(),
+    }
+    results = []
+    for table in selected:
+        stats = load_table(table, data_path, context)
+        if on_table:
+            on_table(table, stats)
+        if stats is not None:
+            results.append(stats)
+    refresh_summaries(context['summary_students'])
+    # Bulk upserts send no post_save: retire cached role profiles and remembered unknown logins
+    # in every process (both are keyed on generations stored in the database)
+    forget_profiles()
+    forget_unknown_logins()
+    return results
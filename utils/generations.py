@@ -0,0 +1,49 @@
+"""
+Cache Generations
+Named counters stored in the database (users.CacheGeneration), for caches
+that must be invalidated across processes. The project sets no CACHES, so
+the Django cache is per-process memory: a generation kept there is only
+seen by the process that bumped it. A counter row is seen by every web
+worker, management command and CSV import.
+
+Each process remembers the last value it read and re-reads the row at most
+once per GENERATION_RECHECK_SECONDS (default 2), so hot paths usually cost
+no query; a bump from another process is seen within that interval, and a
+bump from this process immediately.
+"""
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from users.models import CacheGeneration
+
+# name -> (value, monotonic time it was read)
+_last_read = {}
+
+
+def current_generation(name):
+    """Current value of the counter (0 if it was never bumped), re-read at most once per interval"""
+    now = time.monotonic()
+    cached = _last_read.get(name)
+    if cached is not None and now - cached[1] < getattr(settings, 'GENERATION_RECHECK_SECONDS', 2):
+        return cached[0]
+    value = CacheGeneration.objects.filter(name=name).values_list('value', flat=True).first() or 0
+    _last_read[name] = (value, now)
+    return value
+
+
+def bump_generation(name):
+    """Increment the counter, creating it on first use"""
+    with transaction.atomic():
+        if not CacheGeneration.objects.filter(name=name).update(value=F('value') + 1):
+            _, created = CacheGeneration.objects.get_or_create(name=name, defaults={'value': 1})
+            if not created:
+                CacheGeneration.objects.filter(name=name).update(value=F('value') + 1)
+    _last_read.pop(name, None)
+
+
+def forget_generations():
+    """Drop this process's remembered values (the next read of each goes to the database)"""
+    _last_read.clear()
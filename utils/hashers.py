@@ -0,0 +1,55 @@
+"""
+Password Hasher Profiles
+PASSWORD_HASHER_PROFILE (settings / environment) picks the hasher that
+hashes new passwords; every other known algorithm stays listed so existing
+hashes still verify. Django re-hashes a User's password with the preferred
+hasher (and current cost) on the next successful login, so switching
+profiles or PBKDF2 iterations needs no bulk migration.
+
+Measure candidates with `python manage.py benchmark_login`.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+TUNABLE_PBKDF2 = 'utils.hashers.TunablePBKDF2PasswordHasher'
+
+# Profile name -> hasher used for new passwords
+HASHER_PROFILES = {
+    'pbkdf2': TUNABLE_PBKDF2,
+    'scrypt': 'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'argon2': 'django.contrib.auth.hashers.Argon2PasswordHasher',  # needs argon2-cffi
+}
+
+# Still accepted for verification (and upgraded on login)
+VERIFY_HASHERS = [
+    TUNABLE_PBKDF2,
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with its iteration count read from PASSWORD_PBKDF2_ITERATIONS.
+    Same algorithm name as Django's hasher, so existing hashes verify and are
+    re-hashed on login whenever the configured count changes.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(settings, 'PASSWORD_PBKDF2_ITERATIONS', PBKDF2PasswordHasher.iterations)
+
+
+def hasher_profile(name):
+    """
+    PASSWORD_HASHERS for a profile: its preferred hasher first, then the rest.
+
+    Raises:
+        ValueError: for an unknown profile name
+    """
+    if name not in HASHER_PROFILES:
+        raise ValueError(f"Unknown PASSWORD_HASHER_PROFILE '{name}' (choose from {', '.join(HASHER_PROFILES)})")
+    preferred = HASHER_PROFILES[name]
+    return [preferred] + [path for path in VERIFY_HASHERS if path != preferred]
@@ -0,0 +1,155 @@
+"""
+Loader Write Backends
+How utils.data_loader writes validated rows for the large fact tables.
+
+- OrmBackend: bulk_create (works on every database, used for SQLite test runs)
+- PostgresCopyBackend: COPY FROM STDIN into a temporary staging table, then one
+  INSERT ... SELECT ... ON CONFLICT per table
+"""
+import io
+import json
+
+from django.db import connections, models, transaction
+
+COPY_CHUNK_ROWS = 100000
+
+
+def _dedupe(frame, unique_columns):
+    """Keep the last row per natural key (ON CONFLICT cannot touch a row twice)"""
+    return frame.drop_duplicates(subset=unique_columns, keep='last')
+
+
+class OrmBackend:
+    """Write rows with bulk_create; conflicts are ignored or updated in place"""
+
+    name = 'orm'
+
+    def __init__(self, using='default', batch_size=2000):
+        self.using = using
+        self.batch_size = batch_size
+
+    def write(self, model, frame, unique_fields, update_fields=None):
+        """
+        Insert the rows of `frame` (columns = model attnames) into `model`.
+
+        Args:
+            unique_fields: Field names forming the conflict target
+            update_fields: Fields to overwrite on conflict; None means DO NOTHING
+
+        Returns:
+            int: rows inserted or updated, like PostgresCopyBackend. With DO NOTHING
+            bulk_create cannot tell inserted from ignored rows, so each batch counts
+            the rows sharing its first conflict column before and after the insert.
+        """
+        unique_columns = [model._meta.get_field(f).attname for f in unique_fields]
+        frame = _dedupe(frame, unique_columns)
+        if update_fields:
+            options = {'update_conflicts': True, 'unique_fields': unique_fields, 'update_fields': update_fields}
+        else:
+            options = {'ignore_conflicts': True}
+        manager = model.objects.using(self.using)
+        written = 0
+        # Build one batch of instances at a time so memory does not grow with the frame
+        with transaction.atomic(using=self.using):
+            for start in range(0, len(frame), self.batch_size):
+                batch = frame.iloc[start:start + self.batch_size]
+                records = batch.astype(object).where(batch.notna(), None).to_dict('records')
+                if update_fields:
+                    manager.bulk_create([model(**rec) for rec in records], **options)
+                    written += len(records)
+                    continue
+                keys = manager.filter(**{f'{unique_columns[0]}__in': batch[unique_columns[0]].unique().tolist()})
+                existing = keys.count()
+                manager.bulk_create([model(**rec) for rec in records], **options)
+                written += keys.count() - existing
+        return written
+
+
+class PostgresCopyBackend:
+    """Stream rows through COPY into a staging table and merge with INSERT ... ON CONFLICT"""
+
+    name = 'copy'
+
+    def __init__(self, using='default', batch_size=COPY_CHUNK_ROWS):
+        self.using = using
+        self.batch_size = batch_size
+
+    def _csv_chunks(self, model, frame):
+        """Render the frame as COPY CSV text, NULL written as \\N"""
+        frame = frame.copy()
+        for column in frame.columns:
+            if isinstance(model._meta.get_field(column), models.JSONField):
+                frame[column] = frame[column].map(json.dumps)
+        for start in range(0, len(frame), self.batch_size):
+            buffer = io.StringIO()
+            frame.iloc[start:start + self.batch_size].to_csv(buffer, index=False, header=False, na_rep='\\N')
+            buffer.seek(0)
+            yield buffer
+
+    def statements(self, model, columns, unique_fields, update_fields=None):
+        """
+        SQL for one write of `columns` (model attnames), in execution order.
+
+        Returns:
+            dict: 'create' (staging table), 'copy', 'merge' and 'drop' statements
+        """
+        meta = model._meta
+        quote = connections[self.using].ops.quote_name
+        table = quote(meta.db_table)
+        attname_columns = {f.attname: f.column for f in meta.concrete_fields}
+        column_list = ', '.join(quote(attname_columns[c]) for c in columns)
+        conflict = ', '.join(quote(meta.get_field(f).column) for f in unique_fields)
+        if update_fields:
+            assignments = ', '.join(
+                f"{quote(meta.get_field(f).column)} = EXCLUDED.{quote(meta.get_field(f).column)}"
+                for f in update_fields
+            )
+            on_conflict = f"ON CONFLICT ({conflict}) DO UPDATE SET {assignments}"
+        else:
+            on_conflict = f"ON CONFLICT ({conflict}) DO NOTHING"
+        staging = quote(f"stage_{meta.db_table}")
+        return {
+            'create': (
+                f"CREATE TEMPORARY TABLE {staging} ON COMMIT DROP AS "
+                f"SELECT {column_list} FROM {table} WITH NO DATA"
+            ),
+            'copy': f"COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            'merge': f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging} {on_conflict}",
+            # Drop now as well: ON COMMIT DROP never fires inside an outer transaction
+            'drop': f"DROP TABLE {staging}",
+        }
+
+    def write(self, model, frame, unique_fields, update_fields=None):
+        """Same arguments as OrmBackend.write; returns rows actually inserted or updated"""
+        frame = _dedupe(frame, [model._meta.get_field(f).attname for f in unique_fields])
+        sql = self.statements(model, list(frame.columns), unique_fields, update_fields)
+
+        with transaction.atomic(using=self.using), connections[self.using].cursor() as cursor:
+            cursor.execute(sql['create'])
+            for buffer in self._csv_chunks(model, frame):
+                cursor.copy_expert(sql['copy'], buffer)
+            cursor.execute(sql['merge'])
+            written = cursor.rowcount
+            cursor.execute(sql['drop'])
+        return written
+
+
+BACKENDS = {
+    OrmBackend.name: OrmBackend,
+    PostgresCopyBackend.name: PostgresCopyBackend,
+}
+
+
+def get_backend(name='auto', using='default', batch_size=None):
+    """
+    Pick a write backend.
+
+    'auto' uses COPY on PostgreSQL and the ORM everywhere else.
+    """
+    if name == 'auto':
+        name = 'copy' if connections[using].vendor == 'postgresql' else 'orm'
+    if name == 'copy' and connections[using].vendor != 'postgresql':
+        raise ValueError('The COPY backend requires PostgreSQL')
+    if name == 'orm' and batch_size:
+        return OrmBackend(using=using, batch_size=batch_size)
+    return BACKENDS[name](using=using)
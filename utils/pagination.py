@@ -0,0 +1,64 @@
+"""
+Keyset Pagination
+Cursor pagination over .values() querysets: each page continues strictly
+after the ordering values of the previous page's last row, so page N costs
+the same as page 1 (no OFFSET scan).
+
+Cursors are opaque URL-safe tokens wrapping the last row's ordering values.
+"""
+import base64
+import json
+
+from django.db.models import Q
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(',', ':')).encode()).decode().rstrip('=')
+
+
+def decode_cursor(token, length):
+    """
+    Raises:
+        ValueError: if the token is malformed or does not hold `length` values
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError('Invalid cursor') from e
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError('Invalid cursor')
+    return values
+
+
+def _after(ordering, values):
+    """Row-value comparison (a, b, c) > (x, y, z), expanded per field direction"""
+    condition = Q(pk__in=[])
+    equal = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        condition |= equal & Q(**{f'{name}__{lookup}': value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+def keyset_page(queryset, ordering, cursor=None, page_size=50):
+    """
+    One page of a .values() queryset.
+
+    Args:
+        ordering: Field names ('-' for descending); the last one must be unique
+            and every one must be among the selected values
+        cursor: Token from the previous page, or None for the first page
+
+    Returns:
+        (rows, next_cursor) - next_cursor is None on the last page
+    """
+    if cursor:
+        queryset = queryset.filter(_after(ordering, decode_cursor(cursor, len(ordering))))
+    rows = list(queryset.order_by(*ordering)[:page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+    last = rows[page_size - 1]
+    return rows[:page_size], encode_cursor([last[field.lstrip('-')] for field in ordering])
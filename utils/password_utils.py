@@ -2,7 +2,19 @@
 Password Utilities Module
 Provides secure password hashing and verification functions for all models
 """
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
 from django.contrib.auth.hashers import make_password, check_password
+from django.db.models import Q
+
+# Django hashes start with one of these algorithm prefixes
+HASHED_PREFIXES = ('pbkdf2_sha256$', 'pbkdf2_sha1$', 'argon2$', 'bcrypt$', 'bcrypt_sha256$', 'scrypt$',
+                   'crypt$', 'md5$', 'sha1$')
+
+# Below this many passwords a process pool costs more than it saves
+PARALLEL_HASH_THRESHOLD = 32
 
 def is_password_hashed(password_str):
     """
@@ -11,8 +23,20 @@ def is_password_hashed(password_str):
     """
     if not password_str:
         return False
-    hashed_prefixes = ('pbkdf2_sha256$', 'argon2$', 'bcrypt$', 'scrypt$', 'crypt$')
-    return password_str.startswith(hashed_prefixes)
+    return password_str.startswith(HASHED_PREFIXES)
+
+def unhashed_password_filter(field='passcode'):
+    """
+    The is_password_hashed() check as a queryset filter, so the database
+    returns only rows still holding a non-empty plain text password.
+
+    Usage:
+        >>> Student.objects.filter(unhashed_password_filter()).count()
+    """
+    condition = ~Q(**{field: ''}) & Q(**{f'{field}__isnull': False})
+    for prefix in HASHED_PREFIXES:
+        condition &= ~Q(**{f'{field}__startswith': prefix})
+    return condition
 
 def hash_password(password):
     """
@@ -63,3 +87,65 @@ def set_password(obj, plain_password):
     """
     obj.passcode = make_password(str(plain_password))
     return obj
+
+
+def _init_hash_worker(settings_module, hashers=None, pbkdf2_iterations=None):
+    """
+    Configure Django in pool workers started with the 'spawn' method.
+    `hashers` and `pbkdf2_iterations` carry the parent's PASSWORD_HASHERS and
+    PASSWORD_PBKDF2_ITERATIONS so overrides apply in workers too.
+    """
+    if settings_module:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    import django
+    django.setup()
+    if hashers:
+        settings.PASSWORD_HASHERS = hashers
+    if pbkdf2_iterations:
+        settings.PASSWORD_PBKDF2_ITERATIONS = pbkdf2_iterations
+
+
+def _hash_one(plain_password):
+    return make_password(str(plain_password))
+
+
+def default_hash_workers():
+    """Number of hashing processes: one per CPU core"""
+    return os.cpu_count() or 1
+
+
+def hash_passwords(plain_passwords, workers=None, chunksize=16):
+    """
+    Hash many plain text passwords, spreading make_password over a process pool.
+
+    Each item gets its own salt; results are returned in input order. Callers
+    that store the same credential in two places (User.password and the
+    profile passcode) should hash it once and reuse the result.
+
+    Args:
+        plain_passwords: Iterable of plain text passwords
+        workers: Process count (default: CPU cores); 1 hashes in-process
+
+    Returns:
+        list of hashed passwords
+
+    Usage:
+        >>> hashes = hash_passwords(['1234', 'abcd'])
+        >>> len(hashes)
+        2
+    """
+    plain_passwords = list(plain_passwords)
+    workers = workers or default_hash_workers()
+    if workers <= 1 or len(plain_passwords) < PARALLEL_HASH_THRESHOLD:
+        return [_hash_one(p) for p in plain_passwords]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_hash_worker,
+        initargs=(
+            os.environ.get('DJANGO_SETTINGS_MODULE'),
+            list(settings.PASSWORD_HASHERS),
+            getattr(settings, 'PASSWORD_PBKDF2_ITERATIONS', None),
+        ),
+    ) as pool:
+        return list(pool.map(_hash_one, plain_passwords, chunksize=chunksize))
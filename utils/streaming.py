@@ -0,0 +1,75 @@
+"""
+Streaming Response Helpers
+Send large result sets row by row instead of building them in memory first.
+"""
+import csv
+
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+
+
+def stream_json_list(rows, on_complete=None):
+    """
+    Stream an iterable of dicts as a JSON array.
+
+    Each item is rendered with DRF's JSONRenderer, so the body is byte-for-byte
+    what Response(list(rows)) would send, but only one row is held at a time.
+
+    Args:
+        rows: Iterable of JSON-serialisable items (e.g. a generator over .iterator())
+        on_complete: Optional callback(count) run after the last row is sent
+    """
+    renderer = JSONRenderer()
+
+    def body():
+        count = 0
+        yield b'['
+        for row in rows:
+            if count:
+                yield b','
+            yield renderer.render(row)
+            count += 1
+        yield b']'
+        if on_complete:
+            on_complete(count)
+
+    return StreamingHttpResponse(body(), content_type='application/json')
+
+
+def stream_ndjson(rows):
+    """Stream an iterable of dicts as newline-delimited JSON (one object per line)"""
+    renderer = JSONRenderer()
+
+    def body():
+        for row in rows:
+            yield renderer.render(row) + b'\n'
+
+    return StreamingHttpResponse(body(), content_type='application/x-ndjson')
+
+
+class _Echo:
+    """File-like object whose write() hands the formatted line back to csv.writer's caller"""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(header, rows, filename):
+    """
+    Stream an iterable of row sequences as a CSV attachment.
+
+    Args:
+        header: Column names written as the first line
+        rows: Iterable of sequences in header order
+        filename: Download name sent in Content-Disposition
+    """
+    writer = csv.writer(_Echo())
+
+    def body():
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow(row)
+
+    response = StreamingHttpResponse(body(), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
@@ -0,0 +1,271 @@
+"""
+Synthetic Dataset Generator
+Writes a complete, internally consistent set of academia CSV exports (the ten
+data files plus the attendance file) in the exact column layout that
+utils.data_loader reads, so loaders and APIs can be measured at any scale.
+
+Every table is built column-wise with NumPy; output is deterministic for a
+given seed.
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import ATTENDANCE_CLASS_COLUMNS, CSV_FILES
+
+BRANCH_CODES = ['CSE', 'ECE', 'EEE', 'MEC', 'CIV', 'IT', 'CHE', 'AIM']
+FIRST_NAMES = ['Aarav', 'Diya', 'Ishaan', 'Meera', 'Rohan', 'Sneha', 'Kabir', 'Ananya', 'Vikram', 'Priya']
+LAST_NAMES = ['Sharma', 'Reddy', 'Iyer', 'Patel', 'Khan', 'Das', 'Nair', 'Gupta', 'Rao', 'Singh']
+ADMISSION_MODES = ['EAMCET', 'ECET', 'Management', 'NRI']
+NOTIFICATION_TYPES = ['Exam', 'Assignment', 'Fee', 'Event', 'General']
+PRIORITIES = ['High', 'Medium', 'Low']
+DEFAULT_PASSCODE = '1234'
+
+
+class SyntheticSpec:
+    """Shape of a generated dataset"""
+
+    def __init__(self, students=1000, years=4, branches=4, sections=3, semesters=2,
+                 courses_per_semester=5, mids=2, notifications_per_section=3, seed=0):
+        if not 1 <= branches <= len(BRANCH_CODES):
+            raise ValueError(f'branches must be between 1 and {len(BRANCH_CODES)}')
+        if min(students, years, sections, semesters, courses_per_semester, mids) < 1:
+            raise ValueError('students, years, sections, semesters, courses and mids must be positive')
+        self.students = students
+        self.years = years
+        self.branches = branches
+        self.sections = sections
+        self.semesters = semesters
+        self.courses_per_semester = courses_per_semester
+        self.mids = mids
+        self.notifications_per_section = notifications_per_section
+        self.seed = seed
+
+    @property
+    def staff_id_base(self):
+        """First faculty id: above every student id, since User.user_id is unique across roles"""
+        return 10 ** len(str(self.students))
+
+    def course_ids(self, branch_index, semester):
+        code = BRANCH_CODES[branch_index]
+        return [f"{code}{semester}{k:02d}" for k in range(1, self.courses_per_semester + 1)]
+
+
+def _names(rng, n):
+    return (np.array(FIRST_NAMES)[rng.integers(0, len(FIRST_NAMES), n)],
+            np.array(LAST_NAMES)[rng.integers(0, len(LAST_NAMES), n)])
+
+
+def _students(spec, rng):
+    ids = np.arange(1, spec.students + 1)
+    # Round-robin over (year, branch, section) so every section is populated
+    slot = (ids - 1) % (spec.years * spec.branches * spec.sections)
+    first, last = _names(rng, spec.students)
+    return pd.DataFrame({
+        'student_id': ids,
+        'first_name': first,
+        'last_name': last,
+        'email': [f"student{i}@college.edu" for i in ids],
+        'gender': np.where(rng.random(spec.students) < 0.5, 'Male', 'Female'),
+        'year_id': slot // (spec.branches * spec.sections) + 1,
+        'branch_id': (slot // spec.sections) % spec.branches + 1,
+        'sec_id': slot % spec.sections + 1,
+        'roll_no': (ids - 1) // (spec.years * spec.branches * spec.sections) + 1,
+        'phone_no': 9000000000 + ids,
+        'ssc_marks': rng.uniform(55, 99, spec.students).round(1),
+        'inter_marks': rng.uniform(50, 98, spec.students).round(1),
+        'passcode': DEFAULT_PASSCODE,
+    })
+
+
+def _enrolments(spec, students):
+    """One row per (student, semester, course), with the course codes of the student's branch"""
+    per_student = spec.semesters * spec.courses_per_semester
+    rows = students.loc[students.index.repeat(per_student)].reset_index(drop=True)
+    offset = np.tile(np.arange(per_student), len(students))
+    rows['sem_id'] = offset // spec.courses_per_semester + 1
+    k = offset % spec.courses_per_semester + 1
+    codes = np.array(BRANCH_CODES)[rows['branch_id'].to_numpy() - 1]
+    rows['course_id'] = pd.Series(codes).str.cat([rows['sem_id'].astype(str), pd.Series(k).map('{:02d}'.format)])
+    return rows
+
+
+def _academics(enrolments, rng):
+    marks = rng.normal(68, 15, len(enrolments)).clip(0, 100).round().astype(int)
+    return pd.DataFrame({
+        'student_id': enrolments['student_id'],
+        'sem_id': enrolments['sem_id'],
+        'course_code': enrolments['course_id'],
+        'marks': marks,
+        'attendance': rng.uniform(55, 100, len(enrolments)).round(1),
+    })
+
+
+def _backlogs(academics):
+    failed = academics[academics['marks'] < 40]
+    return pd.DataFrame({
+        'student_id': failed['student_id'],
+        'sem_id': failed['sem_id'],
+        'course_id': failed['course_code'],
+    })
+
+
+def _fees(students, rng):
+    n = len(students)
+    total = rng.choice([85000, 100000, 120000, 150000], n)
+    paid = (total * rng.choice([0.25, 0.5, 0.75, 1.0], n)).astype(int)
+    return pd.DataFrame({
+        'student_id': students['student_id'],
+        'mode_of_admission': np.array(ADMISSION_MODES)[rng.integers(0, len(ADMISSION_MODES), n)],
+        'fee_total': total,
+        'paid_amount': paid,
+        'remaining_amount': total - paid,
+        'library_fine': rng.choice([0, 0, 0, 50, 100], n),
+        'equipment_fine': rng.choice([0, 0, 0, 0, 200], n),
+        'paid_crt_fee': rng.choice([0, 5000], n),
+    })
+
+
+def _faculty(spec, rng):
+    """One faculty member per (branch, semester, course slot)"""
+    count = spec.branches * spec.semesters * spec.courses_per_semester
+    ids = np.arange(1, count + 1) + spec.staff_id_base
+    first, last = _names(rng, count)
+    branch = (np.arange(count) // (spec.semesters * spec.courses_per_semester))
+    return pd.DataFrame({
+        'faculty_id': ids,
+        'first_name': first,
+        'last_name': last,
+        'email': [f"faculty{i}@college.edu" for i in ids],
+        'passcode': DEFAULT_PASSCODE,
+        'gender': np.where(rng.random(count) < 0.5, 'Male', 'Female'),
+        'department': np.array(BRANCH_CODES)[branch],
+        'designation': rng.choice(['Assistant Professor', 'Associate Professor', 'Professor'], count),
+        'qualifications': rng.choice(['M.Tech', 'PhD'], count),
+    })
+
+
+def _faculty_assignments(spec, faculty):
+    rows = []
+    faculty_ids = iter(faculty['faculty_id'])
+    for branch in range(spec.branches):
+        for semester in range(1, spec.semesters + 1):
+            for course in spec.course_ids(branch, semester):
+                faculty_id = next(faculty_ids)
+                for year in range(1, spec.years + 1):
+                    for section in range(1, spec.sections + 1):
+                        rows.append((faculty_id, year, branch + 1, section, course))
+    return pd.DataFrame(rows, columns=['faculty_id', 'year_id', 'branch_id', 'sec_id', 'course_id'])
+
+
+def _employees(prefix, domain, first_id, count, designations, rng):
+    ids = np.arange(first_id, first_id + count)
+    first, last = _names(rng, count)
+    return pd.DataFrame({
+        'emp_id': ids,
+        'first_name': first,
+        'last_name': last,
+        'email': [f"{prefix}{i}@{domain}" for i in ids],
+        'passcode': DEFAULT_PASSCODE,
+        'gender': np.where(rng.random(count) < 0.5, 'Male', 'Female'),
+        'designation': rng.choice(designations, count),
+    })
+
+
+def _notifications(spec, rng):
+    sections = [(y, b, s) for y in range(1, spec.years + 1)
+                for b in range(1, spec.branches + 1) for s in range(1, spec.sections + 1)]
+    rows = np.repeat(np.array(sections), spec.notifications_per_section, axis=0)
+    n = len(rows)
+    due = pd.Timestamp('2026-01-01') + pd.to_timedelta(rng.integers(0, 180, n), unit='D')
+    kinds = np.array(NOTIFICATION_TYPES)[rng.integers(0, len(NOTIFICATION_TYPES), n)]
+    return pd.DataFrame({
+        'year_id': rows[:, 0],
+        'branch_id': rows[:, 1],
+        'section_id': rows[:, 2],
+        'sem_id': rng.integers(1, spec.semesters + 1, n),
+        'student_id': 0,
+        'type_of_notification': kinds,
+        'title': [f"{kind} notice {i + 1}" for i, kind in enumerate(kinds)],
+        'description': 'Generated notification',
+        'due_date': due.strftime('%d-%m-%Y'),
+        'priority': np.array(PRIORITIES)[rng.integers(0, len(PRIORITIES), n)],
+    })
+
+
+def _exams(spec, enrolments, rng):
+    rows = enrolments.loc[enrolments.index.repeat(spec.mids)].reset_index(drop=True)
+    n = len(rows)
+    return pd.DataFrame({
+        'student_id': rows['student_id'],
+        'year_id': rows['year_id'],
+        'branch_id': rows['branch_id'],
+        'section_id': rows['sec_id'],
+        'sem_id': rows['sem_id'],
+        'mid_id': np.tile(np.arange(1, spec.mids + 1), len(enrolments)),
+        'course_id': rows['course_id'],
+        'mid_marks': rng.integers(5, 21, n),
+        'quiz_marks': rng.integers(0, 6, n),
+        'assignment_marks': rng.integers(2, 6, n),
+    })
+
+
+def _attendance(enrolments, rng):
+    """50 class columns per course: 1/0 for classes held so far, blank for the rest"""
+    n = len(enrolments)
+    slots = len(ATTENDANCE_CLASS_COLUMNS)
+    held = rng.integers(slots // 2, slots + 1, n)
+    rate = rng.uniform(0.55, 0.98, n)
+    marks = (rng.random((n, slots)) < rate[:, None]).astype(float)
+    marks[np.arange(slots)[None, :] >= held[:, None]] = np.nan
+    frame = pd.DataFrame({
+        'student_id': enrolments['student_id'],
+        'year_id': enrolments['year_id'],
+        'branch_id': enrolments['branch_id'],
+        'sec_id': enrolments['sec_id'],
+        'sem_id': enrolments['sem_id'],
+        'course_id': enrolments['course_id'],
+    })
+    classes = pd.DataFrame(marks, columns=ATTENDANCE_CLASS_COLUMNS).astype('Int64')
+    return pd.concat([frame, classes], axis=1)
+
+
+def generate_dataset(output_dir, spec=None):
+    """
+    Write all CSV exports for `spec` into output_dir.
+
+    Returns:
+        dict: table name -> number of rows written
+    """
+    spec = spec or SyntheticSpec()
+    rng = np.random.default_rng(spec.seed)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    students = _students(spec, rng)
+    enrolments = _enrolments(spec, students)
+    academics = _academics(enrolments, rng)
+    faculty = _faculty(spec, rng)
+    tpcell_base = int(faculty['faculty_id'].max()) + 1
+    tpcell_count = max(2, spec.branches)
+    tables = {
+        'students': students,
+        'academics': academics,
+        'backlogs': _backlogs(academics),
+        'fees': _fees(students, rng),
+        'faculty': faculty,
+        'faculty_assignments': _faculty_assignments(spec, faculty),
+        'tpcell': _employees('tpcell', 'tpcell.edu', tpcell_base, tpcell_count, ['Officer', 'Coordinator'], rng),
+        'management': _employees('admin', 'management.edu', tpcell_base + tpcell_count, 3,
+                                 ['Dean', 'Registrar', 'Principal'], rng),
+        'notifications': _notifications(spec, rng),
+        'exams': _exams(spec, enrolments, rng),
+        'attendance': _attendance(enrolments, rng),
+    }
+
+    counts = {}
+    for table, frame in tables.items():
+        frame.to_csv(output_dir / CSV_FILES[table], index=False)
+        counts[table] = len(frame)
+    return counts